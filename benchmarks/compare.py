@@ -0,0 +1,61 @@
+"""
+Compare two benchmark result files written by benchmarks.run.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 10]
+
+Prints p50/p95/p99 latency, query count and peak memory per scenario with
+the relative change. Exits with status 1 if any p95 latency or query count
+regressed by more than the threshold (in percent).
+"""
+import argparse
+import json
+import sys
+
+
+def change(old, new):
+    if not old:
+        return 0.0 if not new else float("inf")
+    return (new - old) / old * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.candidate) as handle:
+        candidate = json.load(handle)
+
+    print(f"baseline  {baseline['meta'].get('commit')} ({baseline['meta']['scale']})")
+    print(f"candidate {candidate['meta'].get('commit')} ({candidate['meta']['scale']})\n")
+    print(f"{'scenario':<22}{'p50 ms':>18}{'p95 ms':>18}{'p99 ms':>18}{'queries':>12}{'peak KiB':>22}")
+
+    regressions = []
+    for name, new in candidate["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            print(f"{name:<22} (new scenario)")
+            continue
+        cells = []
+        for key in ("p50", "p95", "p99"):
+            delta = change(old["latency_ms"][key], new["latency_ms"][key])
+            cells.append(f"{new['latency_ms'][key]:>9.2f} {delta:>+7.1f}%")
+        query_delta = change(old["queries"]["max"], new["queries"]["max"])
+        memory_delta = change(old["peak_memory_kb"], new["peak_memory_kb"])
+        print(f"{name:<22}{''.join(cells)}{new['queries']['max']:>5} {query_delta:>+5.0f}%"
+              f"{new['peak_memory_kb']:>13.1f} {memory_delta:>+7.1f}%")
+        if change(old["latency_ms"]["p95"], new["latency_ms"]["p95"]) > args.threshold or query_delta > args.threshold:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\nRegressions above {args.threshold}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Compare the sync DRF read endpoints with their async variants under
+concurrent load.
+
+Usage:
+    python -m benchmarks.concurrency [--scale small] [--concurrency 1 10 50 200]
+                                     [--requests 400] [--db-latency-ms 5]
+
+Requests are driven in-process through core.asgi.application on one event
+loop, the same way an ASGI server would call it, with up to `concurrency`
+requests in flight. `--db-latency-ms` adds a blocking sleep to every SQL
+statement to model a database reached over the network; SQLite on a local
+disk answers too fast for connection handling to matter. For every
+endpoint and concurrency level the throughput and p50/p95/p99 latency of
+the sync (/api/...) and async (/api/async/...) paths are reported.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from io import StringIO
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db.backends.signals import connection_created  # noqa: E402
+from benchmarks.datagen import SCALES, seed  # noqa: E402
+from benchmarks.run import percentile  # noqa: E402
+from benchmarks.scenarios import pick_fixtures  # noqa: E402
+from tasks_app.models import Task  # noqa: E402
+
+
+def add_db_latency(milliseconds):
+    """Sleep before every SQL statement of every (new) connection."""
+    def slow_query(execute, sql, params, many, context):
+        time.sleep(milliseconds / 1000)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        connection.execute_wrappers.append(slow_query)
+
+    connection_created.connect(install, weak=False)
+
+
+async def request(application, path, token):
+    """Issue one GET through the ASGI application and return its status code."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"authorization", f"Token {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    sent = False
+    status = []
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await application(scope, receive, send)
+    return status[0]
+
+
+async def load(application, path, token, concurrency, total):
+    """Run `total` requests with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, statuses = [], set()
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            statuses.add(await request(application, path, token))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    return {
+        "statuses": sorted(statuses),
+        "requests_per_second": round(total / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "p99": round(percentile(latencies, 0.99), 3),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--requests", type=int, default=400, help="Requests per endpoint and level.")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    database = settings.DATABASES["default"]["NAME"]
+    if os.path.exists(database):
+        os.remove(database)
+    call_command("migrate", verbosity=0)
+    seed(SCALES[args.scale], stdout=StringIO())
+
+    _, client, board = pick_fixtures()
+    token = client.token_key
+    task = Task.objects.filter(board=board, comments_count__gt=0).order_by("pk").first()
+    endpoints = {
+        "tasks_assigned": "tasks/assigned-to-me/",
+        "tasks_reviewing": "tasks/reviewing/",
+        "board_detail": f"boards/{board.pk}/",
+        "comments_list": f"tasks/{task.pk}/comments/",
+    }
+    if args.db_latency_ms:
+        add_db_latency(args.db_latency_ms)
+
+    from core.asgi import application
+
+    async def run_all():
+        results = {}
+        for name, path in endpoints.items():
+            results[name] = {}
+            for concurrency in args.concurrency:
+                level = {}
+                for mode, prefix in (("sync", "/api/"), ("async", "/api/async/")):
+                    level[mode] = await load(application, prefix + path, token, concurrency, args.requests)
+                results[name][concurrency] = level
+                print(f"{name:<16} c={concurrency:<4} "
+                      f"sync {level['sync']['requests_per_second']:>8.1f} req/s "
+                      f"p95 {level['sync']['latency_ms']['p95']:>9.2f} ms   "
+                      f"async {level['async']['requests_per_second']:>8.1f} req/s "
+                      f"p95 {level['async']['latency_ms']['p95']:>9.2f} ms", file=sys.stderr)
+        return results
+
+    report = {
+        "meta": {"scale": args.scale, "requests": args.requests, "db_latency_ms": args.db_latency_ms},
+        "endpoints": asyncio.run(run_all()),
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
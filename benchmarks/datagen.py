@@ -0,0 +1,131 @@
+"""
+Synthetic data generator for benchmarks.
+
+All rows are written with bulk_create in fixed-size chunks, so seeding
+millions of tasks keeps memory flat. The generator is deterministic for a
+given seed.
+"""
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import transaction
+from boards_app.models import Board
+from tasks_app.models import Comment, Task
+
+CHUNK_SIZE = 10_000
+PASSWORD = "benchmark-password"
+
+
+@dataclass
+class Scale:
+    users: int = 50
+    boards: int = 20
+    members_per_board: int = 5
+    tasks: int = 2_000
+    comments: int = 5_000
+
+
+SCALES = {
+    "tiny": Scale(users=10, boards=4, members_per_board=3, tasks=200, comments=400),
+    "small": Scale(),
+    "medium": Scale(users=500, boards=200, members_per_board=10, tasks=100_000, comments=200_000),
+    "large": Scale(users=5_000, boards=2_000, members_per_board=20, tasks=1_000_000, comments=2_000_000),
+}
+
+
+def _chunks(total):
+    for start in range(0, total, CHUNK_SIZE):
+        yield start, min(CHUNK_SIZE, total - start)
+
+
+def _ids(model):
+    return list(model.objects.order_by("pk").values_list("pk", flat=True))
+
+
+def seed(scale, rng_seed=0, stdout=None):
+    """
+    Populate the database with users, boards, memberships, tasks and comments
+    according to `scale` and return a dict with the created row counts.
+
+    Every user gets the password PASSWORD and the email user<N>@bench.local.
+    """
+    rng = random.Random(rng_seed)
+    log = stdout.write if stdout else (lambda message: None)
+    password = make_password(PASSWORD)
+    today = date.today()
+
+    with transaction.atomic():
+        for start, size in _chunks(scale.users):
+            User.objects.bulk_create(
+                User(username=f"user{n}@bench.local", email=f"user{n}@bench.local",
+                     first_name=f"User {n}", password=password)
+                for n in range(start, start + size)
+            )
+        user_ids = _ids(User)
+        log(f"users: {len(user_ids)}\n")
+
+        for start, size in _chunks(scale.boards):
+            Board.objects.bulk_create(
+                Board(title=f"Board {n}", owner_id=rng.choice(user_ids))
+                for n in range(start, start + size)
+            )
+        boards = list(Board.objects.values_list("pk", "owner_id"))
+        log(f"boards: {len(boards)}\n")
+
+        Membership = Board.members.through
+        board_members = {}
+        memberships = []
+        for board_id, owner_id in boards:
+            members = {owner_id, *rng.sample(user_ids, min(scale.members_per_board, len(user_ids)))}
+            board_members[board_id] = list(members)
+            memberships.extend(Membership(board_id=board_id, user_id=user_id) for user_id in members)
+        Membership.objects.bulk_create(memberships, batch_size=CHUNK_SIZE)
+        log(f"memberships: {len(memberships)}\n")
+
+        statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+        priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+        board_ids = list(board_members)
+        for start, size in _chunks(scale.tasks):
+            tasks = []
+            for n in range(start, start + size):
+                board_id = rng.choice(board_ids)
+                members = board_members[board_id]
+                tasks.append(Task(
+                    board_id=board_id,
+                    title=f"Task {n}",
+                    description=f"Description of task {n}",
+                    status=rng.choice(statuses),
+                    priority=rng.choice(priorities),
+                    assignee_id=rng.choice(members),
+                    reviewer_id=rng.choice(members),
+                    due_date=today + timedelta(days=rng.randint(-30, 60)),
+                ))
+            Task.objects.bulk_create(tasks)
+        log(f"tasks: {scale.tasks}\n")
+
+        if scale.comments and scale.tasks:
+            task_ids = _ids(Task)
+            for start, size in _chunks(scale.comments):
+                Comment.objects.bulk_create(
+                    Comment(task_id=rng.choice(task_ids), author_id=rng.choice(user_ids), content=f"Comment {n}")
+                    for n in range(start, start + size)
+                )
+            call_command("sync_comments_count", stdout=StringIO())
+            log(f"comments: {scale.comments}\n")
+
+        # bulk_create bypasses the write hooks of the derived data.
+        call_command("rebuild_task_search", stdout=StringIO())
+        call_command("rebuild_board_stats", stdout=StringIO())
+
+    return {
+        "users": scale.users,
+        "boards": scale.boards,
+        "memberships": len(memberships),
+        "tasks": scale.tasks,
+        "comments": scale.comments,
+    }
@@ -0,0 +1,141 @@
+"""
+Compare query plans and timings of the hot task, comment and board filters
+with and without the composite indexes of the task and comment models
+(added by tasks_app migration 0008 and later ones).
+
+Usage:
+    python -m benchmarks.index_plans [--tasks 1000000] [--repeat 20]
+
+The database is created from scratch at KANMIND_BENCHMARK_DB (see
+benchmarks.settings) with all migrations applied. The composite indexes are
+dropped with SQL to measure the "before" plans and recreated from their
+stored definitions to measure the "after" plans on the same data, so the
+schema stays at the latest migration.
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from io import StringIO
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.models import Q  # noqa: E402
+from boards_app.models import Board  # noqa: E402
+from tasks_app.models import Comment, Task  # noqa: E402
+from benchmarks.datagen import Scale, seed  # noqa: E402
+
+INDEXED_MODELS = (Task, Comment)
+
+
+def build_queries(user_id, board_id, task_id):
+    """Return the benchmarked querysets, mirroring what the API views run."""
+    memberships = Board.members.through.objects.filter(user_id=user_id).values("board_id")
+    return {
+        "tasks_assigned": Task.objects.filter(assignee_id=user_id).order_by("due_date", "id")[:50],
+        "tasks_reviewing": Task.objects.filter(reviewer_id=user_id).order_by("due_date", "id")[:50],
+        "board_tasks_by_status": Task.objects.filter(board_id=board_id, status="to-do"),
+        "board_tasks_by_priority": Task.objects.filter(board_id=board_id, priority="high"),
+        "task_comments": Comment.objects.filter(task_id=task_id).order_by("created_at", "id")[:50],
+        "user_boards": Board.objects.filter(Q(owner_id=user_id) | Q(pk__in=memberships)),
+    }
+
+
+def measure(queries, repeat):
+    results = {}
+    for name, queryset in queries.items():
+        plan = queryset.explain()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = {"plan": plan, "median_ms": round(statistics.median(timings), 3)}
+    return results
+
+
+def analyze():
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def drop_indexes():
+    """Drop the composite indexes of INDEXED_MODELS and return their CREATE statements."""
+    names = [index.name for model in INDEXED_MODELS for index in model._meta.indexes]
+    with connection.cursor() as cursor:
+        placeholders = ", ".join(["%s"] * len(names))
+        cursor.execute(f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND name IN ({placeholders})", names)
+        statements = cursor.fetchall()
+        for name, _ in statements:
+            cursor.execute(f'DROP INDEX "{name}"')
+    return [sql for _, sql in statements]
+
+
+def create_indexes(statements):
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def compare(queries, repeat):
+    """Measure `queries` without and with the composite indexes; returns (before, after)."""
+    statements = drop_indexes()
+    try:
+        analyze()
+        before = measure(queries, repeat)
+    finally:
+        create_indexes(statements)
+    analyze()
+    return before, measure(queries, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    database = settings.DATABASES["default"]["NAME"]
+    if os.path.exists(database):
+        os.remove(database)
+    call_command("migrate", verbosity=0)
+
+    scale = Scale(
+        users=max(args.tasks // 200, 10),
+        boards=max(args.tasks // 500, 4),
+        members_per_board=10,
+        tasks=args.tasks,
+        comments=args.tasks,
+    )
+    print(f"Seeding {scale} into {database}")
+    seed(scale, stdout=StringIO())
+
+    user_id = Task.objects.values_list("assignee_id", flat=True).first()
+    board_id = Task.objects.values_list("board_id", flat=True).first()
+    task_id = Comment.objects.values_list("task_id", flat=True).first()
+    queries = build_queries(user_id, board_id, task_id)
+
+    before, after = compare(queries, args.repeat)
+
+    report = {"scale": scale.__dict__, "before": before, "after": after}
+    for name in queries:
+        print(f"\n== {name}: {before[name]['median_ms']} ms -> {after[name]['median_ms']} ms")
+        print(f"before:\n{before[name]['plan']}")
+        print(f"after:\n{after[name]['plan']}")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Run latency, query count and memory benchmarks against every API endpoint.
+
+Usage:
+    python -m benchmarks.run [--scale small] [--iterations 50]
+                             [--scenario NAME ...] [--output results.json]
+
+A fresh database is created at KANMIND_BENCHMARK_DB and seeded with the
+synthetic data of the chosen scale (see benchmarks.datagen.SCALES). Every
+scenario issues real requests through the full Django/DRF stack and
+records p50/p95/p99 latency, queries per request and peak Python memory.
+Compare two result files with `python -m benchmarks.compare`.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from io import StringIO
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from benchmarks.datagen import SCALES, seed  # noqa: E402
+from benchmarks.scenarios import build_scenarios  # noqa: E402
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def run_scenario(scenario, iterations):
+    latencies, queries, statuses = [], [], set()
+    for _ in range(iterations):
+        request = scenario.prepare()
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = request()
+            latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(len(captured.captured_queries))
+        statuses.add(response.status_code)
+
+    request = scenario.prepare()
+    tracemalloc.start()
+    response = request()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "method": scenario.method,
+        "path": scenario.path,
+        "statuses": sorted(statuses),
+        "response_bytes": len(response.content),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "p99": round(percentile(latencies, 0.99), 3),
+            "mean": round(sum(latencies) / len(latencies), 3),
+        },
+        "queries": {"min": min(queries), "max": max(queries)},
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--scenario", action="append", help="Only run the named scenario (repeatable).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    database = settings.DATABASES["default"]["NAME"]
+    if os.path.exists(database):
+        os.remove(database)
+    call_command("migrate", verbosity=0)
+    counts = seed(SCALES[args.scale], rng_seed=args.seed, stdout=StringIO())
+
+    scenarios = build_scenarios()
+    if args.scenario:
+        unknown = set(args.scenario) - {scenario.name for scenario in scenarios}
+        if unknown:
+            parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+        scenarios = [scenario for scenario in scenarios if scenario.name in args.scenario]
+
+    results = {}
+    for scenario in scenarios:
+        results[scenario.name] = run_scenario(scenario, args.iterations)
+        latency = results[scenario.name]["latency_ms"]
+        queries = results[scenario.name]["queries"]
+        print(f"{scenario.name:<22} p50 {latency['p50']:>8.2f} ms  p95 {latency['p95']:>8.2f} ms  "
+              f"p99 {latency['p99']:>8.2f} ms  queries {queries['max']:>4}  "
+              f"peak {results[scenario.name]['peak_memory_kb']:>9.1f} KiB", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "scale": args.scale,
+            "rows": counts,
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+        },
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark scenarios, one per API endpoint.
+
+Each scenario prepares its preconditions (e.g. the board to delete) outside
+of the measured section and returns a callable performing exactly one
+request through the Django test client.
+"""
+from dataclasses import dataclass
+from datetime import date
+from itertools import count
+from typing import Callable
+
+from django.contrib.auth.models import User
+from django.db.models import Count
+from rest_framework.test import APIClient
+from boards_app.models import Board
+from tasks_app.models import Comment, Task
+from user_auth_app.models import AuthToken
+from benchmarks.datagen import PASSWORD
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    prepare: Callable[[], Callable]
+
+
+def pick_fixtures():
+    """
+    Return the user with the most assigned tasks, an authenticated client for
+    that user and the largest board the user is a member of. The client's
+    token key is available as `client.token_key`.
+    """
+    user = User.objects.annotate(tasks=Count("assigned_tasks")).order_by("-tasks", "pk").first()
+    board = (
+        Board.objects.filter(members=user)
+        .annotate(size=Count("tasks"))
+        .order_by("-size", "pk")
+        .first()
+    )
+    token = AuthToken.objects.issue(user)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+    client.token_key = token.key
+    return user, client, board
+
+
+def build_scenarios():
+    user, client, board = pick_fixtures()
+    anonymous = APIClient()
+    task = Task.objects.filter(board=board).annotate(size=Count("comments")).order_by("-size", "pk").first()
+    sequence = count()
+
+    def new_task(**extra):
+        return Task.objects.create(board=board, title="Benchmark task", due_date=date.today(), **extra)
+
+    def new_task_payload():
+        return {"board": board.pk, "title": "Benchmark task", "due_date": date.today().isoformat(),
+                "assignee_id": user.pk, "reviewer_id": user.pk}
+
+    def static(method, path, data=None, api=client):
+        def prepare():
+            return lambda: getattr(api, method.lower())(path, data, format="json")
+        return prepare
+
+    def signup():
+        number = next(sequence)
+        data = {"fullname": "Benchmark User", "email": f"signup{number}@bench.local",
+                "password": PASSWORD, "repeated_password": PASSWORD}
+        return lambda: anonymous.post("/api/registration/", data, format="json")
+
+    def delete_board():
+        target = Board.objects.create(title="Disposable", owner=user)
+        target.members.add(user)
+        return lambda: client.delete(f"/api/boards/{target.pk}/")
+
+    def delete_task():
+        target = new_task()
+        return lambda: client.delete(f"/api/tasks/{target.pk}/")
+
+    def delete_comment():
+        target = Comment.objects.create(task=task, author=user, content="Disposable")
+        return lambda: client.delete(f"/api/tasks/{task.pk}/comments/{target.pk}/")
+
+    def bulk_tasks():
+        operations = [{"action": "create", "data": new_task_payload()} for _ in range(50)]
+        return lambda: client.post("/api/tasks/bulk/", {"operations": operations}, format="json")
+
+    return [
+        Scenario("signup", "POST", "/api/registration/", signup),
+        Scenario("login", "POST", "/api/login/",
+                 static("POST", "/api/login/", {"email": user.email, "password": PASSWORD}, api=anonymous)),
+        Scenario("email_check", "GET", "/api/email-check/",
+                 static("GET", "/api/email-check/", {"email": user.email})),
+        Scenario("boards_list", "GET", "/api/boards/", static("GET", "/api/boards/")),
+        Scenario("boards_create", "POST", "/api/boards/",
+                 static("POST", "/api/boards/", {"title": "Benchmark board", "members": [user.pk]})),
+        Scenario("board_detail", "GET", "/api/boards/<pk>/", static("GET", f"/api/boards/{board.pk}/")),
+        Scenario("board_update", "PATCH", "/api/boards/<pk>/",
+                 static("PATCH", f"/api/boards/{board.pk}/", {"title": board.title})),
+        Scenario("board_delete", "DELETE", "/api/boards/<pk>/", delete_board),
+        Scenario("task_create", "POST", "/api/tasks/", lambda: (lambda: client.post(
+            "/api/tasks/", new_task_payload(), format="json"))),
+        Scenario("tasks_bulk", "POST", "/api/tasks/bulk/", bulk_tasks),
+        Scenario("task_detail", "GET", "/api/tasks/<pk>/", static("GET", f"/api/tasks/{task.pk}/")),
+        Scenario("task_update", "PATCH", "/api/tasks/<pk>/",
+                 static("PATCH", f"/api/tasks/{task.pk}/", {"title": task.title})),
+        Scenario("task_delete", "DELETE", "/api/tasks/<pk>/", delete_task),
+        Scenario("tasks_assigned", "GET", "/api/tasks/assigned-to-me/", static("GET", "/api/tasks/assigned-to-me/")),
+        Scenario("tasks_reviewing", "GET", "/api/tasks/reviewing/", static("GET", "/api/tasks/reviewing/")),
+        Scenario("comments_list", "GET", "/api/tasks/<id>/comments/",
+                 static("GET", f"/api/tasks/{task.pk}/comments/")),
+        Scenario("comment_create", "POST", "/api/tasks/<id>/comments/",
+                 static("POST", f"/api/tasks/{task.pk}/comments/", {"content": "Benchmark comment"})),
+        Scenario("comment_delete", "DELETE", "/api/tasks/<id>/comments/<pk>/", delete_comment),
+    ]
@@ -0,0 +1,31 @@
+"""
+Django settings for the benchmark suite.
+
+Reuses the project settings but points the database at a separate SQLite
+file (KANMIND_BENCHMARK_DB, defaults to the temp directory) so benchmarks
+never touch development data.
+"""
+import os
+import tempfile
+
+from core.settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get(
+            'KANMIND_BENCHMARK_DB',
+            os.path.join(tempfile.gettempdir(), 'kanmind_benchmark.sqlite3'),
+        ),
+    }
+}
+
+ALLOWED_HOSTS = ['testserver', 'localhost', '127.0.0.1']
+
+# Benchmarks hammer login and registration from one client.
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,  # noqa: F405
+    'DEFAULT_THROTTLE_RATES': {'login': None, 'registration': None},
+}
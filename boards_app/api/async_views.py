@@ -0,0 +1,42 @@
+from asgiref.sync import sync_to_async
+from django.db.models import aprefetch_related_objects
+from django.http import JsonResponse
+from rest_framework.exceptions import NotFound, PermissionDenied
+from boards_app.membership import is_board_owner_or_member
+from boards_app.models import Board
+from core.async_views import AsyncAPIView
+from core.conditional import ConditionalGetMixin
+from core.fieldsets import get_fieldset
+from .serializers import SingleBoardSerializer
+
+
+class AsyncBoardDetailView(ConditionalGetMixin, AsyncAPIView):
+    """
+    Async variant of GET on BoardDetailView.
+
+    Permissions:
+    - Only authenticated users who are the board owner or a member can access.
+
+    Methods:
+    - GET: Retrieve the detailed data of the board. Supports conditional
+      requests via ETag / Last-Modified; unchanged boards answer 304.
+      Supports sparse fieldsets via `fields` and `expand` (see core.fieldsets).
+    """
+    etag_prefix = "board"
+
+    async def get(self, request, pk):
+        fieldset = get_fieldset(request, SingleBoardSerializer)
+        try:
+            board = await Board.objects.aget(pk=pk)
+        except Board.DoesNotExist:
+            raise NotFound("Board not found.")
+        if not await sync_to_async(is_board_owner_or_member)(request, board):
+            raise PermissionDenied()
+
+        validators = self.get_validators(board)
+        not_modified = self.not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
+        await aprefetch_related_objects([board], *SingleBoardSerializer.get_prefetch_lookups(fieldset))
+        return self.set_validators(JsonResponse(SingleBoardSerializer(board, fieldset=fieldset).data), validators)
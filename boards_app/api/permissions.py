@@ -1,4 +1,5 @@
 from rest_framework import permissions
+from boards_app.membership import is_board_owner_or_member
 
 
 class IsBoardOwnerOrMember(permissions.BasePermission):
@@ -12,7 +13,4 @@ class IsBoardOwnerOrMember(permissions.BasePermission):
         Check if the requesting user is either the owner of the board
         or a member of the board.
         """
-        return (
-            obj.owner == request.user or
-            request.user in obj.members.all()
-        )
\ No newline at end of file
+        return is_board_owner_or_member(request, obj)
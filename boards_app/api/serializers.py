@@ -1,15 +1,20 @@
 from django.contrib.auth.models import User
+from django.db.models import Count, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 from boards_app.models import Board
+from core.fieldsets import SparseFieldsetMixin
+from tasks_app.models import Task
 from tasks_app.api.serializers import TaskDetailSerializer
 from user_auth_app.api.serializers import UserSerializer
 
 
-class BoardSerializer(serializers.ModelSerializer):
+class BoardSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Board model.
     Used for creating and updating boards, includes member management
-    and several computed count fields.
+    and several computed count fields. Supports sparse fieldsets (see
+    core.fieldsets).
     """
     member_count = serializers.SerializerMethodField()
     ticket_count = serializers.SerializerMethodField()
@@ -42,21 +47,58 @@ class BoardSerializer(serializers.ModelSerializer):
             "owner"
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset, fieldset=None):
+        """
+        Annotate the board queryset with all count fields so that a list
+        of boards is serialized without any per-board queries.
+
+        Members are counted with a subquery on the membership table and tasks
+        with conditional aggregates, so the member and task joins never
+        multiply each other. With a fieldset only the selected counts are
+        computed, and the task join is skipped if no task count is selected.
+        """
+        memberships = (
+            Board.members.through.objects
+            .filter(board_id=OuterRef("pk"))
+            .order_by()
+            .values("board_id")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        counts = {
+            "member_count": Coalesce(Subquery(memberships), 0),
+            "ticket_count": Count("tasks"),
+            "tasks_to_do_count": Count("tasks", filter=Q(tasks__status="to-do")),
+            "tasks_high_prio_count": Count("tasks", filter=Q(tasks__priority="high")),
+        }
+        if fieldset is not None:
+            counts = {name: count for name, count in counts.items() if fieldset.includes(name)}
+        return queryset.annotate(**counts)
+
     def get_member_count(self, obj):
         """Return the number of members in the board."""
+        if hasattr(obj, "member_count"):
+            return obj.member_count
         return obj.members.count()
 
     def get_ticket_count(self, obj):
-        """Return the number of tickets in the board (currently returns 0)."""
-        return 0
+        """Return the number of tickets in the board."""
+        if hasattr(obj, "ticket_count"):
+            return obj.ticket_count
+        return obj.tasks.count()
 
     def get_tasks_to_do_count(self, obj):
-        """Return the number of tasks to do in the board (currently returns 0)."""
-        return 0
+        """Return the number of tasks to do in the board."""
+        if hasattr(obj, "tasks_to_do_count"):
+            return obj.tasks_to_do_count
+        return obj.tasks.filter(status="to-do").count()
 
     def get_tasks_high_prio_count(self, obj):
-        """Return the number of high priority tasks in the board (currently returns 0)."""
-        return 0
+        """Return the number of high priority tasks in the board."""
+        if hasattr(obj, "tasks_high_prio_count"):
+            return obj.tasks_high_prio_count
+        return obj.tasks.filter(priority="high").count()
     
     def create(self, validated_data):
         """
@@ -72,19 +114,54 @@ class BoardSerializer(serializers.ModelSerializer):
         return board
     
 
-class SingleBoardSerializer(serializers.ModelSerializer):
+class SingleBoardSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for detailed board view.
     Includes nested serializers for members and tasks (read-only).
+    Supports sparse fieldsets (see core.fieldsets); members and tasks are
+    expandable.
     """
     members = UserSerializer(many=True, read_only=True)
     tasks = TaskDetailSerializer(many=True, read_only=True)
-    
+    expandable_fields = {
+        "members": (UserSerializer, {"many": True}),
+        "tasks": (TaskDetailSerializer, {"many": True}),
+    }
+
 
     class Meta:
         model = Board
         fields = ["id", "title", "owner_id", "members", "tasks"]
 
+    @staticmethod
+    def get_prefetch_lookups(fieldset=None):
+        """
+        Return the lookups prefetching members and tasks (with their users)
+        so a board renders in a fixed number of queries regardless of size.
+
+        With a fieldset unselected relations are not prefetched, and compact
+        (not expanded) ones only load their primary keys.
+        """
+        if fieldset is None:
+            tasks = TaskDetailSerializer.setup_eager_loading(Task.objects.order_by("pk"))
+            return ["members", Prefetch("tasks", queryset=tasks)]
+        lookups = []
+        if fieldset.includes("members"):
+            members = User.objects.order_by("pk")
+            lookups.append(Prefetch("members", queryset=members if fieldset.expands("members") else members.only("pk")))
+        if fieldset.includes("tasks"):
+            tasks = Task.objects.order_by("pk")
+            if fieldset.expands("tasks"):
+                tasks = TaskDetailSerializer.setup_eager_loading(tasks, fieldset.child("tasks"))
+            else:
+                tasks = tasks.only("pk", "board")
+            lookups.append(Prefetch("tasks", queryset=tasks))
+        return lookups
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fieldset=None):
+        return queryset.prefetch_related(*cls.get_prefetch_lookups(fieldset))
+
 
 
 class BoardUpdateSerializer(serializers.ModelSerializer):
@@ -1,14 +1,19 @@
 from django.urls import path
-from .views import BoardCreateView, BoardDetailView
+from .async_views import AsyncBoardDetailView
+from .views import BoardCreateView, BoardDetailView, BoardChangesView, BoardExportView, BoardImportView, BoardStatsView
 
 
 
 urlpatterns = [
     path('boards/', BoardCreateView.as_view(), name='board-list-create'),
     path('boards/<int:pk>/', BoardDetailView.as_view(), name='board-detail'),
+    path('boards/<int:pk>/changes/', BoardChangesView.as_view(), name='board-changes'),
+    path('boards/<int:pk>/stats/', BoardStatsView.as_view(), name='board-stats'),
+    path('boards/<int:pk>/export/', BoardExportView.as_view(), name='board-export'),
+    path('boards/<int:pk>/import/', BoardImportView.as_view(), name='board-import'),
 ]
 
-
-
-
-
+# Async variants of the read paths, mounted under api/async/ (see core.urls).
+async_urlpatterns = [
+    path('boards/<int:pk>/', AsyncBoardDetailView.as_view(), name='async-board-detail'),
+]
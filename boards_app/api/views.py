@@ -1,13 +1,23 @@
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import Q, prefetch_related_objects
 from rest_framework import generics, permissions, status
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from boards_app.models import Board
+from boards_app.export import export_board
+from boards_app.importer import PARSERS, BoardImport, ImportFormatError
+from boards_app.models import Board, BoardChange
+from core.conditional import ConditionalGetMixin
+from core.fieldsets import SparseFieldsetViewMixin, get_fieldset
+from core.streaming import streaming_response
+from tasks_app.api.serializers import CommentCreateSerielizer, TaskDetailSerializer
+from tasks_app.models import Comment
+from tasks_app.stats import get_board_stats
+from user_auth_app.api.serializers import UserSerializer
 from .permissions import IsBoardOwnerOrMember
 from .serializers import BoardSerializer, SingleBoardSerializer, BoardUpdateSerializer
 
-class BoardCreateView(generics.ListCreateAPIView):
+class BoardCreateView(SparseFieldsetViewMixin, generics.ListCreateAPIView):
     """
     API view to list all boards the authenticated user owns or is a member of,
     and to create new boards.
@@ -17,20 +27,30 @@ class BoardCreateView(generics.ListCreateAPIView):
 
     Methods:
     - GET: Returns a list of boards filtered by ownership or membership.
+      Supports sparse fieldsets via `fields` (see core.fieldsets).
     - POST: Creates a new board with the authenticated user as the owner.
     """
     serializer_class = BoardSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
+        """
+        Return the boards of the user annotated with their counts.
+
+        Memberships are matched through a subquery on the membership table
+        instead of a join, so the filter does not distort the member and task
+        counts and both branches of the OR can use their own index.
+        """
         user = self.request.user
-        return Board.objects.filter(Q(owner=user) | Q(members=user)).distinct()
+        memberships = Board.members.through.objects.filter(user=user).values("board_id")
+        queryset = Board.objects.filter(Q(owner=user) | Q(pk__in=memberships)).order_by("pk")
+        return BoardSerializer.setup_eager_loading(queryset, self.get_fieldset())
 
     def perform_create(self, serializer):
         serializer.save()
 
 
-class BoardDetailView(APIView):
+class BoardDetailView(ConditionalGetMixin, APIView):
     """
     API view to retrieve, update (partial), or delete a specific board.
 
@@ -38,29 +58,42 @@ class BoardDetailView(APIView):
     - Only authenticated users who are the board owner or a member can access.
     
     Methods:
-    - GET: Retrieve the detailed data of the board.
+    - GET: Retrieve the detailed data of the board. Supports conditional
+      requests via ETag / Last-Modified; unchanged boards answer 304.
+      Supports sparse fieldsets via `fields` and `expand` (see core.fieldsets).
     - PATCH: Partially update the board data.
     - DELETE: Delete the board.
     """
 
     permission_classes = [permissions.IsAuthenticated, IsBoardOwnerOrMember]
+    etag_prefix = "board"
 
-    def get_object_and_check_permissions(self, pk):
+    def get_object_and_check_permissions(self, pk, queryset=None):
         """
         Retrieve the Board object by primary key and check object-level permissions.
+        An optional queryset allows callers to eager load related data.
         Raises NotFound if board does not exist.
         """
+        if queryset is None:
+            queryset = Board.objects.all()
         try:
-            board = Board.objects.get(pk=pk)
+            board = queryset.get(pk=pk)
         except Board.DoesNotExist:
             raise NotFound("Board not found.")
         self.check_object_permissions(self.request, board)
         return board
 
     def get(self, request, pk):
+        fieldset = get_fieldset(request, SingleBoardSerializer)
         board = self.get_object_and_check_permissions(pk)
-        serializer = SingleBoardSerializer(board)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        validators = self.get_validators(board)
+        not_modified = self.not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
+        prefetch_related_objects([board], *SingleBoardSerializer.get_prefetch_lookups(fieldset))
+        serializer = SingleBoardSerializer(board, fieldset=fieldset)
+        return self.set_validators(Response(serializer.data, status=status.HTTP_200_OK), validators)
 
     def patch(self, request, pk):
         board = self.get_object_and_check_permissions(pk)
@@ -73,4 +106,202 @@ class BoardDetailView(APIView):
     def delete(self, request, pk):
         board = self.get_object_and_check_permissions(pk)
         board.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+class BoardStatsView(APIView):
+    """
+    API view returning the dashboard statistics of a board.
+
+    Permissions:
+    - Only authenticated users who are the board owner or a member can access.
+
+    Methods:
+    - GET ?days=<n>: Returns task counts per status, priority and assignee,
+      the number of overdue open tasks and the comments per day of the last
+      `days` days (default BOARD_STATS_DAYS). The numbers are read from the
+      materialized BoardStat counters, see tasks_app.stats.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk):
+        board = Board.objects.filter(pk=pk).only("pk", "owner_id").first()
+        if board is None:
+            raise NotFound("Board not found.")
+        self.check_object_permissions(request, board)
+
+        max_days = getattr(settings, "BOARD_STATS_MAX_DAYS", 365)
+        try:
+            days = int(request.query_params.get("days", getattr(settings, "BOARD_STATS_DAYS", 30)))
+        except ValueError:
+            days = 0
+        if not 1 <= days <= max_days:
+            raise ValidationError({"days": f"Must be an integer between 1 and {max_days}."})
+        return Response(get_board_stats(board.pk, days))
+
+
+class BoardExportView(APIView):
+    """
+    API view streaming a complete board export.
+
+    Permissions:
+    - Only authenticated users who are the board owner or a member can access.
+
+    Methods:
+    - GET: Streams the board, its members, tasks and comments as NDJSON
+      (one JSON object per line, see boards_app.export) with constant
+      memory use regardless of the board size.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk):
+        try:
+            board = Board.objects.get(pk=pk)
+        except Board.DoesNotExist:
+            raise NotFound("Board not found.")
+        self.check_object_permissions(request, board)
+        return streaming_response(request, export_board(board), "application/x-ndjson",
+                                  filename=f"board-{board.pk}.ndjson")
+
+
+class BoardImportView(APIView):
+    """
+    API view importing tasks and comments into a board.
+
+    Permissions:
+    - Only authenticated users who are the board owner or a member can access.
+
+    Methods:
+    - POST: Imports an NDJSON or CSV file (see boards_app.importer), sent
+      either as the request body (Content-Type application/x-ndjson or
+      text/csv) or as the "file" field of a multipart form (CSV when the
+      file name ends in .csv). The input is streamed and written in
+      batches. Returns the number of created tasks and comments, the
+      skipped rows with their errors and the throughput. Comment authors
+      must be the board owner or members (default: the requesting user).
+    """
+    permission_classes = [permissions.IsAuthenticated, IsBoardOwnerOrMember]
+
+    def post(self, request, pk):
+        try:
+            board = Board.objects.get(pk=pk)
+        except Board.DoesNotExist:
+            raise NotFound("Board not found.")
+        self.check_object_permissions(request, board)
+
+        if request.content_type.startswith("multipart/form-data"):
+            upload = request.FILES.get("file")
+            if upload is None:
+                raise ValidationError({"file": "No file was submitted."})
+            lines, file_format = upload, "csv" if upload.name.lower().endswith(".csv") else "ndjson"
+        else:
+            lines, file_format = request.stream or (), "csv" if request.content_type.startswith("text/csv") else "ndjson"
+
+        try:
+            authors = {board.owner_id, *board.members.values_list("id", flat=True)}
+            report = BoardImport(board, request.user, authors=authors).run(PARSERS[file_format](lines))
+        except ImportFormatError as exc:
+            raise ValidationError({"file": str(exc)})
+        return Response(report)
+
+
+class BoardChangesView(APIView):
+    """
+    API view returning what changed on a board since a cursor (delta sync).
+
+    Permissions:
+    - Only authenticated users who are the board owner or a member can access.
+
+    Methods:
+    - GET ?since=<cursor>: Returns the current state of every task, member
+      and comment that changed after the cursor, the ids of deleted ones and
+      a new cursor. Without `since` only the current cursor is returned, so
+      clients fetch it before loading the full board. `reset: true` means
+      the requested history was pruned and the board must be reloaded.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk):
+        try:
+            board = Board.objects.get(pk=pk)
+        except Board.DoesNotExist:
+            raise NotFound("Board not found.")
+        self.check_object_permissions(request, board)
+
+        latest = BoardChange.latest_id()
+        since = request.query_params.get("since")
+        if since is None:
+            return Response(self.build_payload(latest))
+        try:
+            since = int(since)
+        except ValueError:
+            raise ValidationError({"since": "Must be an integer cursor."})
+
+        oldest = BoardChange.objects.order_by("id").values_list("id", flat=True).first()
+        if oldest is not None and since + 1 < oldest:
+            return Response(self.build_payload(latest, reset=True))
+
+        limit = getattr(settings, "BOARD_CHANGES_PAGE_SIZE", 500)
+        changes = BoardChange.objects.filter(board=board, id__gt=since, id__lte=latest).order_by("id")
+        rows = list(changes.values("id", "kind", "object_id", "parent_id")[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        payload = self.build_payload(rows[-1]["id"] if has_more else max(latest, since), has_more=has_more)
+        self.collect_state(board, rows, payload)
+        return Response(payload)
+
+    @staticmethod
+    def build_payload(cursor, has_more=False, reset=False):
+        return {
+            "cursor": cursor,
+            "has_more": has_more,
+            "reset": reset,
+            "board": None,
+            "tasks": {"updated": [], "deleted": []},
+            "members": {"added": [], "removed": []},
+            "comments": {"added": [], "deleted": []},
+        }
+
+    @staticmethod
+    def collect_state(board, rows, payload):
+        """
+        Collapse the change rows per object and fill the payload with the
+        current state of every touched object, using one query per kind.
+        """
+        task_ids, member_ids, comment_tasks = set(), set(), {}
+        for row in rows:
+            kind = row["kind"]
+            if kind == BoardChange.BOARD_UPDATED:
+                payload["board"] = {"id": board.id, "title": board.title, "owner_id": board.owner_id}
+            elif kind.startswith("task_"):
+                task_ids.add(row["object_id"])
+            elif kind.startswith("member_"):
+                member_ids.add(row["object_id"])
+            else:
+                comment_tasks[row["object_id"]] = row["parent_id"]
+
+        if task_ids:
+            tasks = TaskDetailSerializer.setup_eager_loading(board.tasks.filter(pk__in=task_ids).order_by("pk"))
+            payload["tasks"]["updated"] = TaskDetailSerializer(tasks, many=True).data
+            found = {task["id"] for task in payload["tasks"]["updated"]}
+            payload["tasks"]["deleted"] = sorted(task_ids - found)
+
+        if member_ids:
+            members = board.members.filter(pk__in=member_ids).order_by("pk")
+            payload["members"]["added"] = UserSerializer(members, many=True).data
+            found = {member["id"] for member in payload["members"]["added"]}
+            payload["members"]["removed"] = sorted(member_ids - found)
+
+        if comment_tasks:
+            comments = (
+                Comment.objects.filter(task__board=board, pk__in=comment_tasks)
+                .select_related("author")
+                .order_by("pk")
+            )
+            for comment in comments:
+                payload["comments"]["added"].append({**CommentCreateSerielizer(comment).data, "task": comment.task_id})
+            found = {comment["id"] for comment in payload["comments"]["added"]}
+            payload["comments"]["deleted"] = [
+                {"id": comment_id, "task": task_id}
+                for comment_id, task_id in sorted(comment_tasks.items())
+                if comment_id not in found
+            ]
@@ -0,0 +1,33 @@
+from boards_app.models import BoardChange
+from boards_app.realtime import publish_changes
+
+
+def record_changes(board_id, kind, object_ids, parent_id=None):
+    """
+    Append one change log entry per object id to the board's change log and
+    publish them to the board's real-time subscribers.
+    """
+    if board_id is None:
+        return
+    publish_changes(BoardChange.objects.bulk_create(
+        BoardChange(board_id=board_id, kind=kind, object_id=object_id, parent_id=parent_id)
+        for object_id in object_ids
+    ))
+
+
+def record_task_changes(changes):
+    """
+    Append change log entries for (kind, task) pairs with a single insert;
+    the tasks may belong to different boards.
+    """
+    publish_changes(BoardChange.objects.bulk_create(
+        BoardChange(board_id=task.board_id, kind=kind, object_id=task.pk) for kind, task in changes
+    ))
+
+
+def record_comment_changes(board_id, comments):
+    """Append comment_added entries for new comments of one board with a single insert."""
+    publish_changes(BoardChange.objects.bulk_create(
+        BoardChange(board_id=board_id, kind=BoardChange.COMMENT_ADDED, object_id=comment.pk, parent_id=comment.task_id)
+        for comment in comments
+    ))
@@ -0,0 +1,64 @@
+"""
+NDJSON export of a whole board (GET /api/boards/<pk>/export/).
+
+The export is one JSON object per line, in this order:
+
+    {"type": "board", "id": 1, "title": "...", "owner_id": 2, ...}
+    {"type": "member", "id": 2, "email": "...", "fullname": "..."}   (each member)
+    {"type": "task", "id": 7, "title": "...", "description": "...", ...}   (each task, by id)
+    {"type": "comment", "id": 9, "task_id": 7, "author_id": 2, ...}   (each comment, by task)
+    {"type": "end", "members": 1, "tasks": 1, "comments": 1}
+
+Rows are read as plain values with QuerySet.iterator(), so the database
+cursor is consumed in chunks and no model instances are created. Lines are
+emitted in chunks of the same size, so memory stays constant however large
+the board is. The sections are read with separate queries and are not one
+snapshot: writes during an export may or may not be included.
+"""
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from tasks_app.models import Comment, Task
+
+TASK_FIELDS = (
+    "id", "title", "description", "status", "priority", "assignee_id", "reviewer_id",
+    "due_date", "comments_count", "updated_at",
+)
+COMMENT_FIELDS = ("id", "task_id", "author_id", "content", "created_at")
+
+encoder = DjangoJSONEncoder(ensure_ascii=False)
+
+
+def encode(kind, row):
+    return encoder.encode({"type": kind, **row}) + "\n"
+
+
+def export_board(board, chunk_size=None):
+    """Yield the NDJSON export of `board` as strings of up to `chunk_size` lines."""
+    chunk_size = chunk_size or getattr(settings, "BOARD_EXPORT_CHUNK_SIZE", 2000)
+    counts = {"members": 0, "tasks": 0, "comments": 0}
+    sections = [
+        ("member", "members", board.members.order_by("pk").values("id", "email", "first_name", "last_name")),
+        ("task", "tasks", Task.objects.filter(board=board).order_by("pk").values(*TASK_FIELDS)),
+        ("comment", "comments", Comment.objects.filter(task__board=board)
+            .order_by("task_id", "created_at", "id").values(*COMMENT_FIELDS)),
+    ]
+
+    yield encode("board", {
+        "id": board.pk, "title": board.title, "owner_id": board.owner_id,
+        "created_at": board.created_at, "updated_at": board.updated_at,
+    })
+    for kind, counter, queryset in sections:
+        lines = []
+        for row in queryset.iterator(chunk_size=chunk_size):
+            if kind == "member":
+                row["fullname"] = f"{row.pop('first_name')} {row.pop('last_name')}".strip()
+            lines.append(encode(kind, row))
+            if len(lines) >= chunk_size:
+                yield "".join(lines)
+                lines = []
+            counts[counter] += 1
+        if lines:
+            yield "".join(lines)
+    yield json.dumps({"type": "end", **counts}) + "\n"
@@ -0,0 +1,266 @@
+"""
+Bulk import of tasks and comments into an existing board.
+
+Input is NDJSON (one object per line, with a "type" of "task" or
+"comment", default "task") or CSV with a header row using the same
+column names (POST /api/boards/<pk>/import/, manage.py import_board).
+
+Task rows: ref, title, description, status, priority, due_date, assignee,
+reviewer (emails). Comment rows: task (ref of an earlier task row), content,
+author (email, defaults to the importing user).
+
+Files written by the board export (boards_app.export) import as well: task
+"id" and comment "task_id" serve as refs, and the user ids of tasks and
+comments are mapped to emails through the export's member lines, so users
+are matched by email in the target database. Board and end lines are
+ignored.
+
+The input is parsed as a stream. Valid rows are collected into batches of
+`batch_size` and every batch is written in its own transaction:
+- one query resolves the batch's not yet known emails;
+- one bulk_create inserts it;
+- the derived data that signals would maintain is updated once per
+  batch: comment counters, versions, change log and real-time events,
+  search index and statistics.
+
+Invalid rows are skipped and reported with their line number.
+"""
+import csv
+import json
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from rest_framework.exceptions import ValidationError
+from boards_app.changes import record_comment_changes, record_task_changes
+from boards_app.models import BoardChange
+from boards_app.versioning import touch_boards
+from tasks_app.api.serializers import CommentImportSerializer, TaskImportSerializer
+from tasks_app.models import Comment, Task
+from tasks_app.search import get_backend as get_search_backend
+from tasks_app.stats import record_comments_created, record_tasks_saved
+from tasks_app.versioning import touch_tasks
+from user_auth_app.emails import find_users_by_email, normalize_email
+
+SKIPPED_TYPES = ("board", "end")
+
+
+class ImportFormatError(ValueError):
+    """The input cannot be parsed at all (e.g. not UTF-8 or no CSV header)."""
+
+
+def decode_lines(lines):
+    for line in lines:
+        if isinstance(line, bytes):
+            try:
+                line = line.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                raise ImportFormatError("The file must be UTF-8 encoded.")
+        yield line
+
+
+def parse_ndjson(lines):
+    """Yield (line number, object or None) for the non-empty lines of NDJSON input."""
+    for number, line in enumerate(decode_lines(lines), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield number, row if isinstance(row, dict) else None
+
+
+def parse_csv(lines):
+    """Yield (line number, row dict) for CSV input with a header row; empty cells are omitted."""
+    reader = csv.reader(decode_lines(lines))
+    header = next(reader, None)
+    if not header:
+        raise ImportFormatError("The CSV file needs a header row.")
+    header = [name.strip() for name in header]
+    for values in reader:
+        if any(values):
+            yield reader.line_num, {name: value for name, value in zip(header, values) if value != ""}
+
+
+PARSERS = {"ndjson": parse_ndjson, "csv": parse_csv}
+
+
+class BoardImport:
+    """
+    Import rows into `board`, on behalf of `user` (default comment author).
+
+    Usage: BoardImport(board, user).run(parse_ndjson(lines)) returns the
+    report: created tasks and comments, skipped rows with their errors
+    (at most BOARD_IMPORT_MAX_ERRORS listed), elapsed seconds and rows per
+    second.
+
+    `authors` restricts comment authors to a set of user ids (the HTTP
+    import passes the board's owner and members); None allows any user.
+    """
+
+    def __init__(self, board, user, batch_size=None, authors=None):
+        self.board = board
+        self.user = user
+        self.authors = authors
+        self.batch_size = batch_size or getattr(settings, "BOARD_IMPORT_BATCH_SIZE", 500)
+        self.max_errors = getattr(settings, "BOARD_IMPORT_MAX_ERRORS", 100)
+        self.users = {}
+        self.refs = {}
+        self.member_emails = {}
+        # One serializer per row type validates every row: building the
+        # fields again for each row would dominate the import time.
+        self.serializers = {"task": TaskImportSerializer(), "comment": CommentImportSerializer()}
+        self.pending_tasks, self.pending_comments = [], []
+        self.created = {"tasks": 0, "comments": 0}
+        self.errors, self.error_count, self.rows = [], 0, 0
+
+    def run(self, rows):
+        start = time.perf_counter()
+        for line, row in rows:
+            self.rows += 1
+            self.add(line, row)
+        self.flush_tasks()
+        self.flush_comments()
+        elapsed = time.perf_counter() - start
+        return {
+            "created": self.created,
+            "rows": self.rows,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(self.rows / elapsed, 1) if elapsed else None,
+        }
+
+    def error(self, line, errors):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "errors": errors})
+
+    def add(self, line, row):
+        if row is None:
+            return self.error(line, {"detail": "Not a JSON object."})
+        kind = row.get("type") or "task"
+        if kind in SKIPPED_TYPES:
+            self.rows -= 1
+            return
+        if kind == "member":
+            self.rows -= 1
+            self.member_emails[row.get("id")] = row.get("email")
+            return
+        if kind not in ("task", "comment"):
+            return self.error(line, {"type": ["Must be task or comment."]})
+
+        if kind == "task":
+            row.setdefault("ref", row.get("id"))
+            for field in ("assignee", "reviewer"):
+                row.setdefault(field, self.member_emails.get(row.get(f"{field}_id")))
+        else:
+            row.setdefault("task", row.get("task_id"))
+            row.setdefault("author", self.member_emails.get(row.get("author_id")))
+        try:
+            data = self.serializers[kind].run_validation(row)
+        except ValidationError as exc:
+            return self.error(line, exc.detail)
+
+        if kind == "task":
+            self.pending_tasks.append((line, data))
+            if len(self.pending_tasks) >= self.batch_size:
+                self.flush_tasks()
+        else:
+            self.pending_comments.append((line, data))
+            if len(self.pending_comments) >= self.batch_size:
+                self.flush_tasks()
+                self.flush_comments()
+
+    def resolve_users(self, rows, fields):
+        """Look up all emails of `rows` not seen before with one query."""
+        emails = {normalize_email(data[field]) for _, data in rows for field in fields if data.get(field)}
+        unknown = emails - self.users.keys()
+        if unknown:
+            found = find_users_by_email(unknown)
+            self.users.update({email: getattr(found.get(email), "pk", None) for email in unknown})
+
+    def user_ids(self, line, data, fields):
+        """Return the user ids of the email fields of a row, or None after reporting unknown emails."""
+        ids, errors = {}, {}
+        for field in fields:
+            email = data.get(field)
+            if not email:
+                ids[field] = None
+                continue
+            ids[field] = self.users.get(normalize_email(email))
+            if ids[field] is None:
+                errors[field] = [f"No user with the email {email}."]
+        if errors:
+            self.error(line, errors)
+            return None
+        return ids
+
+    def flush_tasks(self):
+        rows, self.pending_tasks = self.pending_tasks, []
+        if not rows:
+            return
+        self.resolve_users(rows, ("assignee", "reviewer"))
+        tasks, refs = [], []
+        for line, data in rows:
+            ids = self.user_ids(line, data, ("assignee", "reviewer"))
+            if ids is None:
+                continue
+            tasks.append(Task(
+                board=self.board, title=data["title"], description=data.get("description"),
+                status=data["status"], priority=data["priority"], due_date=data["due_date"],
+                assignee_id=ids["assignee"], reviewer_id=ids["reviewer"],
+            ))
+            refs.append(data.get("ref"))
+        if not tasks:
+            return
+
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks)
+            touch_boards([self.board.pk])
+            get_search_backend().tasks_changed(task.pk for task in tasks)
+            record_tasks_saved(tasks, created=True)
+            record_task_changes([(BoardChange.TASK_CREATED, task) for task in tasks])
+        for ref, task in zip(refs, tasks):
+            if ref not in (None, ""):
+                self.refs[str(ref)] = task.pk
+        self.created["tasks"] += len(tasks)
+
+    def flush_comments(self):
+        rows, self.pending_comments = self.pending_comments, []
+        if not rows:
+            return
+        self.resolve_users(rows, ("author",))
+        comments = []
+        for line, data in rows:
+            task_id = self.refs.get(str(data["task"]))
+            if task_id is None:
+                self.error(line, {"task": [f"No task with ref {data['task']} earlier in the file."]})
+                continue
+            ids = self.user_ids(line, data, ("author",))
+            if ids is None:
+                continue
+            if self.authors is not None and ids["author"] not in (None, *self.authors):
+                self.error(line, {"author": [f"{data['author']} is not the owner or a member of the board."]})
+                continue
+            comments.append(Comment(task_id=task_id, author_id=ids["author"] or self.user.pk, content=data["content"]))
+        if not comments:
+            return
+
+        per_task = Counter(comment.task_id for comment in comments)
+        with transaction.atomic():
+            Comment.objects.bulk_create(comments)
+            by_count = {}
+            for task_id, count in per_task.items():
+                by_count.setdefault(count, []).append(task_id)
+            for count, task_ids in by_count.items():
+                Task.objects.filter(pk__in=task_ids).update(comments_count=F("comments_count") + count)
+            touch_tasks(per_task)
+            touch_boards([self.board.pk])
+            get_search_backend().tasks_changed(per_task)
+            record_comments_created(self.board.pk, comments)
+            record_comment_changes(self.board.pk, comments)
+        self.created["comments"] += len(comments)
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+from boards_app.importer import PARSERS, BoardImport, ImportFormatError
+from boards_app.models import Board
+from user_auth_app.emails import find_users_by_email, normalize_email
+
+
+class Command(BaseCommand):
+    """
+    Import tasks and comments from an NDJSON or CSV file into a board.
+
+    Same format and batching as POST /api/boards/<pk>/import/ (see
+    boards_app.importer). Comments without an author are attributed to
+    --author, or to the board owner. Unlike the HTTP import, comment
+    authors may be any user (e.g. former members of a migrated board).
+    Prints the import report.
+    """
+    help = "Import tasks and comments from an NDJSON or CSV file into a board."
+
+    def add_arguments(self, parser):
+        parser.add_argument("board", type=int, help="Id of the target board.")
+        parser.add_argument("path", help="File to import.")
+        parser.add_argument("--format", choices=sorted(PARSERS),
+                            help="File format (default: csv for .csv files, otherwise ndjson).")
+        parser.add_argument("--batch-size", type=int, help="Rows per transaction (default: BOARD_IMPORT_BATCH_SIZE).")
+        parser.add_argument("--author", help="Email of the default comment author (default: the board owner).")
+
+    def handle(self, *args, **options):
+        try:
+            board = Board.objects.select_related("owner").get(pk=options["board"])
+        except Board.DoesNotExist:
+            raise CommandError(f"Board {options['board']} does not exist.")
+        user = board.owner
+        if options["author"]:
+            user = find_users_by_email([options["author"]]).get(normalize_email(options["author"]))
+            if user is None:
+                raise CommandError(f"No user with the email {options['author']}.")
+        if options["batch_size"] is not None and options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+        file_format = options["format"] or ("csv" if options["path"].lower().endswith(".csv") else "ndjson")
+
+        try:
+            with open(options["path"], "rb") as lines:
+                report = BoardImport(board, user, batch_size=options["batch_size"]).run(PARSERS[file_format](lines))
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except ImportFormatError as exc:
+            raise CommandError(str(exc))
+
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']['tasks']} task(s) and {report['created']['comments']} comment(s) "
+            f"into board {board.pk}; skipped {report['error_count']} row(s) "
+            f"in {report['seconds']}s ({report['rows_per_second']} rows/s)."
+        ))
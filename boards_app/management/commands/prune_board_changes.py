@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from boards_app.models import BoardChange
+
+
+class Command(BaseCommand):
+    """
+    Delete old board change log entries in small batches.
+
+    The newest entry is always kept, so ids keep increasing and clients
+    whose cursor points into the pruned range are told to reload the board.
+    """
+    help = "Delete board change log entries older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7, help="Retention period in days.")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows deleted per statement.")
+
+    def handle(self, *args, **options):
+        latest = BoardChange.objects.order_by("-id").values_list("id", flat=True).first()
+        if latest is None:
+            self.stdout.write(self.style.SUCCESS("Deleted 0 change(s)."))
+            return
+
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        expired = BoardChange.objects.filter(created_at__lt=cutoff, id__lt=latest).order_by("id")
+        deleted = 0
+        while True:
+            ids = list(expired.values_list("id", flat=True)[:options["batch_size"]])
+            if not ids:
+                break
+            deleted += BoardChange.objects.filter(id__in=ids).delete()[0]
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} change(s)."))
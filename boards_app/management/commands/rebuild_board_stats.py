@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from boards_app.models import Board
+from tasks_app.stats import rebuild_board
+
+
+class Command(BaseCommand):
+    """
+    Recompute the materialized board statistics from the tasks and comments.
+
+    The counters are maintained on every write; run this to backfill them
+    for existing data or after writes that bypass the application. Every
+    board is rebuilt in its own transaction.
+    """
+    help = "Rebuild the BoardStat counters of all (or the given) boards."
+
+    def add_arguments(self, parser):
+        parser.add_argument("boards", nargs="*", type=int, help="Ids of the boards to rebuild (default: all).")
+
+    def handle(self, *args, **options):
+        boards = Board.objects.order_by("pk").values_list("pk", flat=True)
+        if options["boards"]:
+            boards = boards.filter(pk__in=options["boards"])
+        rebuilt = 0
+        for board_id in boards.iterator():
+            rebuild_board(board_id)
+            rebuilt += 1
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the statistics of {rebuilt} board(s)."))
@@ -0,0 +1,125 @@
+"""
+Central board membership resolver used by all permission checks.
+
+Membership lookups are answered from two layers:
+
+- a per-request memo stored on the request object, so repeated checks
+  during one request never hit the cache or the database twice;
+- a cross-request cache keyed by board and user. Every board carries a
+  generation token in the cache and membership entries are stored under
+  that token, so invalidating a board (members changed, board created or
+  deleted) only needs to replace its generation token.
+
+The cross-request cache is the alias named by BOARD_MEMBERSHIP_SHARED_CACHE
+and must then be shared by all workers (e.g. Redis or Memcached). Without
+it the default cache is used, which is per process: a new generation token
+only reaches the worker that rotated it, so other workers may keep answering
+with a removed membership until their entry expires. Those entries therefore
+live only BOARD_MEMBERSHIP_CACHE_TIMEOUT seconds (30 by default).
+"""
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from boards_app.models import Board
+
+MEMO_ATTRIBUTE = "_board_membership_memo"
+
+
+def _shared_alias():
+    return getattr(settings, "BOARD_MEMBERSHIP_SHARED_CACHE", None)
+
+
+def get_cache():
+    """Return the shared membership cache if configured, else the per-process default cache."""
+    return caches[_shared_alias() or "default"]
+
+
+def get_cache_timeout():
+    """Return the lifetime of cached membership entries in seconds."""
+    if _shared_alias():
+        return getattr(settings, "BOARD_MEMBERSHIP_SHARED_CACHE_TIMEOUT", 300)
+    return getattr(settings, "BOARD_MEMBERSHIP_CACHE_TIMEOUT", 30)
+
+
+def _generation_key(board_id):
+    return f"board-membership-generation:{board_id}"
+
+
+def _get_generation(board_id):
+    """Return the current generation token of a board, creating one if missing."""
+    cache = get_cache()
+    key = _generation_key(board_id)
+    generation = cache.get(key)
+    if generation is None:
+        generation = uuid4().hex
+        if not cache.add(key, generation, None):
+            generation = cache.get(key, generation)
+    return generation
+
+
+def _membership_key(board_id, user_id, generation):
+    return f"board-membership:{board_id}:{generation}:{user_id}"
+
+
+def invalidate_board(board_id):
+    """Drop all cached memberships of a board by rotating its generation token."""
+    get_cache().set(_generation_key(board_id), uuid4().hex, None)
+
+
+def _get_memo(request):
+    memo = getattr(request, MEMO_ATTRIBUTE, None)
+    if memo is None:
+        memo = {}
+        setattr(request, MEMO_ATTRIBUTE, memo)
+    return memo
+
+
+def resolve_memberships(request, board_ids):
+    """
+    Return a dict mapping each board id to whether the requesting user is
+    a member of that board.
+
+    Unknown boards resolve to False. Ids missing from both the request memo
+    and the cache are resolved together with a single query.
+    """
+    user_id = request.user.pk
+    memo = _get_memo(request)
+    board_ids = {int(board_id) for board_id in board_ids}
+    result = {board_id: memo[board_id] for board_id in board_ids if board_id in memo}
+
+    missing = board_ids - result.keys()
+    if missing:
+        keys = {
+            board_id: _membership_key(board_id, user_id, _get_generation(board_id))
+            for board_id in missing
+        }
+        cache = get_cache()
+        cached = cache.get_many(keys.values())
+        for board_id, key in keys.items():
+            if key in cached:
+                result[board_id] = cached[key]
+
+        unresolved = missing - result.keys()
+        if unresolved:
+            member_of = set(
+                Board.members.through.objects
+                .filter(board_id__in=unresolved, user_id=user_id)
+                .values_list("board_id", flat=True)
+            )
+            fresh = {board_id: board_id in member_of for board_id in unresolved}
+            cache.set_many({keys[board_id]: value for board_id, value in fresh.items()}, get_cache_timeout())
+            result.update(fresh)
+
+    memo.update(result)
+    return result
+
+
+def is_board_member(request, board_id):
+    """Return True if the requesting user is listed in the board's members."""
+    return resolve_memberships(request, [board_id])[int(board_id)]
+
+
+def is_board_owner_or_member(request, board):
+    """Return True if the requesting user owns the board or is one of its members."""
+    return board.owner_id == request.user.pk or is_board_member(request, board.pk)
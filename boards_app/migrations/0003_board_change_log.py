@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0002_version_markers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('board_updated', 'Board updated'), ('task_created', 'Task created'), ('task_updated', 'Task updated'), ('task_deleted', 'Task deleted'), ('member_added', 'Member added'), ('member_removed', 'Member removed'), ('comment_added', 'Comment added'), ('comment_deleted', 'Comment deleted')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('parent_id', models.BigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='boards_app.board')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['board', 'id'], name='boardchange_board_id_idx')],
+            },
+        ),
+    ]
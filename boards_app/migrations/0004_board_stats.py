@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_board_change_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('status', 'Tasks per status'), ('priority', 'Tasks per priority'), ('assignee', 'Tasks per assignee'), ('open_due', 'Open tasks per due date'), ('comments', 'Comments per day')], max_length=20)),
+                ('key', models.CharField(blank=True, max_length=64)),
+                ('count', models.IntegerField(default=0)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='boards_app.board')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('board', 'dimension', 'key'), name='boardstat_board_dimension_key')],
+            },
+        ),
+    ]
@@ -6,6 +6,108 @@ class Board(models.Model):
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="owned_boards")
     members = models.ManyToManyField(User, related_name="member_boards", blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1)
 
     def __str__(self):
         return self.title
+
+
+class BoardChange(models.Model):
+    """
+    Append-only change log of a board, used for delta sync.
+
+    Fields:
+    - board: Board the change belongs to.
+    - kind: What happened (see KIND_CHOICES).
+    - object_id: Id of the changed board, task, user (members) or comment.
+    - parent_id: Task id for comment changes, otherwise null.
+    - created_at: Time the change was recorded.
+
+    The auto-incrementing id doubles as the sync cursor.
+    """
+    BOARD_UPDATED = "board_updated"
+    TASK_CREATED = "task_created"
+    TASK_UPDATED = "task_updated"
+    TASK_DELETED = "task_deleted"
+    MEMBER_ADDED = "member_added"
+    MEMBER_REMOVED = "member_removed"
+    COMMENT_ADDED = "comment_added"
+    COMMENT_DELETED = "comment_deleted"
+
+    KIND_CHOICES = [
+        (BOARD_UPDATED, "Board updated"),
+        (TASK_CREATED, "Task created"),
+        (TASK_UPDATED, "Task updated"),
+        (TASK_DELETED, "Task deleted"),
+        (MEMBER_ADDED, "Member added"),
+        (MEMBER_REMOVED, "Member removed"),
+        (COMMENT_ADDED, "Comment added"),
+        (COMMENT_DELETED, "Comment deleted"),
+    ]
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="changes")
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    parent_id = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["board", "id"], name="boardchange_board_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.board_id}: {self.kind} {self.object_id}"
+
+    @classmethod
+    def latest_id(cls):
+        """
+        Return the id of the newest entry in the whole log (0 if empty).
+        Delta sync cursors are positions in the whole log, not in a board's
+        own entries, so a quiet board's cursor still moves past pruned ids.
+        """
+        return cls.objects.order_by("-id").values_list("id", flat=True).first() or 0
+
+
+class BoardStat(models.Model):
+    """
+    Materialized counters of a board, served by GET /api/boards/<pk>/stats/.
+
+    Fields:
+    - board: Board the counter belongs to.
+    - dimension: What is counted (see DIMENSION_CHOICES).
+    - key: Value of the dimension: a status or priority, an assignee id
+      ("" for unassigned tasks) or an ISO date (due date of open tasks,
+      creation date of comments).
+    - count: Number of tasks or comments with that value.
+
+    Rows are updated incrementally on task and comment writes (see
+    tasks_app.stats) and rebuilt by `manage.py rebuild_board_stats`.
+    """
+    STATUS = "status"
+    PRIORITY = "priority"
+    ASSIGNEE = "assignee"
+    OPEN_DUE = "open_due"
+    COMMENTS = "comments"
+
+    DIMENSION_CHOICES = [
+        (STATUS, "Tasks per status"),
+        (PRIORITY, "Tasks per priority"),
+        (ASSIGNEE, "Tasks per assignee"),
+        (OPEN_DUE, "Open tasks per due date"),
+        (COMMENTS, "Comments per day"),
+    ]
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="stats")
+    dimension = models.CharField(max_length=20, choices=DIMENSION_CHOICES)
+    key = models.CharField(max_length=64, blank=True)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["board", "dimension", "key"], name="boardstat_board_dimension_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.board_id}: {self.dimension}[{self.key}] = {self.count}"
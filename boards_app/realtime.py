@@ -0,0 +1,128 @@
+"""
+Real-time board events over WebSockets.
+
+Every write that is recorded in the board change log (see
+boards_app.changes) is also published to the board's pub/sub channel once
+the surrounding transaction commits. Clients connect to
+
+    ws://<host>/ws/boards/<pk>/?token=<auth token>
+
+and receive one JSON message per committed write:
+
+    {"type": "changes", "board": 1, "cursor": 42,
+     "changes": [{"kind": "task_updated", "id": 7, "parent": null}]}
+
+`cursor` matches the cursor of GET /api/boards/<pk>/changes/, so a client
+can fetch the changed objects with `?since=<previous cursor>`. A
+`{"type": "resync"}` message means the client fell behind and missed
+events. Connections are closed with code 4403 once the user loses access
+to the board (removed from the members or board deleted).
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from boards_app.membership import is_board_owner_or_member
+from boards_app.models import Board, BoardChange
+from core.pubsub import get_broker, publish
+from user_auth_app.authentication import get_user_for_token
+
+CLOSE_FORBIDDEN = 4403
+REVOKE_PREFIX = '{"type": "revoke"'
+
+
+def board_channel(board_id):
+    return f"board:{board_id}"
+
+
+def publish_changes(changes):
+    """
+    Publish saved BoardChange rows, one message per board, after the
+    current transaction commits.
+    """
+    by_board = {}
+    for change in changes:
+        by_board.setdefault(change.board_id, []).append(change)
+    for board_id, entries in by_board.items():
+        payload = {
+            "type": "changes",
+            "board": board_id,
+            "cursor": max((entry.pk or 0) for entry in entries) or None,
+            "changes": [
+                {"kind": entry.kind, "id": entry.object_id, "parent": entry.parent_id} for entry in entries
+            ],
+        }
+        transaction.on_commit(lambda channel=board_channel(board_id), payload=payload: publish(channel, payload))
+        removed = [entry.object_id for entry in entries if entry.kind == BoardChange.MEMBER_REMOVED]
+        if removed:
+            publish_revoke(board_id, removed)
+
+
+def publish_revoke(board_id, user_ids=None):
+    """Ask open connections of the given users (all if None) to re-check their access."""
+    payload = {"type": "revoke", "board": board_id, "users": user_ids}
+    transaction.on_commit(lambda: publish(board_channel(board_id), payload))
+
+
+@sync_to_async
+def authenticate(scope):
+    """Return the active user owning the `token` query parameter, or None."""
+    query = dict(
+        pair.split("=", 1) for pair in scope.get("query_string", b"").decode().split("&") if "=" in pair
+    )
+    key = query.get("token")
+    return get_user_for_token(key) if key else None
+
+
+@sync_to_async
+def has_access(user, board_id):
+    board = Board.objects.filter(pk=board_id).only("pk", "owner_id").first()
+    return board is not None and is_board_owner_or_member(SimpleNamespace(user=user), board)
+
+
+
+
+def is_revoked(message, user):
+    """Return True if a revoke message concerns the connected user."""
+    users = json.loads(message)["users"]
+    return users is None or user.pk in users
+
+
+async def board_events(scope, receive, send, board_id):
+    """ASGI WebSocket application streaming the events of one board."""
+    if (await receive())["type"] != "websocket.connect":
+        return
+    user = await authenticate(scope)
+    if user is None or not await has_access(user, board_id):
+        await send({"type": "websocket.close", "code": CLOSE_FORBIDDEN})
+        return
+
+    subscription = get_broker().subscribe(board_channel(board_id))
+    incoming = asyncio.ensure_future(receive())
+    outgoing = asyncio.ensure_future(subscription.get())
+    try:
+        await send({"type": "websocket.accept"})
+        hello = {"type": "subscribed", "board": board_id, "cursor": await sync_to_async(BoardChange.latest_id)()}
+        await send({"type": "websocket.send", "text": json.dumps(hello)})
+        while True:
+            done, _ = await asyncio.wait({incoming, outgoing}, return_when=asyncio.FIRST_COMPLETED)
+            if incoming in done:
+                if incoming.result()["type"] == "websocket.disconnect":
+                    return
+                # Client messages (e.g. keepalive pings) are ignored.
+                incoming = asyncio.ensure_future(receive())
+            if outgoing in done:
+                message = outgoing.result()
+                if message.startswith(REVOKE_PREFIX):
+                    if is_revoked(message, user) and not await has_access(user, board_id):
+                        await send({"type": "websocket.close", "code": CLOSE_FORBIDDEN})
+                        return
+                else:
+                    await send({"type": "websocket.send", "text": message})
+                outgoing = asyncio.ensure_future(subscription.get())
+    finally:
+        incoming.cancel()
+        outgoing.cancel()
+        subscription.close()
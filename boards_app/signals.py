@@ -0,0 +1,58 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from boards_app.changes import record_changes
+from boards_app.membership import invalidate_board
+from boards_app.models import Board, BoardChange
+from boards_app.realtime import publish_revoke
+from boards_app.versioning import touch_boards
+
+
+@receiver(post_save, sender=Board)
+def invalidate_membership_on_board_create(sender, instance, created, **kwargs):
+    """Start a fresh membership generation for new boards (ids may be reused)."""
+    if created:
+        invalidate_board(instance.pk)
+
+
+@receiver(post_save, sender=Board)
+def track_board_update(sender, instance, created, **kwargs):
+    if not created:
+        touch_boards([instance.pk])
+        record_changes(instance.pk, BoardChange.BOARD_UPDATED, [instance.pk])
+
+
+@receiver(post_delete, sender=Board)
+def invalidate_membership_on_board_delete(sender, instance, **kwargs):
+    """Forget all cached memberships of a deleted board and disconnect its subscribers."""
+    invalidate_board(instance.pk)
+    publish_revoke(instance.pk)
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def track_members_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Invalidate cached memberships, bump the board version and record the
+    change whenever board members change, from either side of the relation
+    (board.members or user.member_boards).
+    """
+    if action == "pre_clear":
+        if reverse:
+            instance._cleared_ids = list(instance.member_boards.values_list("pk", flat=True))
+        else:
+            instance._cleared_ids = list(instance.members.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    changed_ids = getattr(instance, "_cleared_ids", []) if action == "post_clear" else pk_set
+    kind = BoardChange.MEMBER_ADDED if action == "post_add" else BoardChange.MEMBER_REMOVED
+    if not reverse:
+        invalidate_board(instance.pk)
+        touch_boards([instance.pk])
+        record_changes(instance.pk, kind, changed_ids)
+        return
+
+    for board_id in changed_ids:
+        invalidate_board(board_id)
+        record_changes(board_id, kind, [instance.pk])
+    touch_boards(changed_ids)
@@ -1,3 +1,620 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+import warnings
+from datetime import date
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from boards_app.membership import _generation_key
+from boards_app.models import Board, BoardChange, BoardStat
+from core.asgi import application
+from tasks_app.models import Comment, Task
+from user_auth_app.models import AuthToken
+
+
+class BoardListTests(APITestCase):
+    """Tests for the aggregated board list on GET /api/boards/."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123")
+        self.other = User.objects.create_user(username="other@example.com", email="other@example.com", password="secret123")
+        token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.url = reverse("board-list-create")
+
+    def create_board(self, title, members=(), tasks=()):
+        board = Board.objects.create(title=title, owner=self.user)
+        board.members.add(*members)
+        for status, priority in tasks:
+            Task.objects.create(board=board, title="Task", status=status, priority=priority, due_date=date(2030, 1, 1))
+        return board
+
+    def test_list_returns_real_counts(self):
+        board = self.create_board(
+            "Counts",
+            members=[self.user, self.other],
+            tasks=[("to-do", "high"), ("to-do", "low"), ("done", "high")],
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+        data = response.data[0]
+        self.assertEqual(data["id"], board.id)
+        self.assertEqual(data["member_count"], 2)
+        self.assertEqual(data["ticket_count"], 3)
+        self.assertEqual(data["tasks_to_do_count"], 2)
+        self.assertEqual(data["tasks_high_prio_count"], 2)
+
+    def test_list_includes_boards_where_user_is_member_once(self):
+        foreign = Board.objects.create(title="Foreign", owner=self.other)
+        foreign.members.add(self.user, self.other)
+        Board.objects.create(title="Hidden", owner=self.other)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual([board["id"] for board in response.data], [foreign.id])
+        self.assertEqual(response.data[0]["member_count"], 2)
+
+    def test_query_count_does_not_grow_with_board_count(self):
+        self.create_board("First", members=[self.user], tasks=[("to-do", "high")])
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+        for index in range(10):
+            self.create_board(f"Board {index}", members=[self.user, self.other], tasks=[("review", "low")] * 3)
+        # The token is now answered from the token cache.
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 11)
+
+
+    def test_sparse_fieldset_skips_unselected_counts(self):
+        board = self.create_board("Sparse", members=[self.other], tasks=[("to-do", "high")])
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(self.url, {"fields": "id,title,member_count"})
+
+        self.assertEqual(response.data, [{"id": board.id, "title": "Sparse", "member_count": 1}])
+        self.assertNotIn("tasks_app_task", captured.captured_queries[-1]["sql"])
+
+class BoardDetailTests(APITestCase):
+    """Tests for the eager loaded board payload on GET /api/boards/<pk>/."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123")
+        self.other = User.objects.create_user(username="other@example.com", email="other@example.com", password="secret123")
+        token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.board = Board.objects.create(title="Detail", owner=self.user)
+        self.board.members.add(self.user, self.other)
+        self.url = reverse("board-detail", kwargs={"pk": self.board.pk})
+
+    def create_tasks(self, amount):
+        for _ in range(amount):
+            Task.objects.create(
+                board=self.board, title="Task", assignee=self.user, reviewer=self.other, due_date=date(2030, 1, 1)
+            )
+
+    def test_query_count_does_not_grow_with_task_count(self):
+        self.create_tasks(1)
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+        self.create_tasks(20)
+        # The token is now answered from the token cache.
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data["tasks"]), 21)
+        self.assertEqual(response.data["tasks"][0]["assignee"]["id"], self.user.id)
+        self.assertEqual(response.data["tasks"][0]["reviewer"]["id"], self.other.id)
+        self.assertEqual(response.data["tasks"][0]["comments_count"], 0)
+        self.assertEqual(len(response.data["members"]), 2)
+
+
+    def test_sparse_fieldset_loads_only_selected_columns(self):
+        self.create_tasks(3)
+        self.client.get(self.url)  # warm the token and membership caches
+        params = {"fields": "id,title,tasks.id,tasks.status,tasks.priority"}
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(self.url, params)
+
+        self.assertEqual(set(response.data), {"id", "title", "tasks"})
+        self.assertEqual(set(response.data["tasks"][0]), {"id", "status", "priority"})
+        self.assertEqual(len(captured.captured_queries), 2)
+        task_query = captured.captured_queries[-1]["sql"]
+        self.assertNotIn("description", task_query)
+        self.assertNotIn("auth_user", task_query)
+
+    def test_relations_are_compact_unless_expanded(self):
+        self.create_tasks(1)
+
+        response = self.client.get(self.url, {"expand": "tasks.reviewer"})
+
+        self.assertCountEqual(response.data["members"], [self.user.id, self.other.id])
+        task = response.data["tasks"][0]
+        self.assertEqual(task["assignee"], self.user.id)
+        self.assertEqual(task["reviewer"]["email"], self.other.email)
+
+    def test_unknown_fields_are_rejected(self):
+        for params in ({"fields": "id,secret"}, {"fields": "tasks.secret"}, {"expand": "title"}, {"expand": "members.email"}):
+            with self.subTest(params):
+                self.assertEqual(self.client.get(self.url, params).status_code, 400)
+
+class BoardMembershipCacheTests(APITestCase):
+    """Tests for the cached membership resolver used by the permissions."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123")
+        self.user = User.objects.create_user(username="member@example.com", email="member@example.com", password="secret123")
+        token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.board = Board.objects.create(title="Cached", owner=self.owner)
+        self.url = reverse("board-detail", kwargs={"pk": self.board.pk})
+
+    def test_membership_changes_invalidate_cache(self):
+        self.assertEqual(self.client.patch(self.url, {"title": "x"}).status_code, 403)
+
+        self.board.members.add(self.user)
+        self.assertEqual(self.client.patch(self.url, {"title": "Renamed"}).status_code, 200)
+
+        self.user.member_boards.remove(self.board)
+        self.assertEqual(self.client.patch(self.url, {"title": "x"}).status_code, 403)
+
+        self.board.members.add(self.user)
+        self.user.member_boards.clear()
+        self.assertEqual(self.client.patch(self.url, {"title": "x"}).status_code, 403)
+
+    def test_cached_membership_skips_membership_query(self):
+        self.board.members.add(self.user)
+        self.client.patch(self.url, {"title": "Warm"})
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.patch(self.url, {"title": "Cached"})
+        self.assertEqual(response.status_code, 200)
+        membership_queries = [
+            query["sql"] for query in captured.captured_queries
+            if query["sql"].startswith("SELECT") and "boards_app_board_members" in query["sql"]
+        ]
+        # Only the members_data of the response is loaded, not a membership check.
+        self.assertEqual(len(membership_queries), 1)
+        self.assertIn('INNER JOIN "boards_app_board_members"', membership_queries[0])
+
+    def test_per_process_entries_are_short_lived(self):
+        self.board.members.add(self.user)
+        cache = caches["default"]
+
+        with mock.patch.object(cache, "set_many", wraps=cache.set_many) as set_many:
+            self.client.patch(self.url, {"title": "Warm"})
+
+        self.assertEqual(set_many.call_args.args[1], 30)
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "memberships": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "memberships"},
+        },
+        BOARD_MEMBERSHIP_SHARED_CACHE="memberships",
+    )
+    def test_shared_cache_holds_memberships(self):
+        caches["default"].clear()
+        self.board.members.add(self.user)
+        shared = caches["memberships"]
+
+        with mock.patch.object(shared, "set_many", wraps=shared.set_many) as set_many:
+            self.assertEqual(self.client.patch(self.url, {"title": "Warm"}).status_code, 200)
+
+        self.assertEqual(set_many.call_args.args[1], 300)
+        self.assertIsNotNone(shared.get(_generation_key(self.board.pk)))
+        self.assertIsNone(caches["default"].get(_generation_key(self.board.pk)))
+        self.user.member_boards.remove(self.board)
+        self.assertEqual(self.client.patch(self.url, {"title": "x"}).status_code, 403)
+
+
+class BoardStatsTests(APITestCase):
+    """Tests for GET /api/boards/<pk>/stats/ and the incrementally maintained counters."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123")
+        self.other = User.objects.create_user(username="other@example.com", email="other@example.com", password="secret123")
+        token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.board = Board.objects.create(title="Stats", owner=self.user)
+        self.board.members.add(self.user, self.other)
+        self.url = reverse("board-stats", kwargs={"pk": self.board.pk})
+
+    def assert_matches_rebuild(self, stats):
+        BoardStat.objects.all().delete()
+        call_command("rebuild_board_stats", stdout=StringIO())
+        self.assertEqual(self.client.get(self.url).data, stats)
+
+    def test_counters_follow_writes(self):
+        overdue = Task.objects.create(board=self.board, title="Late", assignee=self.user, priority="high", due_date=date(2020, 1, 1))
+        done = Task.objects.create(board=self.board, title="Done", assignee=self.other, status="done", due_date=date(2020, 1, 1))
+        later = Task.objects.create(board=self.board, title="Later", due_date=date(2999, 1, 1))
+        self.client.patch(reverse("detail-task", kwargs={"pk": later.pk}), {"status": "review", "priority": "low"})
+        self.client.post(reverse("create-comments", kwargs={"task_id": later.pk}), {"content": "Hi"})
+        Comment.objects.create(author=self.user, task=done, content="Bye")
+        self.client.post(reverse("bulk-tasks"), {"operations": [
+            {"action": "update", "id": overdue.pk, "data": {"assignee_id": self.other.pk}},
+            {"action": "delete", "id": done.pk},
+            {"action": "create", "data": {"board": self.board.pk, "title": "New", "due_date": "2020-01-02"}},
+        ]}, format="json")
+
+        stats = self.client.get(self.url).data
+
+        self.assertEqual(stats["tasks"]["total"], 3)
+        self.assertEqual(stats["tasks"]["by_status"], {"to-do": 2, "in-progress": 0, "review": 1, "done": 0})
+        self.assertEqual(stats["tasks"]["by_priority"], {"low": 1, "medium": 1, "high": 1})
+        self.assertEqual(stats["tasks"]["by_assignee"], [{"assignee": self.other.pk, "count": 1}, {"assignee": None, "count": 2}])
+        self.assertEqual(stats["tasks"]["overdue"], 2)
+        self.assertEqual(len(stats["comments_per_day"]), 30)
+        self.assertEqual(stats["comments_per_day"][-1]["count"], 1)
+        self.assert_matches_rebuild(stats)
+
+    def test_deleting_an_assignee_moves_tasks_to_unassigned(self):
+        task = Task.objects.create(board=self.board, title="Task", assignee=self.other, due_date=date(2030, 1, 1))
+        Comment.objects.create(author=self.other, task=task, content="Leaving")
+        Comment.objects.create(author=self.user, task=task, content="Staying")
+        owned = Board.objects.create(title="Owned", owner=self.other)
+        Comment.objects.create(author=self.other, content="Gone with the board",
+                               task=Task.objects.create(board=owned, title="Own", due_date=date(2030, 1, 1)))
+
+        self.other.delete()
+
+        stats = self.client.get(self.url).data
+        self.assertEqual(stats["tasks"]["by_assignee"], [{"assignee": None, "count": 1}])
+        self.assertEqual(stats["comments_per_day"][-1]["count"], 1)
+        self.assert_matches_rebuild(stats)
+
+    def test_stats_are_read_from_the_counters(self):
+        for _ in range(5):
+            Task.objects.create(board=self.board, title="Task", due_date=date(2030, 1, 1))
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(self.url, {"days": 7})
+
+        self.assertEqual(len(captured.captured_queries), 2)
+        self.assertNotIn("tasks_app_task", captured.captured_queries[-1]["sql"])
+
+    def test_access_and_validation(self):
+        self.assertEqual(self.client.get(self.url, {"days": 0}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"days": "x"}).status_code, 400)
+        stranger = User.objects.create_user(username="stranger@example.com", password="secret123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {AuthToken.objects.issue(stranger).key}")
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class BoardExportTests(APITestCase):
+    """Tests for the streaming NDJSON export on GET /api/boards/<pk>/export/."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123",
+                                             first_name="Ada", last_name="Owner")
+        self.token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.board = Board.objects.create(title="Export", owner=self.user)
+        self.board.members.add(self.user)
+        self.tasks = [Task.objects.create(board=self.board, title=f"Task {n}", description="Ünïcode",
+                                          due_date=date(2030, 1, 1)) for n in range(3)]
+        for task in self.tasks:
+            Comment.objects.create(author=self.user, task=task, content=f"On {task.title}")
+        self.url = reverse("board-export", kwargs={"pk": self.board.pk})
+
+    def parse(self, chunks):
+        return [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+
+    @override_settings(BOARD_EXPORT_CHUNK_SIZE=2)
+    def test_export_streams_all_objects_in_chunks(self):
+        response = self.client.get(self.url)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 5)
+        lines = self.parse(chunks)
+        self.assertEqual([line["type"] for line in lines],
+                         ["board", "member"] + ["task"] * 3 + ["comment"] * 3 + ["end"])
+        self.assertEqual(lines[1]["fullname"], "Ada Owner")
+        self.assertEqual(lines[2]["description"], "Ünïcode")
+        self.assertEqual([line["task_id"] for line in lines[5:8]], [task.pk for task in self.tasks])
+        self.assertEqual(lines[-1], {"type": "end", "members": 1, "tasks": 3, "comments": 3})
+
+    async def test_asgi_export_is_not_buffered(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            response = await self.async_client.get(self.url, headers={"Authorization": f"Token {self.token.key}"})
+            chunks = [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(self.parse(chunks)[-1]["tasks"], 3)
+
+    def test_non_members_cannot_export(self):
+        stranger = User.objects.create_user(username="stranger@example.com", password="secret123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {AuthToken.objects.issue(stranger).key}")
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class BoardImportTests(APITestCase):
+    """Tests for POST /api/boards/<pk>/import/ and the import_board command."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123")
+        self.member = User.objects.create_user(username="dev@example.com", email="Dev@Example.com", password="secret123")
+        self.token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.board = Board.objects.create(title="Import", owner=self.user)
+        self.board.members.add(self.user, self.member)
+        self.url = reverse("board-import", kwargs={"pk": self.board.pk})
+
+    def post_ndjson(self, rows):
+        body = "\n".join(json.dumps(row) for row in rows) + "\n"
+        return self.client.generic("POST", self.url, body.encode(), content_type="application/x-ndjson")
+
+    @override_settings(BOARD_IMPORT_BATCH_SIZE=2)
+    def test_ndjson_import_creates_tasks_and_comments_in_batches(self):
+        rows = [
+            {"ref": "a", "title": "Migrate invoices", "due_date": "2030-01-01", "assignee": "dev@example.com",
+             "priority": "high"},
+            {"ref": "b", "title": "Second", "due_date": "2030-01-02", "status": "done"},
+            {"ref": "c", "title": "Third", "due_date": "2030-01-03", "reviewer": "OWNER@example.com"},
+            {"type": "comment", "task": "a", "content": "First", "author": "dev@example.com"},
+            {"type": "comment", "task": "a", "content": "Second"},
+            {"type": "comment", "task": "c", "content": "Third"},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_ndjson(rows)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["created"], {"tasks": 3, "comments": 3})
+        self.assertEqual(response.data["error_count"], 0)
+        self.assertEqual(response.data["rows"], 6)
+        user_lookups = [query for query in queries.captured_queries if 'FROM "auth_user"' in query["sql"]
+                        and "LOWER" in query["sql"]]
+        self.assertEqual(len(user_lookups), 2)
+
+        task = self.board.tasks.get(title="Migrate invoices")
+        self.assertEqual((task.assignee, task.priority, task.comments_count), (self.member, "high", 2))
+        self.assertEqual(list(task.comments.order_by("pk").values_list("author_id", flat=True)),
+                         [self.member.pk, self.user.pk])
+        self.assertEqual(self.board.tasks.get(title="Third").reviewer, self.user)
+        stats = dict(BoardStat.objects.filter(board=self.board, dimension=BoardStat.STATUS).values_list("key", "count"))
+        self.assertEqual(stats, {"to-do": 2, "done": 1})
+
+        search = self.client.get(reverse("search-tasks"), {"q": "invoices"})
+        self.assertEqual([result["id"] for result in search.data["results"]], [task.pk])
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        body = (
+            "ref,title,due_date,assignee\n"
+            "1,Valid,2030-01-01,dev@example.com\n"
+            "2,Unknown user,2030-01-01,nobody@example.com\n"
+            "3,,2030-01-01,\n"
+        )
+        response = self.client.generic("POST", self.url, body.encode(), content_type="text/csv")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["created"], {"tasks": 1, "comments": 0})
+        self.assertEqual(response.data["error_count"], 2)
+        self.assertEqual([error["line"] for error in response.data["errors"]], [4, 3])
+        self.assertIn("assignee", response.data["errors"][1]["errors"])
+        self.assertEqual(list(self.board.tasks.values_list("title", flat=True)), ["Valid"])
+
+    def test_comments_cannot_be_attributed_to_non_members(self):
+        outsider = User.objects.create_user(username="outsider@example.com", email="outsider@example.com", password="x")
+        response = self.post_ndjson([
+            {"ref": "a", "title": "Task", "due_date": "2030-01-01"},
+            {"type": "comment", "task": "a", "content": "Forged", "author": "outsider@example.com"},
+            {"type": "comment", "task": "a", "content": "Mine"},
+        ])
+
+        self.assertEqual(response.data["created"], {"tasks": 1, "comments": 1})
+        self.assertEqual([error["line"] for error in response.data["errors"]], [2])
+        self.assertIn("author", response.data["errors"][0]["errors"])
+        self.assertFalse(Comment.objects.filter(author=outsider).exists())
+        self.assertEqual(Comment.objects.get().author, self.user)
+
+    def test_comments_must_reference_earlier_tasks(self):
+        response = self.post_ndjson([{"type": "comment", "task": "missing", "content": "Orphan"}, "not an object"])
+
+        self.assertEqual(response.data["error_count"], 2)
+        self.assertEqual(Comment.objects.count(), 0)
+
+    def test_export_can_be_imported_into_another_board(self):
+        source = Board.objects.create(title="Source", owner=self.user)
+        source.members.add(self.user, self.member)
+        task = Task.objects.create(board=source, title="Exported", assignee=self.member, due_date=date(2030, 1, 1))
+        Comment.objects.create(author=self.member, task=task, content="Carried over")
+        export = b"".join(self.client.get(reverse("board-export", kwargs={"pk": source.pk})).streaming_content)
+
+        response = self.client.generic("POST", self.url, export, content_type="application/x-ndjson")
+
+        self.assertEqual(response.data["created"], {"tasks": 1, "comments": 1})
+        imported = self.board.tasks.get()
+        self.assertEqual((imported.title, imported.assignee), ("Exported", self.member))
+        self.assertEqual(imported.comments.get().author, self.member)
+
+    def test_multipart_upload_and_command(self):
+        upload = SimpleUploadedFile("tasks.csv", b"title,due_date\nUploaded,2030-01-01\n")
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.data["created"]["tasks"], 1)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False) as handle:
+            handle.write('{"ref": 1, "title": "From command", "due_date": "2030-01-01"}\n'
+                         '{"type": "comment", "task": 1, "content": "Hi"}\n')
+        self.addCleanup(os.remove, handle.name)
+        out = StringIO()
+        call_command("import_board", self.board.pk, handle.name, "--author", "dev@example.com", stdout=out)
+        self.assertIn("Imported 1 task(s) and 1 comment(s)", out.getvalue())
+        self.assertEqual(Comment.objects.get().author, self.member)
+
+    def test_non_members_cannot_import(self):
+        stranger = User.objects.create_user(username="stranger@example.com", password="secret123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {AuthToken.objects.issue(stranger).key}")
+        response = self.post_ndjson([{"title": "Nope", "due_date": "2030-01-01"}])
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Task.objects.exists())
+
+
+class BoardChangesTests(APITestCase):
+    """Tests for the delta sync endpoint GET /api/boards/<pk>/changes/."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123")
+        self.other = User.objects.create_user(username="other@example.com", email="other@example.com", password="secret123")
+        token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.board = Board.objects.create(title="Sync", owner=self.user)
+        self.board.members.add(self.user)
+        self.url = reverse("board-changes", kwargs={"pk": self.board.pk})
+
+    def test_returns_only_changes_after_cursor(self):
+        cursor = self.client.get(self.url).data["cursor"]
+        task = Task.objects.create(board=self.board, title="New", due_date=date(2030, 1, 1))
+        task.status = "done"
+        task.save()
+        removed = Task.objects.create(board=self.board, title="Gone", due_date=date(2030, 1, 1))
+        removed_id = removed.pk
+        removed.delete()
+        self.board.members.add(self.other)
+        comment = task.comments.create(author=self.user, content="Hi")
+
+        response = self.client.get(self.url, {"since": cursor})
+
+        data = response.data
+        self.assertEqual([item["id"] for item in data["tasks"]["updated"]], [task.id])
+        self.assertEqual(data["tasks"]["updated"][0]["status"], "done")
+        self.assertEqual(data["tasks"]["deleted"], [removed_id])
+        self.assertEqual([member["id"] for member in data["members"]["added"]], [self.other.id])
+        self.assertEqual(data["comments"]["added"][0]["id"], comment.id)
+        self.assertEqual(data["comments"]["added"][0]["task"], task.id)
+
+        follow_up = self.client.get(self.url, {"since": data["cursor"]}).data
+        self.assertEqual(follow_up["cursor"], data["cursor"])
+        self.assertEqual(follow_up["tasks"]["updated"], [])
+
+    def test_removed_member_and_deleted_comment(self):
+        self.board.members.add(self.other)
+        task = Task.objects.create(board=self.board, title="Task", due_date=date(2030, 1, 1))
+        comment = task.comments.create(author=self.user, content="Bye")
+        comment_id = comment.pk
+        cursor = self.client.get(self.url).data["cursor"]
+
+        self.other.member_boards.remove(self.board)
+        comment.delete()
+
+        data = self.client.get(self.url, {"since": cursor}).data
+        self.assertEqual(data["members"]["removed"], [self.other.id])
+        self.assertEqual(data["comments"]["deleted"], [{"id": comment_id, "task": task.id}])
+
+    def test_pruned_history_requests_reset(self):
+        from boards_app.models import BoardChange
+
+        self.board.title = "Renamed"
+        self.board.save()
+        self.board.title = "Renamed again"
+        self.board.save()
+        BoardChange.objects.filter(pk=BoardChange.objects.order_by("id").first().pk).delete()
+
+        data = self.client.get(self.url, {"since": 0}).data
+        self.assertTrue(data["reset"])
+
+    def test_quiet_board_cursor_moves_past_pruned_history(self):
+        from boards_app.models import BoardChange
+
+        busy = Board.objects.create(title="Busy", owner=self.other)
+        for n in range(3):
+            busy.title = f"Busy {n}"
+            busy.save()
+        first = self.client.get(self.url, {"since": 0}).data
+        self.assertFalse(first["reset"])
+        self.assertEqual(first["cursor"], BoardChange.objects.order_by("-id").first().pk)
+        BoardChange.objects.filter(pk__in=list(BoardChange.objects.order_by("id").values_list("id", flat=True)[:2])).delete()
+
+        data = self.client.get(self.url, {"since": first["cursor"]}).data
+        self.assertFalse(data["reset"])
+        busy.title = "Busy again"
+        busy.save()
+        data = self.client.get(self.url, {"since": data["cursor"]}).data
+        self.assertFalse(data["reset"])
+        self.assertEqual(data["cursor"], BoardChange.objects.order_by("-id").first().pk)
+
+        stale = self.client.get(self.url, {"since": 0}).data
+        self.assertTrue(stale["reset"])
+        self.assertFalse(self.client.get(self.url, {"since": stale["cursor"]}).data["reset"])
+
+
+class BoardRealtimeTests(TestCase):
+    """Tests for the WebSocket board events at /ws/boards/<pk>/."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner@example.com", email="owner@example.com", password="secret123")
+        self.member = User.objects.create_user(username="member@example.com", email="member@example.com", password="secret123")
+        self.board = Board.objects.create(title="Live", owner=self.user)
+        self.board.members.add(self.member)
+        self.token = AuthToken.objects.issue(self.member)
+
+    async def connect(self, token=None):
+        scope = {
+            "type": "websocket",
+            "path": f"/ws/boards/{self.board.pk}/",
+            "query_string": f"token={token or self.token.key}".encode(),
+        }
+        communicator = ApplicationCommunicator(application, scope)
+        await communicator.send_input({"type": "websocket.connect"})
+        return communicator
+
+    @sync_to_async
+    def commit(self, write):
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+
+    async def test_invalid_token_is_rejected(self):
+        communicator = await self.connect(token="invalid")
+
+        message = await communicator.receive_output()
+
+        self.assertEqual(message, {"type": "websocket.close", "code": 4403})
+
+    async def test_member_receives_committed_changes(self):
+        # A newer entry on another board: the cursor is a position in the whole log.
+        await sync_to_async(lambda: Board.objects.create(title="Other", owner=self.user).members.add(self.user))()
+        communicator = await self.connect()
+        self.assertEqual((await communicator.receive_output())["type"], "websocket.accept")
+        hello = json.loads((await communicator.receive_output())["text"])
+        self.assertEqual(hello["type"], "subscribed")
+        self.assertEqual(hello["cursor"], await sync_to_async(BoardChange.latest_id)())
+
+        await self.commit(lambda: Task.objects.create(board=self.board, title="New", due_date=date(2030, 1, 1)))
+
+        event = json.loads((await communicator.receive_output())["text"])
+        self.assertEqual(event["type"], "changes")
+        self.assertEqual(event["changes"][0]["kind"], "task_created")
+        self.assertGreater(event["cursor"], hello["cursor"])
+        await communicator.send_input({"type": "websocket.disconnect", "code": 1000})
+        await communicator.wait()
+
+    async def test_removed_member_is_disconnected(self):
+        communicator = await self.connect()
+        await communicator.receive_output()
+        await communicator.receive_output()
+
+        await self.commit(lambda: self.board.members.remove(self.member))
+
+        event = json.loads((await communicator.receive_output())["text"])
+        self.assertEqual(event["changes"][0]["kind"], "member_removed")
+        self.assertEqual(await communicator.receive_output(), {"type": "websocket.close", "code": 4403})
@@ -0,0 +1,15 @@
+from django.db.models import F
+from django.utils import timezone
+from boards_app.models import Board
+
+
+def touch_boards(board_ids):
+    """
+    Bump version and updated_at of the given boards in one query.
+
+    Called whenever a board, its members, tasks or comments change, so the
+    board ETag / Last-Modified validators change with the board payload.
+    """
+    board_ids = {board_id for board_id in board_ids if board_id is not None}
+    if board_ids:
+        Board.objects.filter(pk__in=board_ids).update(version=F("version") + 1, updated_at=timezone.now())
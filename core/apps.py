@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """Time every SQL statement of a new connection for the request metrics."""
+    from core.middleware import RequestMetricsMiddleware
+
+    if RequestMetricsMiddleware.time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(RequestMetricsMiddleware.time_query)
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        connection_created.connect(install_query_timer, dispatch_uid="core-query-timer")
@@ -2,15 +2,40 @@
 ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP requests are served by Django, WebSocket connections are dispatched
+to the handlers in ``websocket_routes`` (see boards_app.realtime).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
+import re
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
-application = get_asgi_application()
+http_application = get_asgi_application()
+
+from boards_app.realtime import board_events  # noqa: E402  (needs the app registry)
+
+websocket_routes = [
+    (re.compile(r"^/ws/boards/(?P<board_id>\d+)/$"), board_events),
+]
+
+
+async def websocket_application(scope, receive, send):
+    for pattern, handler in websocket_routes:
+        match = pattern.match(scope["path"])
+        if match:
+            kwargs = {name: int(value) for name, value in match.groupdict().items()}
+            return await handler(scope, receive, send, **kwargs)
+    await receive()
+    await send({"type": "websocket.close", "code": 4404})
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "websocket":
+        return await websocket_application(scope, receive, send)
+    return await http_application(scope, receive, send)
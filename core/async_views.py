@@ -0,0 +1,71 @@
+"""
+Minimal async counterpart of DRF's APIView for read-only endpoints.
+
+DRF views are synchronous, so under ASGI every request runs in a worker
+thread for its whole lifetime. AsyncAPIView handles a request on the event
+loop instead: authentication and data loading use Django's async ORM, and
+serializers only run over already loaded (select_related / prefetched)
+objects, so they never touch the database.
+
+The behaviour mirrors the DRF views it accompanies: token authentication
+(answered from the in-process token cache when possible), DRF-shaped
+error bodies (`{"detail": ...}` or field errors) with the status code of
+DRF's exceptions and JSON responses.
+"""
+from django.http import HttpResponseBase, JsonResponse
+from django.utils import timezone
+from django.views import View
+from rest_framework import exceptions
+from user_auth_app.authentication import token_cache
+from user_auth_app.models import AuthToken, hash_token_key
+
+
+class AsyncAPIView(View):
+    """
+    Base class of async read-only API views.
+
+    Subclasses implement `async def get(self, request, **kwargs)` and return
+    the response data (or an HttpResponse). `request.user` is the
+    authenticated user and `request.query_params` aliases `request.GET`, so
+    helpers written for DRF requests (pagination, membership resolver) work
+    unchanged.
+    """
+    http_method_names = ["get", "head", "options"]
+    keyword = "Token"
+
+    async def authenticate(self, request):
+        header = request.headers.get("Authorization", "").split()
+        if not header or header[0].lower() != self.keyword.lower():
+            raise exceptions.NotAuthenticated()
+        if len(header) != 2:
+            raise exceptions.AuthenticationFailed("Invalid token header.")
+        digest = hash_token_key(header[1])
+        user = token_cache.get(digest, shared=False)
+        if user is not None:
+            return user
+        try:
+            token = await AuthToken.objects.select_related("user").aget(digest=digest, expires_at__gt=timezone.now())
+        except AuthToken.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Invalid or expired token.")
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+        token_cache.set(digest, token.user, token.expires_at.timestamp(), shared=False)
+        return token.user
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.query_params = request.GET
+        try:
+            request.user = await self.authenticate(request)
+            response = await super().dispatch(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            response = self.handle_exception(exc)
+        if not isinstance(response, HttpResponseBase):
+            response = JsonResponse(response, safe=False)
+        return response
+
+    def handle_exception(self, exc):
+        data = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+        response = JsonResponse(data, status=exc.status_code, safe=False)
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            response["WWW-Authenticate"] = self.keyword
+        return response
@@ -0,0 +1,34 @@
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET support for views whose payload is versioned.
+
+    A view builds the validators of an object with `get_validators()` and
+    calls `not_modified_response()` before serializing: if the client's
+    If-None-Match / If-Modified-Since headers still match, a 304 response
+    is returned and the serializer never runs. Successful responses carry
+    the validators via `set_validators()`.
+    """
+    etag_prefix = None
+
+    def get_validators(self, obj):
+        """Return (etag, last_modified timestamp) of a versioned object."""
+        etag = quote_etag(f"{self.etag_prefix}-{obj.pk}-{obj.version}")
+        return etag, int(obj.updated_at.timestamp())
+
+    def not_modified_response(self, request, validators):
+        response = get_conditional_response(request, etag=validators[0], last_modified=validators[1])
+        if response is not None:
+            self.set_validators(response, validators)
+        return response
+
+    @staticmethod
+    def set_validators(response, validators):
+        etag, last_modified = validators
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        response["Cache-Control"] = "private, no-cache"
+        return response
@@ -0,0 +1,150 @@
+"""
+Sparse fieldsets for read endpoints.
+
+Clients choose the fields of a response with two query parameters:
+
+- `fields=id,title,tasks.id,tasks.status` keeps only the listed fields;
+  dotted paths select the fields of nested objects.
+- `expand=assignee,tasks.assignee` renders the listed relations as nested
+  objects.
+
+Without either parameter responses are unchanged. As soon as one is given,
+relations that are not expanded are rendered compactly as primary keys,
+and serializers use the Fieldset to skip joins, prefetches, annotations
+and large columns they do not need (see the serializers'
+setup_eager_loading).
+"""
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def build_tree(paths):
+    """Turn dotted paths into a tree: ["a", "b.c"] -> {"a": [], "b": ["c"]}."""
+    tree = {}
+    for path in paths:
+        head, _, rest = path.partition(".")
+        tree.setdefault(head, [])
+        if rest:
+            tree[head].append(rest)
+    return tree
+
+
+def split_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class Fieldset:
+    """
+    Parsed `fields` / `expand` selection of one serializer level.
+
+    `fields` is None when all fields are selected, otherwise it maps the
+    selected names to the dotted paths selected below them; `expand` maps
+    the expanded relations the same way.
+    """
+
+    def __init__(self, fields=None, expand=None):
+        self.fields = fields
+        self.expand = expand or {}
+
+    @classmethod
+    def from_query_params(cls, query_params):
+        """Return the Fieldset requested by the query parameters, or None if there is none."""
+        if "fields" not in query_params and "expand" not in query_params:
+            return None
+        fields = split_list(query_params.get("fields", ""))
+        return cls(build_tree(fields) if fields else None, build_tree(split_list(query_params.get("expand", ""))))
+
+    def includes(self, name):
+        return self.fields is None or name in self.fields
+
+    def expands(self, name):
+        """Relations are expanded when listed in `expand` or when fields below them are selected."""
+        return name in self.expand or bool(self.fields and self.fields.get(name))
+
+    def child(self, name):
+        """Return the selection of the nested serializer of relation `name`."""
+        sub_fields = self.fields.get(name) if self.fields else None
+        return Fieldset(build_tree(sub_fields) if sub_fields else None, build_tree(self.expand.get(name, [])))
+
+    def paths(self):
+        """Return the names that must exist at this level, with the nested selections that must be expandable."""
+        names = set(self.fields or ()) | set(self.expand)
+        nested = {name for name in names if self.expands(name) and (self.child(name).fields or self.child(name).expand)}
+        return names, nested
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin applying a Fieldset passed as `fieldset=`.
+
+    `expandable_fields` maps relation names to (serializer class, kwargs)
+    used to render them when expanded; otherwise they become read-only
+    primary key fields with the same kwargs (e.g. many=True).
+    """
+    expandable_fields = {}
+
+    def __init__(self, *args, fieldset=None, **kwargs):
+        self.fieldset = fieldset
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fieldset = self.fieldset
+        if fieldset is None:
+            return fields
+        for name in list(fields):
+            if not fieldset.includes(name):
+                del fields[name]
+            elif name in self.expandable_fields:
+                serializer_class, kwargs = self.expandable_fields[name]
+                if not fieldset.expands(name):
+                    fields[name] = serializers.PrimaryKeyRelatedField(read_only=True, **kwargs)
+                elif issubclass(serializer_class, SparseFieldsetMixin):
+                    fields[name] = serializer_class(read_only=True, fieldset=fieldset.child(name), **kwargs)
+                else:
+                    fields[name] = serializer_class(read_only=True, **kwargs)
+        return fields
+
+    @classmethod
+    def get_unknown_fields(cls, fieldset, prefix=""):
+        """Return the dotted paths of `fieldset` this serializer cannot render."""
+        readable = {name for name, field in cls().fields.items() if not field.write_only}
+        names, nested = fieldset.paths()
+        unknown = [prefix + name for name in names if name not in readable]
+        for name in sorted(nested & readable):
+            serializer_class = cls.expandable_fields.get(name, (None,))[0]
+            if serializer_class is None or not issubclass(serializer_class, SparseFieldsetMixin):
+                unknown.append(prefix + name)
+            else:
+                unknown += serializer_class.get_unknown_fields(fieldset.child(name), f"{prefix}{name}.")
+        unknown += [prefix + name for name in fieldset.expand if name in readable and name not in cls.expandable_fields]
+        return sorted(set(unknown))
+
+
+def get_fieldset(request, serializer_class):
+    """
+    Return the validated Fieldset of a GET request for `serializer_class`,
+    or None; unknown fields raise a ValidationError (400).
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    fieldset = Fieldset.from_query_params(request.query_params)
+    if fieldset is None:
+        return None
+    unknown = serializer_class.get_unknown_fields(fieldset)
+    if unknown:
+        raise ValidationError({"fields": f"Unknown or non-expandable field(s): {', '.join(unknown)}."})
+    return fieldset
+
+
+class SparseFieldsetViewMixin:
+    """Generic view mixin passing the request's Fieldset to the serializer (see get_fieldset)."""
+
+    def get_fieldset(self):
+        if not hasattr(self, "_fieldset"):
+            self._fieldset = get_fieldset(self.request, self.get_serializer_class())
+        return self._fieldset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fieldset", self.get_fieldset())
+        return super().get_serializer(*args, **kwargs)
@@ -0,0 +1,53 @@
+import glob
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from core.metrics import merge_snapshots
+
+
+class Command(BaseCommand):
+    """
+    Print the request metrics collected by RequestMetricsMiddleware.
+
+    Every server process periodically writes its histograms to
+    REQUEST_METRICS_DUMP_DIR; this command merges the snapshots of all
+    processes. Live numbers of a single process are available from
+    GET /api/metrics/.
+    """
+    help = "Dump the aggregated per-view request metrics of all server processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Print the merged histograms as JSON.")
+        parser.add_argument("--clear", action="store_true", help="Delete the snapshot files after reading them.")
+
+    def handle(self, *args, **options):
+        directory = getattr(settings, "REQUEST_METRICS_DUMP_DIR", None)
+        if not directory:
+            raise CommandError("REQUEST_METRICS_DUMP_DIR is not configured.")
+
+        paths = sorted(glob.glob(os.path.join(directory, "metrics-*.json")))
+        snapshots = []
+        for path in paths:
+            with open(path) as handle:
+                snapshots.append(json.load(handle)["views"])
+        merged = merge_snapshots(snapshots)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(merged, indent=2))
+        else:
+            self.stdout.write(f"{len(paths)} process snapshot(s)\n")
+            self.stdout.write(f"{'view':<50}{'count':>8}{'avg ms':>10}{'max ms':>10}{'avg db ms':>11}{'avg queries':>13}{'avg bytes':>11}")
+            for key, stats in merged.items():
+                count = stats["count"] or 1
+                self.stdout.write(
+                    f"{key:<50}{stats['count']:>8}"
+                    f"{stats['total_ms']['sum'] / count:>10.2f}{stats['total_ms']['max']:>10.2f}"
+                    f"{stats['db_ms']['sum'] / count:>11.2f}{stats['queries']['sum'] / count:>13.1f}"
+                    f"{stats['response_bytes'] // count:>11}"
+                )
+
+        if options["clear"]:
+            for path in paths:
+                os.remove(path)
@@ -0,0 +1,197 @@
+"""
+In-process request metrics: per-request measurements and per-view histograms.
+
+RequestMetricsMiddleware creates a RequestMetrics object for every request
+and stores it in a context variable, so the SQL execute wrapper and the
+timed renderer can add their measurements to it. Finished requests are
+aggregated into the process wide `registry`.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from django.conf import settings
+
+DURATION_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+current_metrics = ContextVar("current_request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Measurements collected while handling a single request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.render_started = None
+        self.render_ms = 0.0
+        self.db_ms = 0.0
+        self.db_ms_before_render = None
+        self.queries = 0
+
+    def record_query(self, duration_ms):
+        self.queries += 1
+        self.db_ms += duration_ms
+
+    def start_render(self):
+        self.render_started = time.perf_counter()
+        self.db_ms_before_render = self.db_ms
+
+    def finish_render(self):
+        if self.render_started is not None:
+            self.render_ms += (time.perf_counter() - self.render_started) * 1000
+
+    def summary(self):
+        """Return total, db, view (view and serializer code without SQL) and render times in ms."""
+        total_ms = (time.perf_counter() - self.started) * 1000
+        view_ms = 0.0
+        if self.view_started is not None:
+            view_end = self.render_started or time.perf_counter()
+            db_in_view = self.db_ms if self.db_ms_before_render is None else self.db_ms_before_render
+            view_ms = max(0.0, (view_end - self.view_started) * 1000 - db_in_view)
+        return {
+            "total_ms": total_ms,
+            "db_ms": self.db_ms,
+            "view_ms": view_ms,
+            "render_ms": self.render_ms,
+            "queries": self.queries,
+        }
+
+
+class Histogram:
+    """Fixed bucket histogram keeping count, sum and max."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def as_dict(self):
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {"buckets": dict(zip(labels, self.counts)), "sum": round(self.total, 3), "max": round(self.max, 3)}
+
+    def merge(self, data):
+        for index, count in enumerate(data["buckets"].values()):
+            self.counts[index] += count
+        self.total += data["sum"]
+        self.max = max(self.max, data["max"])
+
+
+class ViewStats:
+    """Aggregated metrics of one view (method + route)."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = Histogram(DURATION_BUCKETS_MS)
+        self.db = Histogram(DURATION_BUCKETS_MS)
+        self.view = Histogram(DURATION_BUCKETS_MS)
+        self.render = Histogram(DURATION_BUCKETS_MS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.response_bytes = 0
+
+    def observe(self, summary, size):
+        self.count += 1
+        self.total.observe(summary["total_ms"])
+        self.db.observe(summary["db_ms"])
+        self.view.observe(summary["view_ms"])
+        self.render.observe(summary["render_ms"])
+        self.queries.observe(summary["queries"])
+        self.response_bytes += size
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total.as_dict(),
+            "db_ms": self.db.as_dict(),
+            "view_ms": self.view.as_dict(),
+            "render_ms": self.render.as_dict(),
+            "queries": self.queries.as_dict(),
+            "response_bytes": self.response_bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.merge(data)
+        return stats
+
+    def merge(self, data):
+        self.count += data["count"]
+        self.total.merge(data["total_ms"])
+        self.db.merge(data["db_ms"])
+        self.view.merge(data["view_ms"])
+        self.render.merge(data["render_ms"])
+        self.queries.merge(data["queries"])
+        self.response_bytes += data["response_bytes"]
+
+
+class MetricsRegistry:
+    """
+    Thread safe per-process collection of ViewStats.
+
+    If REQUEST_METRICS_DUMP_DIR is set, the registry writes a snapshot to
+    `<dir>/metrics-<pid>.json` at most every REQUEST_METRICS_FLUSH_INTERVAL
+    seconds and at interpreter exit, so the `request_metrics` management
+    command can aggregate all worker processes.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+        self.last_flush = time.monotonic()
+
+    def record(self, key, summary, size):
+        with self.lock:
+            self.views.setdefault(key, ViewStats()).observe(summary, size)
+        self.maybe_flush()
+
+    def snapshot(self):
+        with self.lock:
+            return {key: stats.as_dict() for key, stats in sorted(self.views.items())}
+
+    def reset(self):
+        with self.lock:
+            self.views = {}
+
+    def maybe_flush(self):
+        interval = getattr(settings, "REQUEST_METRICS_FLUSH_INTERVAL", 60)
+        if time.monotonic() - self.last_flush >= interval:
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        directory = getattr(settings, "REQUEST_METRICS_DUMP_DIR", None) if settings.configured else None
+        if not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"metrics-{os.getpid()}.json")
+        with open(f"{path}.tmp", "w") as handle:
+            json.dump({"pid": os.getpid(), "written_at": time.time(), "views": self.snapshot()}, handle)
+        os.replace(f"{path}.tmp", path)
+
+
+def merge_snapshots(snapshots):
+    """Merge several {view: stats dict} snapshots into one."""
+    merged = {}
+    for snapshot in snapshots:
+        for key, data in snapshot.items():
+            if key in merged:
+                merged[key].merge(data)
+            else:
+                merged[key] = ViewStats.from_dict(data)
+    return {key: stats.as_dict() for key, stats in sorted(merged.items())}
+
+
+registry = MetricsRegistry()
+atexit.register(registry.flush)
@@ -0,0 +1,90 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from core.metrics import RequestMetrics, current_metrics, registry
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure SQL query count, SQL time, view time, render time and response
+    size of every request.
+
+    The measurements are exposed to the client as a `Server-Timing` header
+    and aggregated per view (HTTP method + URL route) into the in-process
+    histogram registry of core.metrics.
+
+    SQL is timed by `time_query`, which core.apps installs on every database
+    connection. It reports to the metrics of the current context, so queries
+    of async views (run in worker threads by the async ORM) are counted too.
+    The middleware supports both sync and async handlers, so it does not
+    force async views back into sync mode.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # A sync process_view would be run in a thread for every async request.
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, metrics, response)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, metrics, response)
+
+    def finish(self, request, metrics, response):
+        summary = metrics.summary()
+        response["Server-Timing"] = self.server_timing(summary)
+        size = 0 if response.streaming else len(response.content)
+        registry.record(self.view_key(request), summary, size)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.view_started = time.perf_counter()
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        RequestMetricsMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+    @staticmethod
+    def time_query(execute, sql, params, many, context):
+        metrics = current_metrics.get()
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if metrics is not None:
+                metrics.record_query((time.perf_counter() - start) * 1000)
+
+    @staticmethod
+    def view_key(request):
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match is not None else "<unresolved>"
+        return f"{request.method} /{route}"
+
+    @staticmethod
+    def server_timing(summary):
+        return ", ".join([
+            f'db;dur={summary["db_ms"]:.2f};desc="{summary["queries"]} queries"',
+            f'view;dur={summary["view_ms"]:.2f};desc="view and serializer"',
+            f'render;dur={summary["render_ms"]:.2f}',
+            f'total;dur={summary["total_ms"]:.2f}',
+        ])
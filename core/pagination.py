@@ -0,0 +1,162 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over a stable ordering.
+
+    The cursor stores the ordering values of the last item of a page, and
+    the next page is selected with a range condition on those values
+    instead of an OFFSET, so every page costs the same no matter how deep
+    a client pages. The ordering is taken from the queryset (falling back
+    to `ordering`) and must end with a unique field such as `id`.
+
+    Pagination is opt-in: it only applies when the request carries a
+    `cursor` or `page_size` query parameter, so existing clients keep
+    receiving plain lists.
+
+    Response format:
+        {"next": <url or null>, "results": [...]}
+    """
+    ordering = ("id",)
+    page_size = getattr(settings, "API_PAGE_SIZE", 50)
+    max_page_size = getattr(settings, "API_MAX_PAGE_SIZE", 200)
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor."
+
+    def is_requested(self, request):
+        """Return True if the client asked for a paginated response."""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        ordering = tuple(queryset.query.order_by) or self.ordering
+        if any(not isinstance(field, str) or "__" in field for field in ordering):
+            raise ValueError("KeysetPagination only supports orderings on plain model fields.")
+        return ordering
+
+    def decode_cursor(self, request, length):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != length:
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def encode_cursor(self, values):
+        data = json.dumps([self._to_primitive(value) for value in values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode("ascii")).decode("ascii")
+
+    @staticmethod
+    def _to_primitive(value):
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    @staticmethod
+    def build_keyset_filter(ordering, values):
+        """
+        Build the condition selecting rows strictly after `values` in
+        `ordering`, e.g. (a > x) OR (a = x AND b > y) for ("a", "b").
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return condition
+
+    def get_page_queryset(self, queryset, request):
+        """Return the queryset of the requested page plus one look-ahead row."""
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        self.ordering_fields = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering_fields)
+
+        values = self.decode_cursor(request, len(self.ordering_fields))
+        if values is not None:
+            try:
+                queryset = queryset.filter(self.build_keyset_filter(self.ordering_fields, values))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        return queryset[:self.page_size_value + 1]
+
+    def set_page(self, items):
+        self.has_next = len(items) > self.page_size_value
+        items = items[:self.page_size_value]
+        self.last_item = items[-1] if items else None
+        return items
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request):
+        """Async variant of paginate_queryset for async views."""
+        if not self.is_requested(request):
+            return None
+        return self.set_page([item async for item in self.get_page_queryset(queryset, request)])
+
+    def get_paginated_data(self, data):
+        return {"next": self.get_next_link(), "results": data}
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        values = [getattr(self.last_item, field.lstrip("-")) for field in self.ordering_fields]
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size_value)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(values))
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class TaskKeysetPagination(KeysetPagination):
+    """Keyset pagination for task lists, ordered by due date."""
+    ordering = ("due_date", "id")
+
+
+class CommentKeysetPagination(KeysetPagination):
+    """Keyset pagination for comment lists, ordered by creation time."""
+    ordering = ("created_at", "id")
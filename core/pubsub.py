@@ -0,0 +1,120 @@
+"""
+Publish/subscribe backends for real-time events.
+
+Publishers run in synchronous Django code (views, signal handlers), while
+subscribers are WebSocket connections waiting on an asyncio event loop.
+A broker decouples both sides: `publish()` hands an already encoded
+message to the broker, which delivers it to every subscription of the
+channel.
+
+The backend is chosen with the REALTIME_BROKER setting (a dotted path to a
+Broker subclass). InMemoryBroker only reaches subscribers of the current
+process; a broker backed by e.g. Redis pub/sub can be plugged in for
+deployments with several ASGI workers.
+"""
+import asyncio
+import json
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# Sent to a subscriber whose queue overflowed; it missed messages and has to resync.
+OVERFLOW_MESSAGE = json.dumps({"type": "resync"})
+
+
+class Subscription:
+    """A bounded message queue of one subscriber, bound to its event loop."""
+
+    def __init__(self, broker, channel, max_size):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(max_size)
+        self.overflowed = False
+
+    def deliver(self, message):
+        """Queue a message; must be called on the subscriber's event loop."""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Drop the backlog instead of buffering without bound.
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW_MESSAGE)
+
+    async def get(self):
+        message = await self.queue.get()
+        if message is OVERFLOW_MESSAGE:
+            self.overflowed = False
+        return message
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class Broker:
+    """Interface of the pub/sub backends."""
+
+    def subscribe(self, channel):
+        """Return a Subscription receiving the messages published to `channel`."""
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription):
+        raise NotImplementedError
+
+    def publish(self, channel, message):
+        """Deliver an encoded message to all subscribers; callable from any thread."""
+        raise NotImplementedError
+
+
+class InMemoryBroker(Broker):
+    """Process local broker; subscriptions are grouped per channel."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.channels = {}
+
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel, getattr(settings, "REALTIME_QUEUE_SIZE", 100))
+        with self.lock:
+            self.channels.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.channels.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self.channels[subscription.channel]
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscriptions = list(self.channels.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                # The subscriber's event loop is closed; it is going away anyway.
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self, channel):
+        with self.lock:
+            return len(self.channels.get(channel, ()))
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    """Return the process wide broker configured by REALTIME_BROKER."""
+    path = getattr(settings, "REALTIME_BROKER", "core.pubsub.InMemoryBroker")
+    return import_string(path)()
+
+
+def publish(channel, payload):
+    """Encode a payload once and publish it to every subscriber of the channel."""
+    get_broker().publish(channel, json.dumps(payload, default=str))
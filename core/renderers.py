@@ -0,0 +1,16 @@
+from rest_framework.renderers import JSONRenderer
+from core.metrics import current_metrics
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """JSONRenderer that reports its rendering time to the request metrics."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        metrics.start_render()
+        try:
+            return super().render(data, accepted_media_type, renderer_context)
+        finally:
+            metrics.finish_render()
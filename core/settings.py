@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -47,9 +48,11 @@ INSTALLED_APPS = [
     'corsheaders',
     'boards_app',
     'tasks_app',
+    'core',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -94,6 +97,26 @@ DATABASES = {
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
+# Password hashing. PASSWORD_HASHER_PROFILE (env KANMIND_PASSWORD_HASHER_PROFILE)
+# selects the PBKDF2 work factor of new hashes; lower profiles trade brute force
+# resistance for CPU per signup/login. Weaker existing hashes are re-encoded on
+# login; stronger ones are kept, so lowering the profile only affects new hashes.
+PASSWORD_HASHER_PROFILES = {
+    'strict': 1_000_000,
+    'balanced': 390_000,
+    'fast': 100_000,
+}
+PASSWORD_HASHER_PROFILE = os.environ.get('KANMIND_PASSWORD_HASHER_PROFILE', 'strict')
+PASSWORD_HASHER_ITERATIONS = PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]
+
+PASSWORD_HASHERS = [
+    'user_auth_app.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -135,6 +158,85 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
-    ]
-}
\ No newline at end of file
+        "user_auth_app.authentication.CachedTokenAuthentication",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.TimedJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    # Per client IP limits of POST /api/login/ and /api/registration/.
+    "DEFAULT_THROTTLE_RATES": {
+        "login": "30/minute",
+        "registration": "10/minute",
+    },
+}
+
+# Cached board memberships (see boards_app.membership): an optional cache
+# alias shared by all workers and the lifetime in seconds of its entries.
+# Without a shared cache the per-process default cache is used and removed
+# members may keep access on other workers for BOARD_MEMBERSHIP_CACHE_TIMEOUT.
+BOARD_MEMBERSHIP_CACHE_TIMEOUT = 30
+BOARD_MEMBERSHIP_SHARED_CACHE = None
+BOARD_MEMBERSHIP_SHARED_CACHE_TIMEOUT = 300
+
+# Default and maximum page size of the keyset paginated list endpoints.
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 200
+
+# Maximum number of operations accepted by POST /api/tasks/bulk/.
+TASK_BULK_MAX_OPERATIONS = 500
+
+# Request metrics (see core.metrics). When a dump directory is set, every
+# process writes its histograms there for `manage.py request_metrics`.
+REQUEST_METRICS_DUMP_DIR = None
+REQUEST_METRICS_FLUSH_INTERVAL = 60
+
+# Maximum number of change log entries returned by GET /api/boards/<pk>/changes/.
+BOARD_CHANGES_PAGE_SIZE = 500
+
+# Pub/sub backend of the real-time board events (see core.pubsub) and the
+# number of undelivered messages buffered per WebSocket connection.
+REALTIME_BROKER = "core.pubsub.InMemoryBroker"
+REALTIME_QUEUE_SIZE = 100
+
+# Lifetime in seconds of the tokens issued on signup, login and rotation.
+AUTH_TOKEN_LIFETIME = 7 * 24 * 3600
+
+# Cached token authentication (see user_auth_app.authentication): size and
+# lifetime in seconds of the in-process LRU, and an optional cache alias
+# shared by all workers.
+AUTH_TOKEN_CACHE_SIZE = 10000
+AUTH_TOKEN_CACHE_TIMEOUT = 30
+AUTH_TOKEN_SHARED_CACHE = None
+AUTH_TOKEN_SHARED_CACHE_TIMEOUT = 300
+
+# Email check endpoints (see user_auth_app.emails): lifetime in seconds of
+# cached "unknown email" results and maximum emails per batch request.
+EMAIL_CHECK_NEGATIVE_CACHE_TIMEOUT = 30
+EMAIL_CHECK_MAX_BATCH = 100
+
+# Task search (see tasks_app.search): backend class and the default and
+# maximum number of results per page of GET /api/tasks/search/. The FTS5
+# backend needs SQLite; use tasks_app.search.BasicSearchBackend elsewhere.
+TASK_SEARCH_BACKEND = "tasks_app.search.SQLiteFTS5Backend"
+TASK_SEARCH_PAGE_SIZE = 20
+TASK_SEARCH_MAX_PAGE_SIZE = 100
+
+# Board statistics (see tasks_app.stats): default and maximum number of days
+# of comment activity returned by GET /api/boards/<pk>/stats/.
+BOARD_STATS_DAYS = 30
+BOARD_STATS_MAX_DAYS = 365
+
+# Default and maximum look-ahead in days of GET /api/tasks/due-soon/ and the
+# due_digests command.
+TASK_DUE_SOON_DAYS = 7
+TASK_DUE_SOON_MAX_DAYS = 90
+
+# Rows fetched per database round trip and lines per streamed chunk of
+# GET /api/boards/<pk>/export/ (see boards_app.export).
+BOARD_EXPORT_CHUNK_SIZE = 2000
+
+# Board imports (see boards_app.importer): rows written per transaction and
+# maximum number of per-row errors listed in an import report.
+BOARD_IMPORT_BATCH_SIZE = 500
+BOARD_IMPORT_MAX_ERRORS = 100
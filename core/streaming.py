@@ -0,0 +1,38 @@
+"""
+Streaming responses that never buffer their content.
+
+Django consumes a sync iterator under ASGI (and an async iterator under
+WSGI) by first collecting it into a list, which defeats streaming.
+streaming_response() hands Django the kind of iterator the serving handler
+expects: the sync generator itself under WSGI, and under ASGI an async
+generator pulling one chunk at a time from it in the request's sync thread,
+where its database cursor lives.
+"""
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+
+async def iterate_in_thread(iterator):
+    """Yield the chunks of a sync iterator, advancing it with thread-sensitive sync_to_async."""
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while True:
+            chunk = await next_chunk(iterator, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=True)()
+
+
+def streaming_response(request, chunks, content_type, filename=None):
+    """Return a StreamingHttpResponse over the sync iterator `chunks` for a (DRF or Django) request."""
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        chunks = iterate_in_thread(chunks)
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    if filename:
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
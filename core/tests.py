@@ -0,0 +1,87 @@
+import asyncio
+import json
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.metrics import registry
+from core.pubsub import InMemoryBroker
+from user_auth_app.models import AuthToken
+
+
+class RequestMetricsTests(APITestCase):
+    """Tests for RequestMetricsMiddleware and its reporting endpoints."""
+
+    def setUp(self):
+        registry.reset()
+        self.user = User.objects.create_user(username="admin@example.com", email="admin@example.com",
+                                             password="secret123", is_staff=True)
+        token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_server_timing_header_reports_queries(self):
+        response = self.client.get(reverse("board-list-create"))
+
+        header = response["Server-Timing"]
+        self.assertIn('desc="2 queries"', header)
+        for metric in ("db;dur=", "view;dur=", "render;dur=", "total;dur="):
+            self.assertIn(metric, header)
+
+    def test_requests_are_aggregated_per_route(self):
+        self.client.get(reverse("board-list-create"))
+        self.client.get(reverse("board-list-create"))
+
+        response = self.client.get(reverse("request-metrics"))
+
+        stats = response.data["views"]["GET /api/boards/"]
+        self.assertEqual(stats["count"], 2)
+        # the second request authenticates from the token cache
+        self.assertEqual(stats["queries"]["sum"], 3)
+
+    def test_metrics_endpoint_requires_staff(self):
+        self.user.is_staff = False
+        self.user.save()
+        self.assertEqual(self.client.get(reverse("request-metrics")).status_code, 403)
+
+    def test_command_merges_process_snapshots(self):
+        self.client.get(reverse("board-list-create"))
+        with tempfile.TemporaryDirectory() as directory, override_settings(REQUEST_METRICS_DUMP_DIR=directory):
+            registry.flush()
+            out = StringIO()
+            call_command("request_metrics", json=True, stdout=out)
+
+        merged = json.loads(out.getvalue())
+        self.assertEqual(merged["GET /api/boards/"]["count"], 1)
+
+
+class InMemoryBrokerTests(SimpleTestCase):
+    """Tests for the process local pub/sub broker."""
+
+    async def test_publish_reaches_subscribers_of_the_channel(self):
+        broker = InMemoryBroker()
+        subscription = broker.subscribe("board:1")
+        other = broker.subscribe("board:2")
+
+        broker.publish("board:1", "hello")
+
+        self.assertEqual(await subscription.get(), "hello")
+        self.assertTrue(other.queue.empty())
+        subscription.close()
+        self.assertEqual(broker.subscriber_count("board:1"), 0)
+
+    @override_settings(REALTIME_QUEUE_SIZE=2)
+    async def test_overflowing_subscriber_is_told_to_resync(self):
+        broker = InMemoryBroker()
+        subscription = broker.subscribe("board:1")
+
+        for number in range(5):
+            broker.publish("board:1", str(number))
+        await asyncio.sleep(0)
+
+        self.assertEqual(json.loads(await subscription.get()), {"type": "resync"})
+        broker.publish("board:1", "after")
+        self.assertEqual(await subscription.get(), "after")
@@ -16,10 +16,15 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from boards_app.api.urls import async_urlpatterns as board_async_urlpatterns
+from core.views import RequestMetricsView
+from tasks_app.api.urls import async_urlpatterns as task_async_urlpatterns
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('user_auth_app.api.urls')),
     path('api/', include ('boards_app.api.urls')),
     path('api/', include ('tasks_app.api.urls')),
+    path('api/async/', include(board_async_urlpatterns + task_async_urlpatterns)),
+    path('api/metrics/', RequestMetricsView.as_view(), name='request-metrics'),
 ]
@@ -0,0 +1,25 @@
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.metrics import registry
+
+
+class RequestMetricsView(APIView):
+    """
+    API endpoint exposing the request metrics histograms of this process.
+
+    Permissions:
+    - Only staff users can access this view.
+
+    Methods:
+    - GET: Returns the per-view histograms.
+    - DELETE: Resets the histograms.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({"views": registry.snapshot()})
+
+    def delete(self, request):
+        registry.reset()
+        return Response(status=204)
@@ -0,0 +1,71 @@
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import NotFound, PermissionDenied
+from boards_app.membership import is_board_member
+from core.async_views import AsyncAPIView
+from core.fieldsets import get_fieldset
+from core.pagination import CommentKeysetPagination, TaskKeysetPagination
+from tasks_app.models import Comment, Task
+from .filters import filter_task_list, order_comment_list
+from .permissions import IsBoardMember
+from .serializers import CommentCreateSerielizer, TaskDetailSerializer
+
+
+class AsyncTasksAssignedView(AsyncAPIView):
+    """
+    Async variant of TasksAssignedView: lists the tasks assigned to the
+    authenticated user.
+
+    Supports the same filter, ordering, sparse fieldset and keyset
+    pagination query parameters as TasksAssignedView.
+    """
+    user_field = "assignee"
+    pagination_class = TaskKeysetPagination
+
+    async def get(self, request):
+        queryset = filter_task_list(Task.objects.filter(**{self.user_field: request.user}), request.query_params)
+        fieldset = get_fieldset(request, TaskDetailSerializer)
+        queryset = TaskDetailSerializer.setup_eager_loading(queryset, fieldset)
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, request)
+        if page is not None:
+            return paginator.get_paginated_data(TaskDetailSerializer(page, many=True, fieldset=fieldset).data)
+        tasks = [task async for task in queryset]
+        return TaskDetailSerializer(tasks, many=True, fieldset=fieldset).data
+
+
+class AsyncTasksReviewedView(AsyncTasksAssignedView):
+    """Async variant of TasksReviewedView: lists the tasks the authenticated user is reviewing."""
+    user_field = "reviewer"
+
+
+class AsyncCommentsView(AsyncAPIView):
+    """
+    Async variant of the comment list of CommentsView.
+
+    Permissions:
+    - User must be authenticated.
+    - User must be a member of the task's board.
+
+    Supports the same `ordering` (oldest, newest) and keyset pagination
+    query parameters as CommentsView.
+    """
+    pagination_class = CommentKeysetPagination
+
+    async def get(self, request, task_id):
+        board_id = await Task.objects.filter(pk=task_id).values_list("board_id", flat=True).afirst()
+        if board_id is None:
+            raise NotFound("Task not found.")
+        if not await sync_to_async(is_board_member)(request, board_id):
+            raise PermissionDenied(IsBoardMember.message)
+
+        queryset = order_comment_list(Comment.objects.filter(task_id=task_id), request.query_params)
+        queryset = CommentCreateSerielizer.setup_eager_loading(queryset)
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, request)
+        if page is not None:
+            return paginator.get_paginated_data(CommentCreateSerielizer(page, many=True).data)
+
+        comments = [comment async for comment in queryset]
+        if not comments:
+            raise NotFound("No comments found for this task.")
+        return CommentCreateSerielizer(comments, many=True).data
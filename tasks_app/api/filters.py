@@ -0,0 +1,96 @@
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+from tasks_app.models import Task
+
+
+class TaskListQuerySerializer(serializers.Serializer):
+    """
+    Validates the filter and ordering query parameters of the "my tasks"
+    lists (assigned to me / reviewing).
+
+    - status, priority: one value or a comma separated list of values.
+    - board: board id.
+    - due_after, due_before: inclusive due date bounds (YYYY-MM-DD).
+    - ordering: one of ORDERINGS. Only orderings served by the
+      (user, due_date, id) and (user, status, due_date, id) indexes are
+      accepted, so no list needs a sort step over all of a user's tasks.
+    """
+    ORDERINGS = {
+        "due_date": ("due_date", "id"),
+        "-due_date": ("-due_date", "-id"),
+        "status": ("status", "due_date", "id"),
+        "-status": ("-status", "-due_date", "-id"),
+    }
+
+    status = serializers.CharField(required=False)
+    priority = serializers.CharField(required=False)
+    board = serializers.IntegerField(required=False, min_value=1)
+    due_after = serializers.DateField(required=False)
+    due_before = serializers.DateField(required=False)
+    ordering = serializers.ChoiceField(choices=list(ORDERINGS), required=False, default="due_date",
+                                       error_messages={"invalid_choice": "Unsupported ordering \"{input}\"."})
+
+    @staticmethod
+    def parse_choices(value, choices):
+        values = [item.strip() for item in value.split(",") if item.strip()]
+        valid = {key for key, _ in choices}
+        invalid = [item for item in values if item not in valid]
+        if not values or invalid:
+            raise serializers.ValidationError(f"Must be one or more of: {', '.join(sorted(valid))}.")
+        return values
+
+    def validate_status(self, value):
+        return self.parse_choices(value, Task.STATUS_CHOICES)
+
+    def validate_priority(self, value):
+        return self.parse_choices(value, Task.PRIORITY_CHOICES)
+
+    def validate(self, attrs):
+        if "due_after" in attrs and "due_before" in attrs and attrs["due_after"] > attrs["due_before"]:
+            raise serializers.ValidationError({"due_after": "Must not be later than due_before."})
+        return attrs
+
+
+def filter_task_list(queryset, query_params):
+    """Apply the validated list parameters to a task queryset; raises ValidationError."""
+    params = TaskListQuerySerializer(data=query_params)
+    params.is_valid(raise_exception=True)
+    data = params.validated_data
+    lookups = {
+        "status": "status__in",
+        "priority": "priority__in",
+        "board": "board_id",
+        "due_after": "due_date__gte",
+        "due_before": "due_date__lte",
+    }
+    queryset = queryset.filter(**{lookup: data[name] for name, lookup in lookups.items() if name in data})
+    return queryset.order_by(*TaskListQuerySerializer.ORDERINGS[data["ordering"]])
+
+
+class TaskListFilter(BaseFilterBackend):
+    """Filter backend applying filter_task_list to the request's query parameters."""
+
+    def filter_queryset(self, request, queryset, view):
+        return filter_task_list(queryset, request.query_params)
+
+
+class CommentListQuerySerializer(serializers.Serializer):
+    """
+    Validates the ordering query parameter of a task's comment list:
+    "oldest" (default) or "newest" first. Both are served by the
+    (task, created_at, id) index, read forwards or backwards.
+    """
+    ORDERINGS = {
+        "oldest": ("created_at", "id"),
+        "newest": ("-created_at", "-id"),
+    }
+
+    ordering = serializers.ChoiceField(choices=list(ORDERINGS), required=False, default="oldest",
+                                       error_messages={"invalid_choice": "Unsupported ordering \"{input}\"."})
+
+
+def order_comment_list(queryset, query_params):
+    """Apply the validated ordering parameter to a comment queryset; raises ValidationError."""
+    params = CommentListQuerySerializer(data=query_params)
+    params.is_valid(raise_exception=True)
+    return queryset.order_by(*CommentListQuerySerializer.ORDERINGS[params.validated_data["ordering"]])
@@ -1,35 +1,50 @@
 from rest_framework import permissions
 from rest_framework.exceptions import NotFound, PermissionDenied
+from boards_app.membership import is_board_member, is_board_owner_or_member
 from boards_app.models import Board
 from ..models import Task
 
 
+def get_task_board_id(request, task_id):
+    """
+    Return the board id of a task, memoized on the request so permission
+    classes and views share one lookup. Raises NotFound for unknown tasks.
+    """
+    memo = getattr(request, "_task_board_ids", None)
+    if memo is None:
+        memo = {}
+        request._task_board_ids = memo
+    task_id = int(task_id)
+    if task_id not in memo:
+        try:
+            memo[task_id] = Task.objects.values_list("board_id", flat=True).get(pk=task_id)
+        except Task.DoesNotExist:
+            raise NotFound("Task not found.")
+    return memo[task_id]
+
+
 class IsBoardMember(permissions.BasePermission):
     message = "You must be a member of the board to perform this action."
 
     def has_permission(self, request, view):
         board_id = request.data.get('board')
-    
 
         if not board_id:
             task_id = view.kwargs.get('task_id') or view.kwargs.get('pk')
             if not task_id:
                 return False
-
-            try:
-                task = Task.objects.get(pk=task_id)
-                board = task.board
-     
-            except Task.DoesNotExist:
-                raise NotFound("Task not found.")
-        else:
-            try:
-                board = Board.objects.get(pk=board_id)
-            except Board.DoesNotExist:
-                raise NotFound("Board not found.")
-
-        is_member = board.members.filter(pk=request.user.pk).exists()
-        return is_member
+            board_id = get_task_board_id(request, task_id)
+            return is_board_member(request, board_id)
+
+        try:
+            board_id = int(board_id)
+        except (TypeError, ValueError):
+            raise NotFound("Board not found.")
+        if is_board_member(request, board_id):
+            return True
+        if not Board.objects.filter(pk=board_id).exists():
+            raise NotFound("Board not found.")
+        return False
     
 
 class IsBoardOwnerOrMemberAndImmutableBoard(permissions.BasePermission):
@@ -48,8 +63,7 @@ class IsBoardOwnerOrMemberAndImmutableBoard(permissions.BasePermission):
     message = "Only the Board owner or a member may edit this task. Changing the board association is not allowed."
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        if not (obj.board.owner == user or user in obj.board.members.all()):
+        if not is_board_owner_or_member(request, obj.board):
             raise PermissionDenied(self.message)
 
         if request.method in ['PATCH', 'PUT']:
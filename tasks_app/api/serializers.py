@@ -1,9 +1,30 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
+from boards_app.models import Board
+from core.fieldsets import SparseFieldsetMixin
 from tasks_app.models import Task, Comment
 from user_auth_app.api.serializers import UserSerializer
 
 
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key field that first resolves ids from the instances passed in
+    `context["prefetched"][model]`, so validating many items in one request
+    does not query the database once per item and field.
+    """
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get("prefetched", {}).get(self.get_queryset().model)
+        if prefetched:
+            try:
+                instance = prefetched.get(int(data))
+            except (TypeError, ValueError):
+                instance = None
+            if instance is not None:
+                return instance
+        return super().to_internal_value(data)
+
+
 class TaskCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and updating Task instances.
@@ -19,10 +40,11 @@ class TaskCreateUpdateSerializer(serializers.ModelSerializer):
     - reviewer_id: User reviewing the task (nullable, optional)
     - due_date: Deadline for the task
     """
-    assignee_id = serializers.PrimaryKeyRelatedField(
+    board = PrefetchedPrimaryKeyRelatedField(queryset=Board.objects.all())
+    assignee_id = PrefetchedPrimaryKeyRelatedField(
         source='assignee', queryset=User.objects.all(), allow_null=True, required=False
     )
-    reviewer_id = serializers.PrimaryKeyRelatedField(
+    reviewer_id = PrefetchedPrimaryKeyRelatedField(
         source='reviewer', queryset=User.objects.all(), allow_null=True, required=False
     )
     comments_count = serializers.IntegerField(read_only=True, default=0)
@@ -43,9 +65,11 @@ class TaskCreateUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
-class TaskDetailSerializer(serializers.ModelSerializer):
+class TaskDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for detailed Task view including related user info and comments count.
+    Supports sparse fieldsets (see core.fieldsets); assignee and reviewer are
+    expandable.
 
     Fields:
     - id: Task ID
@@ -61,7 +85,9 @@ class TaskDetailSerializer(serializers.ModelSerializer):
     """
     assignee = UserSerializer(read_only=True)
     reviewer = UserSerializer(read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
+    expandable_fields = {"assignee": (UserSerializer, {}), "reviewer": (UserSerializer, {})}
+    deferrable_fields = ("title", "description")
 
     class Meta:
         model = Task
@@ -78,9 +104,23 @@ class TaskDetailSerializer(serializers.ModelSerializer):
             "comments_count",
         ]
 
-    def get_comments_count(self, obj):
-        """Return the total number of comments related to this task."""
-        return obj.comments.count()
+    @classmethod
+    def setup_eager_loading(cls, queryset, fieldset=None):
+        """
+        Join assignee and reviewer so that any number of tasks is serialized
+        without per-task queries. The comment count is read from the
+        denormalized comments_count column.
+
+        With a fieldset only expanded users are joined, and the text
+        columns (title, description) are not loaded unless selected.
+        """
+        if fieldset is None:
+            return queryset.select_related("assignee", "reviewer")
+        related = [name for name in cls.expandable_fields if fieldset.includes(name) and fieldset.expands(name)]
+        if related:
+            # select_related() without arguments would follow every foreign key.
+            queryset = queryset.select_related(*related)
+        return queryset.defer(*(name for name in cls.deferrable_fields if not fieldset.includes(name)))
 
 class TaskUpdateSerializer(serializers.ModelSerializer):
     """
@@ -132,6 +172,49 @@ class CommentCreateSerielizer(serializers.ModelSerializer):
         model = Comment
         fields = ["id", "content", "created_at", "author"]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Join the author so that any number of comments is serialized in the
+        same query, loading only the columns the representation needs.
+        """
+        return queryset.select_related("author").only(
+            "id", "content", "created_at", "task_id", "author__id", "author__first_name", "author__last_name",
+        )
+
     def get_author(self, obj):
         """Return the full name of the comment author."""
         return obj.author.get_full_name()
+
+
+class TaskImportSerializer(serializers.Serializer):
+    """
+    Serializer validating one task row of a board import.
+
+    Fields:
+    - ref: Identifier of the task in the imported file, used by comment rows (optional)
+    - title, description, status, priority, due_date: As on Task
+    - assignee, reviewer: Emails of existing users (optional), resolved in batches
+    """
+    ref = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, default="to-do")
+    priority = serializers.ChoiceField(choices=Task.PRIORITY_CHOICES, default="medium")
+    due_date = serializers.DateField()
+    assignee = serializers.EmailField(required=False, allow_blank=True, allow_null=True)
+    reviewer = serializers.EmailField(required=False, allow_blank=True, allow_null=True)
+
+
+class CommentImportSerializer(serializers.Serializer):
+    """
+    Serializer validating one comment row of a board import.
+
+    Fields:
+    - task: ref of a task row earlier in the same file
+    - content: Text of the comment
+    - author: Email of an existing user (optional, defaults to the importing user)
+    """
+    task = serializers.CharField()
+    content = serializers.CharField()
+    author = serializers.EmailField(required=False, allow_blank=True, allow_null=True)
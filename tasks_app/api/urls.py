@@ -1,11 +1,23 @@
 from django.urls import path
-from .views import TaskCreateView, TasksAssignedView, TasksReviewedView, CommentsView, CommentDeleteView, TaskDetailView
+from .async_views import AsyncCommentsView, AsyncTasksAssignedView, AsyncTasksReviewedView
+from .views import TaskCreateView, TasksAssignedView, TasksReviewedView, CommentsView, CommentDeleteView, TaskDetailView, TaskBulkView, TaskSearchView, TasksOverdueView, TasksDueSoonView
 
 urlpatterns =[
     path('tasks/', TaskCreateView.as_view(), name="tasks"),
+    path('tasks/bulk/', TaskBulkView.as_view(), name="bulk-tasks"),
+    path('tasks/search/', TaskSearchView.as_view(), name="search-tasks"),
     path('tasks/<int:pk>/', TaskDetailView.as_view(), name="detail-task"),
     path('tasks/assigned-to-me/', TasksAssignedView.as_view(), name="assigned-tasks"),
     path('tasks/reviewing/', TasksReviewedView.as_view(), name="reviewed-tasks"),
+    path('tasks/overdue/', TasksOverdueView.as_view(), name="overdue-tasks"),
+    path('tasks/due-soon/', TasksDueSoonView.as_view(), name="due-soon-tasks"),
     path('tasks/<int:task_id>/comments/', CommentsView.as_view(), name="create-comments"),
     path('tasks/<int:task_id>/comments/<int:pk>/', CommentDeleteView.as_view(), name="delete-comments")
-]
\ No newline at end of file
+]
+
+# Async variants of the read paths, mounted under api/async/ (see core.urls).
+async_urlpatterns = [
+    path('tasks/assigned-to-me/', AsyncTasksAssignedView.as_view(), name="async-assigned-tasks"),
+    path('tasks/reviewing/', AsyncTasksReviewedView.as_view(), name="async-reviewed-tasks"),
+    path('tasks/<int:task_id>/comments/', AsyncCommentsView.as_view(), name="async-comments"),
+]
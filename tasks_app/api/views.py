@@ -1,9 +1,25 @@
-from django.db.models import Q
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import F, Q
 from rest_framework import generics, permissions, status
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
+from boards_app.membership import is_board_member, resolve_memberships
+from boards_app.changes import record_task_changes
+from boards_app.models import Board, BoardChange
+from boards_app.versioning import touch_boards
+from core.conditional import ConditionalGetMixin
+from core.fieldsets import SparseFieldsetViewMixin, get_fieldset
+from core.pagination import CommentKeysetPagination, TaskKeysetPagination
+from tasks_app.due import due_soon, overdue
 from tasks_app.models import Task, Comment
+from tasks_app.search import get_backend as get_search_backend
+from tasks_app.stats import record_tasks_saved
+from tasks_app.versioning import touch_tasks
+from .filters import TaskListFilter, order_comment_list
 from .permissions import IsBoardMember, IsBoardOwnerOrMemberAndImmutableBoard, IsCommentAuthor
 from .serializers import TaskCreateUpdateSerializer, TaskDetailSerializer, CommentCreateSerielizer, TaskUpdateSerializer
 
@@ -29,9 +45,10 @@ class TaskCreateView(generics.CreateAPIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
   
 
-class TaskDetailView(APIView):
+class TaskDetailView(ConditionalGetMixin, APIView):
     """
     API endpoint to retrieve, update (partial), or delete a Task by its ID.
+    GET supports conditional requests via ETag / Last-Modified.
 
     Permissions:
     - User must be authenticated.
@@ -39,20 +56,29 @@ class TaskDetailView(APIView):
     - Board assignment cannot be changed on update.
     """
     permission_classes = [permissions.IsAuthenticated, IsBoardMember]
+    etag_prefix = "task"
 
-    def get_object(self, pk):
+    def get_object(self, pk, queryset=None):
         """Retrieve Task by primary key or raise NotFound if it does not exist."""
+        if queryset is None:
+            queryset = Task.objects.all()
         try:
-            obj = Task.objects.get(pk=pk)
+            obj = queryset.get(pk=pk)
         except Task.DoesNotExist:
             raise NotFound("Task not found.")
         return obj
 
     def get(self, request, pk, format=None):
-        """Return task details."""
-        task = self.get_object(pk)
-        serializer = TaskDetailSerializer(task)
-        return Response(serializer.data)
+        """Return task details, optionally as a sparse fieldset (`fields`, `expand`)."""
+        fieldset = get_fieldset(request, TaskDetailSerializer)
+        task = self.get_object(pk, TaskDetailSerializer.setup_eager_loading(Task.objects.all(), fieldset))
+        validators = self.get_validators(task)
+        not_modified = self.not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = TaskDetailSerializer(task, fieldset=fieldset)
+        return self.set_validators(Response(serializer.data), validators)
 
     def patch(self, request, pk, format=None):
         """Partially update a task."""
@@ -70,28 +96,132 @@ class TaskDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class TasksAssignedView(generics.ListAPIView):
+class TasksAssignedView(SparseFieldsetViewMixin, generics.ListAPIView):
     """
     API endpoint to list all tasks assigned to the authenticated user.
+
+    Supports filtering and ordering via the `status`, `priority`, `board`,
+    `due_after`, `due_before` and `ordering` query parameters (see
+    TaskListQuerySerializer), sparse fieldsets via `fields` and `expand`
+    (see core.fieldsets) and keyset pagination via the `cursor` and
+    `page_size` query parameters.
     """
     serializer_class = TaskDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TaskKeysetPagination
+    filter_backends = [TaskListFilter]
 
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(assignee=user)
+        return TaskDetailSerializer.setup_eager_loading(Task.objects.filter(assignee=user), self.get_fieldset())
 
 
-class TasksReviewedView(generics.ListAPIView):
+class TasksReviewedView(SparseFieldsetViewMixin, generics.ListAPIView):
     """
     API endpoint to list all tasks the authenticated user is reviewing.
+
+    Supports filtering and ordering via the `status`, `priority`, `board`,
+    `due_after`, `due_before` and `ordering` query parameters (see
+    TaskListQuerySerializer), sparse fieldsets via `fields` and `expand`
+    (see core.fieldsets) and keyset pagination via the `cursor` and
+    `page_size` query parameters.
     """
     serializer_class = TaskDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TaskKeysetPagination
+    filter_backends = [TaskListFilter]
 
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(reviewer=user)
+        return TaskDetailSerializer.setup_eager_loading(Task.objects.filter(reviewer=user), self.get_fieldset())
+
+
+class TasksOverdueView(SparseFieldsetViewMixin, generics.ListAPIView):
+    """
+    API endpoint to list the open tasks assigned to the authenticated user
+    whose due date has passed, oldest first.
+
+    Supports sparse fieldsets via `fields` and `expand` (see
+    core.fieldsets) and keyset pagination via the `cursor` and `page_size`
+    query parameters.
+    """
+    serializer_class = TaskDetailSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TaskKeysetPagination
+
+    def get_queryset(self):
+        queryset = overdue(Task.objects.filter(assignee=self.request.user)).order_by("due_date", "id")
+        return TaskDetailSerializer.setup_eager_loading(queryset, self.get_fieldset())
+
+
+class TasksDueSoonView(TasksOverdueView):
+    """
+    API endpoint to list the open tasks assigned to the authenticated user
+    that are due within the next `days` days (default TASK_DUE_SOON_DAYS),
+    soonest first.
+
+    Supports the same sparse fieldset and pagination parameters as
+    TasksOverdueView.
+    """
+
+    def get_days(self):
+        max_days = getattr(settings, "TASK_DUE_SOON_MAX_DAYS", 90)
+        try:
+            days = int(self.request.query_params.get("days", getattr(settings, "TASK_DUE_SOON_DAYS", 7)))
+        except ValueError:
+            days = -1
+        if not 0 <= days <= max_days:
+            raise ValidationError({"days": f"Must be an integer between 0 and {max_days}."})
+        return days
+
+    def get_queryset(self):
+        queryset = due_soon(Task.objects.filter(assignee=self.request.user), self.get_days()).order_by("due_date", "id")
+        return TaskDetailSerializer.setup_eager_loading(queryset, self.get_fieldset())
+
+
+class TaskSearchView(APIView):
+    """
+    API endpoint for ranked full-text search over the tasks of all boards
+    the user owns or is a member of.
+
+    Query parameters:
+    - q: search text; every word must match the title, description or a
+      comment of the task (prefix match).
+    - page_size, offset: result window, the response has the paginated
+      shape {"next": <url or null>, "results": [...]}.
+
+    Results are ordered by relevance, see tasks_app.search.
+
+    Permissions:
+    - User must be authenticated.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_window(self, request):
+        page_size = getattr(settings, "TASK_SEARCH_PAGE_SIZE", 20)
+        try:
+            size = int(request.query_params.get("page_size", page_size))
+            offset = max(int(request.query_params.get("offset", 0)), 0)
+        except ValueError:
+            raise ValidationError({"detail": "'page_size' and 'offset' must be integers."})
+        if size <= 0:
+            size = page_size
+        return min(size, getattr(settings, "TASK_SEARCH_MAX_PAGE_SIZE", 100)), offset
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "A search query is required."})
+        size, offset = self.get_window(request)
+
+        ids = get_search_backend().search(request.user, query, limit=size + 1, offset=offset)
+        next_url = None
+        if len(ids) > size:
+            ids = ids[:size]
+            next_url = replace_query_param(request.build_absolute_uri(), "offset", offset + size)
+        tasks = TaskDetailSerializer.setup_eager_loading(Task.objects.filter(pk__in=ids)).in_bulk()
+        ranked = [tasks[pk] for pk in ids if pk in tasks]
+        return Response({"next": next_url, "results": TaskDetailSerializer(ranked, many=True).data})
 
 
 class CommentsView(generics.ListCreateAPIView):
@@ -101,34 +231,48 @@ class CommentsView(generics.ListCreateAPIView):
     Permissions:
     - User must be authenticated.
     - User must be Board owner or member.
+
+    Comments are listed oldest first, or newest first with
+    `ordering=newest`; authors are joined, so a list is a single query.
+    Supports keyset pagination in the chosen order via the `cursor` and
+    `page_size` query parameters.
     """
     serializer_class = CommentCreateSerielizer
     permission_classes = [permissions.IsAuthenticated, IsBoardMember]
+    pagination_class = CommentKeysetPagination
 
     def get_queryset(self):
-        task_id = self.kwargs.get("task_id")
-        task=generics.get_object_or_404(Task, id=task_id)
-        return Comment.objects.filter(task=task)
-    
+        # The task exists: IsBoardMember resolved its board (or raised NotFound).
+        queryset = Comment.objects.filter(task_id=self.kwargs.get("task_id"))
+        return CommentCreateSerielizer.setup_eager_loading(order_comment_list(queryset, self.request.query_params))
+
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
 
-        if not queryset.exists():
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        comments = list(queryset)
+        if not comments:
             return Response({"detail": "No comments found for this task."}, status=status.HTTP_404_NOT_FOUND)
-        serializer = self.get_serializer(queryset, many=True)
+        serializer = self.get_serializer(comments, many=True)
         return Response(serializer.data)
 
     def create(self, request, *args, **kwargs):
         task_id = kwargs.get("task_id")
         task = generics.get_object_or_404(Task, id=task_id)
 
-        if request.user not in task.board.members.all():
+        if not is_board_member(request, task.board_id):
             return Response({"detail": "You are not a member of this board."},
                             status=status.HTTP_403_FORBIDDEN)
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save(author=request.user, task=task)
+        with transaction.atomic():
+            serializer.save(author=request.user, task=task)
+            Task.objects.filter(pk=task.pk).update(comments_count=F("comments_count") + 1)
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -156,5 +300,179 @@ class CommentDeleteView(APIView):
 
         self.check_object_permissions(request, comment)
 
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
+            Task.objects.filter(pk=comment.task_id).update(comments_count=F("comments_count") - 1)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TaskBulkView(APIView):
+    """
+    API endpoint to create, update and delete many tasks in one request.
+
+    POST body:
+        {"operations": [
+            {"action": "create", "data": {...}},
+            {"action": "update", "id": 1, "data": {...}},
+            {"action": "delete", "id": 2}
+        ]}
+
+    All operations are validated with TaskCreateUpdateSerializer in one pass
+    and board membership is resolved once for all distinct boards. If any
+    operation is invalid nothing is written and a 400 response lists the
+    per-item errors. Otherwise all writes happen in a single transaction
+    using bulk_create, bulk_update and one delete query.
+
+    Permissions:
+    - User must be authenticated.
+    - User must be a member of the board of every task touched.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    actions = ("create", "update", "delete")
+
+    def post(self, request):
+        operations = request.data.get("operations") if isinstance(request.data, dict) else None
+        max_operations = getattr(settings, "TASK_BULK_MAX_OPERATIONS", 500)
+        if not isinstance(operations, list) or not operations:
+            return Response({"detail": "'operations' must be a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(operations) > max_operations:
+            return Response({"detail": f"At most {max_operations} operations are allowed per request."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        results = [{"index": index} for index in range(len(operations))]
+        tasks = self.load_tasks(operations)
+        context = {"request": request, "prefetched": self.prefetch_related_objects(operations)}
+
+        validated = []
+        seen_ids = set()
+        for index, operation in enumerate(operations):
+            error = self.validate_operation(operation, tasks, seen_ids)
+            if error:
+                results[index].update(status=error[0], errors=error[1])
+                continue
+            action = operation["action"]
+            task = tasks.get(operation.get("id"))
+            serializer = None
+            if action == "create":
+                serializer = TaskCreateUpdateSerializer(data=operation.get("data", {}), context=context)
+            elif action == "update":
+                serializer = TaskCreateUpdateSerializer(task, data=operation.get("data", {}), partial=True, context=context)
+            if serializer is not None and not serializer.is_valid():
+                results[index].update(status=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
+                continue
+            if action == "update" and serializer.validated_data.get("board", task.board) != task.board:
+                results[index].update(status=status.HTTP_403_FORBIDDEN,
+                                      errors={"board": "Changing the board association is not allowed."})
+                continue
+            validated.append((index, action, task, serializer))
+
+        self.check_memberships(request, validated, results)
+        if any("errors" in result for result in results):
+            return Response({"results": results}, status=status.HTTP_400_BAD_REQUEST)
+
+        self.perform_operations(validated, results)
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    def load_tasks(self, operations):
+        """Load all tasks referenced by update and delete operations with one query."""
+        ids = set()
+        for operation in operations:
+            if isinstance(operation, dict) and operation.get("action") in ("update", "delete"):
+                try:
+                    ids.add(int(operation.get("id")))
+                except (TypeError, ValueError):
+                    continue
+        return Task.objects.select_related("board").in_bulk(ids)
+
+    def prefetch_related_objects(self, operations):
+        """Load all boards and users referenced by the operations with one query each."""
+        board_ids, user_ids = set(), set()
+        for operation in operations:
+            data = operation.get("data") if isinstance(operation, dict) else None
+            if not isinstance(data, dict):
+                continue
+            board_ids.add(data.get("board"))
+            user_ids.update((data.get("assignee_id"), data.get("reviewer_id")))
+        return {
+            Board: Board.objects.in_bulk(self.clean_ids(board_ids)),
+            User: User.objects.in_bulk(self.clean_ids(user_ids)),
+        }
+
+    @staticmethod
+    def clean_ids(values):
+        ids = set()
+        for value in values:
+            try:
+                ids.add(int(value))
+            except (TypeError, ValueError):
+                continue
+        return ids
+
+    def validate_operation(self, operation, tasks, seen_ids):
+        """Validate the envelope of one operation, returning (status, errors) or None."""
+        if not isinstance(operation, dict) or operation.get("action") not in self.actions:
+            return status.HTTP_400_BAD_REQUEST, {"action": f"Must be one of: {', '.join(self.actions)}."}
+        if operation["action"] != "delete" and not isinstance(operation.get("data", {}), dict):
+            return status.HTTP_400_BAD_REQUEST, {"data": "Must be an object."}
+        if operation["action"] == "create":
+            return None
+        try:
+            task_id = int(operation.get("id"))
+        except (TypeError, ValueError):
+            return status.HTTP_400_BAD_REQUEST, {"id": "A valid task id is required."}
+        if task_id not in tasks:
+            return status.HTTP_404_NOT_FOUND, {"id": "Task not found."}
+        if task_id in seen_ids:
+            return status.HTTP_400_BAD_REQUEST, {"id": "A task may only appear in one operation."}
+        seen_ids.add(task_id)
+        operation["id"] = task_id
+        return None
+
+    def check_memberships(self, request, validated, results):
+        """Reject operations on boards the user is not a member of, resolving each board once."""
+        board_ids = {
+            serializer.validated_data["board"].pk if action == "create" else task.board_id
+            for _, action, task, serializer in validated
+        }
+        memberships = resolve_memberships(request, board_ids)
+        for index, action, task, serializer in validated:
+            board_id = serializer.validated_data["board"].pk if action == "create" else task.board_id
+            if not memberships[board_id]:
+                results[index].update(status=status.HTTP_403_FORBIDDEN,
+                                      errors={"detail": "You must be a member of the board to perform this action."})
+
+    def perform_operations(self, validated, results):
+        """Write all operations in one transaction and fill in the per-item results."""
+        created, updated, deleted_ids, update_fields = [], [], [], set()
+        for index, action, task, serializer in validated:
+            if action == "create":
+                created.append((index, Task(**serializer.validated_data)))
+            elif action == "update":
+                for field, value in serializer.validated_data.items():
+                    setattr(task, field, value)
+                    update_fields.add(field)
+                updated.append((index, task))
+            else:
+                deleted_ids.append(task.pk)
+                results[index].update(id=task.pk, status=status.HTTP_204_NO_CONTENT)
+
+        with transaction.atomic():
+            Task.objects.bulk_create([task for _, task in created])
+            if updated and update_fields:
+                Task.objects.bulk_update([task for _, task in updated], sorted(update_fields))
+                touch_tasks(task.pk for _, task in updated)
+            if deleted_ids:
+                Task.objects.filter(pk__in=deleted_ids).delete()
+            touch_boards(task.board_id for _, task in created + updated)
+            get_search_backend().tasks_changed(task.pk for _, task in created + updated)
+            record_tasks_saved([task for _, task in created], created=True)
+            record_tasks_saved([task for _, task in updated], created=False)
+            record_task_changes(
+                [(BoardChange.TASK_CREATED, task) for _, task in created]
+                + [(BoardChange.TASK_UPDATED, task) for _, task in updated]
+            )
+
+        for index, task in created:
+            results[index].update(id=task.pk, status=status.HTTP_201_CREATED, data=TaskDetailSerializer(task).data)
+        for index, task in updated:
+            results[index].update(id=task.pk, status=status.HTTP_200_OK, data=TaskDetailSerializer(task).data)
@@ -0,0 +1,27 @@
+"""
+Due date queries shared by the overdue / due-soon endpoints and the
+due digest command.
+
+A task is open until its status is "done". It is overdue when it is open
+and its due date lies before today, and due soon when it is open and due
+between today and `days` days from now (inclusive). Both filters match
+the (assignee, due_date, id, status) index: a due date range per assignee
+in list order, with the status checked inside the index so done tasks
+cost no table lookup.
+"""
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+OPEN = ~Q(status="done")
+
+
+def overdue(queryset, today=None):
+    today = today or timezone.localdate()
+    return queryset.filter(OPEN, due_date__lt=today)
+
+
+def due_soon(queryset, days, today=None):
+    today = today or timezone.localdate()
+    return queryset.filter(OPEN, due_date__gte=today, due_date__lte=today + timedelta(days=days))
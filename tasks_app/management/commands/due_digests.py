@@ -0,0 +1,72 @@
+import json
+from datetime import timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from tasks_app.due import OPEN
+from tasks_app.models import Task
+
+
+class Command(BaseCommand):
+    """
+    Compute the due digest of every user with open tasks that are overdue
+    or due within `--days` days, written as one JSON object per line:
+
+        {"user": 1, "email": "...", "overdue": 2, "due_soon": 1,
+         "tasks": [{"id": 7, "title": "...", "board": 3, "due_date": "...",
+                    "status": "to-do", "priority": "high", "overdue": true}]}
+
+    Meant to run from a scheduler (e.g. a daily cron job) that delivers
+    the digests. Tasks are streamed ordered by assignee with
+    QuerySet.iterator(), so only one chunk of rows and the digest of one
+    user are held in memory at a time, however large the task table is.
+    """
+    help = "Write per-user digests of overdue and soon due tasks as JSON lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=getattr(settings, "TASK_DUE_SOON_DAYS", 7),
+                            help="Look-ahead in days for soon due tasks.")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Rows fetched from the database per chunk.")
+        parser.add_argument("--max-tasks", type=int, default=20, help="Tasks listed per digest (all are counted).")
+        parser.add_argument("--output", help="Write the digests to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        rows = (
+            Task.objects.filter(OPEN, assignee__isnull=False, due_date__lte=today + timedelta(days=options["days"]))
+            .order_by("assignee_id", "due_date", "id")
+            .values_list("assignee_id", "assignee__email", "id", "title", "board_id", "due_date", "status", "priority")
+            .iterator(chunk_size=options["batch_size"])
+        )
+
+        output = open(options["output"], "w") if options["output"] else self.stdout
+        users = 0
+        try:
+            for (user_id, email), tasks in groupby(rows, key=lambda row: row[:2]):
+                digest = self.build_digest(user_id, email, tasks, today, options["max_tasks"])
+                output.write(json.dumps(digest) + "\n")
+                users += 1
+        finally:
+            if options["output"]:
+                output.close()
+        self.stderr.write(self.style.SUCCESS(f"Wrote {users} digest(s)."))
+
+    @staticmethod
+    def build_digest(user_id, email, rows, today, max_tasks):
+        digest = {"user": user_id, "email": email, "overdue": 0, "due_soon": 0, "tasks": []}
+        for _, _, task_id, title, board_id, due_date, status, priority in rows:
+            is_overdue = due_date < today
+            digest["overdue" if is_overdue else "due_soon"] += 1
+            if len(digest["tasks"]) < max_tasks:
+                digest["tasks"].append({
+                    "id": task_id,
+                    "title": title,
+                    "board": board_id,
+                    "due_date": due_date.isoformat(),
+                    "status": status,
+                    "priority": priority,
+                    "overdue": is_overdue,
+                })
+        return digest
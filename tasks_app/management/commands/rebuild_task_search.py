@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from tasks_app.search import get_backend
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the task search index from the tasks and comments tables.
+
+    The index is maintained on every write, so this is only needed after
+    writes that bypass the application (raw SQL, restored backups) or when
+    switching search backends. The rebuild runs in one transaction, so
+    searches keep seeing the old index until it is complete.
+    """
+    help = "Rebuild the full-text search index of tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of tasks indexed per batch.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            indexed = get_backend().rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} task(s)."))
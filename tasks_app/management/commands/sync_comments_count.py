@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from tasks_app.models import Comment, Task
+
+
+class Command(BaseCommand):
+    """
+    Reconcile the denormalized Task.comments_count column with the actual
+    number of comments.
+
+    Tasks are scanned in primary key ranges. For every range the drifted
+    tasks are corrected with a single UPDATE that recounts the comments at
+    write time, so comments created concurrently are not lost.
+    """
+    help = "Recalculate Task.comments_count for tasks whose counter has drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of tasks checked per batch.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report drifted tasks, do not update them.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+        actual = Coalesce(Subquery(
+            Comment.objects
+            .filter(task=OuterRef("pk"))
+            .order_by()
+            .values("task")
+            .annotate(count=Count("pk"))
+            .values("count")
+        ), 0)
+
+        fixed = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                Task.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            last_pk = pks[-1]
+
+            drifted = list(
+                Task.objects.filter(pk__in=pks)
+                .annotate(actual=actual)
+                .exclude(comments_count=F("actual"))
+                .values_list("pk", flat=True)
+            )
+            if drifted and not dry_run:
+                with transaction.atomic():
+                    Task.objects.filter(pk__in=drifted).update(comments_count=actual)
+            fixed += len(drifted)
+
+        verb = "Found" if dry_run else "Fixed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {fixed} task(s) with a drifted comments_count."))
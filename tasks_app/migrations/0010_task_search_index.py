@@ -0,0 +1,35 @@
+from django.db import migrations
+
+FTS_TABLE = "tasks_app_task_fts"
+
+
+def create_index(apps, schema_editor):
+    """Create and fill the FTS5 task index (SQLite only, see tasks_app.search)."""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "title, description, comments, board_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        f"INSERT INTO {FTS_TABLE} (rowid, title, description, comments, board_id) "
+        "SELECT t.id, t.title, coalesce(t.description, ''), "
+        "coalesce((SELECT group_concat(c.content, ' ') FROM tasks_app_comment c WHERE c.task_id = t.id), ''), "
+        "t.board_id FROM tasks_app_task t"
+    )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_app', '0009_version_markers'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
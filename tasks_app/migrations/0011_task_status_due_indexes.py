@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_board_change_log'),
+        ('tasks_app', '0010_task_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'status', 'due_date', 'id'], name='task_assignee_status_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['reviewer', 'status', 'due_date', 'id'], name='task_reviewer_status_due_idx'),
+        ),
+    ]
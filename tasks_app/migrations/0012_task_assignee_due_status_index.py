@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_stats'),
+        ('tasks_app', '0011_task_status_due_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'due_date', 'status'], name='task_assignee_due_status_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_stats'),
+        ('tasks_app', '0012_task_assignee_due_status_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_assignee_due_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_assignee_due_status_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'due_date', 'id', 'status'], name='task_assignee_due_idx'),
+        ),
+    ]
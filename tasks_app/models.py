@@ -26,9 +26,37 @@ class Task(models.Model):
     reviewer = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="reviewed_tasks")
     due_date = models.DateField()
     comments_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            # status trails the key, so due date lists of open tasks skip done
+            # tasks inside the index while keeping the (due_date, id) order.
+            models.Index(fields=["assignee", "due_date", "id", "status"], name="task_assignee_due_idx"),
+            models.Index(fields=["reviewer", "due_date", "id"], name="task_reviewer_due_idx"),
+            models.Index(fields=["assignee", "status", "due_date", "id"], name="task_assignee_status_due_idx"),
+            models.Index(fields=["reviewer", "status", "due_date", "id"], name="task_reviewer_status_due_idx"),
+            models.Index(fields=["board", "status"], name="task_board_status_idx"),
+            models.Index(fields=["board", "priority"], name="task_board_priority_idx"),
+        ]
+
+    # Columns counted by the board statistics (see tasks_app.stats).
+    STATS_FIELDS = ("board_id", "status", "priority", "assignee_id", "due_date")
 
     def __str__(self):
         return f"{self.title}({self.title})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded statistics columns, so saves can update the counters by difference."""
+        instance = super().from_db(db, field_names, values)
+        if all(name in instance.__dict__ for name in cls.STATS_FIELDS):
+            instance._stats_values = instance.get_stats_values()
+        return instance
+
+    def get_stats_values(self):
+        return tuple(getattr(self, name) for name in self.STATS_FIELDS)
     
 
 
@@ -38,5 +66,10 @@ class Comment(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["task", "created_at", "id"], name="comment_task_created_idx"),
+        ]
+
     def __str__(self):
             return f"{self.author.fullname}: {self.content[:30]}"
@@ -0,0 +1,182 @@
+"""
+Full-text search over tasks and their comments.
+
+The active backend is chosen with the TASK_SEARCH_BACKEND setting (dotted
+path to a SearchBackend subclass):
+
+- SQLiteFTS5Backend keeps an FTS5 inverted index (tasks_app_task_fts, one
+  row per task with its title, description and concatenated comments) and
+  ranks matches with bm25. The index is written in the same transaction as
+  the task and comment changes, through the hooks below.
+- BasicSearchBackend needs no index and matches with icontains, for
+  databases without FTS5; results are ordered by due date instead of rank.
+
+Write paths call the hooks (task_saved, tasks_changed, tasks_deleted,
+comments_changed) from tasks_app.signals and from the bulk endpoint, which
+bypasses signals for creates and updates.
+"""
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils.module_loading import import_string
+from boards_app.models import Board
+from tasks_app.models import Comment, Task
+
+FTS_TABLE = "tasks_app_task_fts"
+MAX_TERMS = 8
+
+
+class SearchBackend:
+    """Interface of the task search backends."""
+
+    def task_saved(self, task, created):
+        """Index the title, description and board of a saved task."""
+
+    def tasks_changed(self, task_ids):
+        """Re-index the given tasks completely (bulk writes)."""
+
+    def tasks_deleted(self, task_ids):
+        """Remove the given tasks from the index."""
+
+    def comments_changed(self, task_id):
+        """Re-index the comments of a task."""
+
+    def rebuild(self, batch_size=1000):
+        """Rebuild the whole index; returns the number of indexed tasks."""
+        return 0
+
+    def search(self, user, query, limit, offset=0):
+        """
+        Return the ids of the tasks on boards `user` owns or is a member of
+        that match `query`, best match first.
+        """
+        raise NotImplementedError
+
+
+def accessible_boards(user):
+    memberships = Board.members.through.objects.filter(user=user).values("board_id")
+    return Board.objects.filter(Q(owner=user) | Q(pk__in=memberships)).values("pk")
+
+
+class BasicSearchBackend(SearchBackend):
+    """Index free fallback matching every term with icontains."""
+
+    def search(self, user, query, limit, offset=0):
+        terms = re.findall(r"\w+", query)[:MAX_TERMS]
+        if not terms:
+            return []
+        queryset = Task.objects.filter(board__in=accessible_boards(user))
+        for term in terms:
+            matches = Comment.objects.filter(content__icontains=term).values("task_id")
+            queryset = queryset.filter(
+                Q(title__icontains=term) | Q(description__icontains=term) | Q(pk__in=matches)
+            )
+        return list(queryset.order_by("due_date", "pk").values_list("pk", flat=True)[offset:offset + limit])
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """FTS5 inverted index ranked with bm25 (title > description > comments)."""
+    weights = (10.0, 5.0, 1.0)
+
+    @staticmethod
+    def build_match(query):
+        """
+        Turn free text into an FTS5 query: every word becomes a quoted prefix
+        term and all terms must match. Operators typed by users are ignored.
+        """
+        terms = re.findall(r"\w+", query)[:MAX_TERMS]
+        return " AND ".join(f'"{term}"*' for term in terms)
+
+    def task_saved(self, task, created):
+        with connection.cursor() as cursor:
+            if not created:
+                cursor.execute(
+                    f"UPDATE {FTS_TABLE} SET title = %s, description = %s, board_id = %s WHERE rowid = %s",
+                    [task.title, task.description or "", task.board_id, task.pk],
+                )
+                if cursor.rowcount:
+                    return
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description, comments, board_id) VALUES (%s, %s, %s, '', %s)",
+                [task.pk, task.title, task.description or "", task.board_id],
+            )
+        if not created:
+            self.comments_changed(task.pk)
+
+    def tasks_changed(self, task_ids):
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+        self.tasks_deleted(task_ids)
+        self.index(Task.objects.filter(pk__in=task_ids))
+
+    def tasks_deleted(self, task_ids):
+        task_ids = list(task_ids)
+        if task_ids:
+            with connection.cursor() as cursor:
+                placeholders = ", ".join(["%s"] * len(task_ids))
+                cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})", task_ids)
+
+    def comments_changed(self, task_id):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {FTS_TABLE} SET comments = coalesce("
+                f"(SELECT group_concat(content, ' ') FROM {Comment._meta.db_table} WHERE task_id = %s), '') "
+                f"WHERE rowid = %s",
+                [task_id, task_id],
+            )
+
+    def index(self, tasks):
+        """Insert complete index rows for the given task queryset."""
+        rows = list(tasks.values_list("pk", "title", "description", "board_id"))
+        if not rows:
+            return
+        comments = {}
+        for task_id, content in (
+            Comment.objects.filter(task_id__in=[row[0] for row in rows]).order_by("pk").values_list("task_id", "content")
+        ):
+            comments.setdefault(task_id, []).append(content)
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description, comments, board_id) VALUES (%s, %s, %s, %s, %s)",
+                [
+                    (pk, title, description or "", " ".join(comments.get(pk, ())), board_id)
+                    for pk, title, description, board_id in rows
+                ],
+            )
+
+    def rebuild(self, batch_size=1000):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        ids = Task.objects.order_by("pk").values_list("pk", flat=True)
+        indexed, last = 0, 0
+        while True:
+            batch = list(ids.filter(pk__gt=last)[:batch_size])
+            if not batch:
+                return indexed
+            self.index(Task.objects.filter(pk__in=batch))
+            indexed += len(batch)
+            last = batch[-1]
+
+    def search(self, user, query, limit, offset=0):
+        match = self.build_match(query)
+        if not match:
+            return []
+        boards_sql, boards_params = accessible_boards(user).query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND board_id IN ({boards_sql}) "
+                f"ORDER BY bm25({FTS_TABLE}, %s, %s, %s), rowid LIMIT %s OFFSET %s",
+                [match, *boards_params, *self.weights, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+@lru_cache(maxsize=None)
+def get_backend():
+    """Return the configured search backend instance."""
+    path = getattr(settings, "TASK_SEARCH_BACKEND", "tasks_app.search.SQLiteFTS5Backend")
+    return import_string(path)()
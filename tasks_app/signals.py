@@ -0,0 +1,171 @@
+from collections import Counter
+
+from django.contrib.auth.models import User
+from django.db.models import F, Q, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from boards_app.changes import record_changes
+from boards_app.membership import invalidate_board
+from boards_app.models import Board, BoardChange
+from boards_app.versioning import touch_boards
+from tasks_app.models import Comment, Task
+from tasks_app.search import get_backend as get_search_backend
+from tasks_app.stats import record_assignee_deleted, record_author_deleted, record_comment, record_task_deleted, record_tasks_saved
+from tasks_app.versioning import touch_tasks
+
+
+def deleted_directly(origin, model):
+    """
+    Return True if a delete originated from `model` itself rather than from
+    a cascade (e.g. comments removed because their task or board was deleted).
+    """
+    if isinstance(origin, QuerySet):
+        return origin.model is model
+    return isinstance(origin, model)
+
+
+def get_board_id(comment):
+    """Return the board id of a comment's task, using the cached task if present."""
+    if Comment.task.is_cached(comment) and comment.task is not None:
+        return comment.task.board_id
+    return Task.objects.filter(pk=comment.task_id).values_list("board_id", flat=True).first()
+
+
+@receiver(post_save, sender=Task)
+def track_task_save(sender, instance, created, **kwargs):
+    """A saved task changes its own payload (if updated) and its board's."""
+    if not created:
+        touch_tasks([instance.pk])
+    touch_boards([instance.board_id])
+    kind = BoardChange.TASK_CREATED if created else BoardChange.TASK_UPDATED
+    record_changes(instance.board_id, kind, [instance.pk])
+    get_search_backend().task_saved(instance, created)
+    record_tasks_saved([instance], created)
+
+
+@receiver(pre_delete, sender=Task)
+def track_task_stats_delete(sender, instance, origin=None, **kwargs):
+    """Subtract the task and its comments from the board statistics while they still exist."""
+    if not deleted_directly(origin, Board):
+        record_task_deleted(instance)
+
+
+@receiver(post_delete, sender=Task)
+def track_task_delete(sender, instance, origin=None, **kwargs):
+    get_search_backend().tasks_deleted([instance.pk])
+    if deleted_directly(origin, Task):
+        touch_boards([instance.board_id])
+        record_changes(instance.board_id, BoardChange.TASK_DELETED, [instance.pk])
+
+
+@receiver(post_save, sender=Comment)
+def track_comment_save(sender, instance, created, **kwargs):
+    """Comments change the comment count of their task and thus the board payload."""
+    if instance.task_id is None:
+        return
+    board_id = get_board_id(instance)
+    touch_tasks([instance.task_id])
+    touch_boards([board_id])
+    get_search_backend().comments_changed(instance.task_id)
+    if created:
+        record_comment(board_id, instance, 1)
+        record_changes(board_id, BoardChange.COMMENT_ADDED, [instance.pk], parent_id=instance.task_id)
+
+
+@receiver(post_delete, sender=Comment)
+def track_comment_delete(sender, instance, origin=None, **kwargs):
+    if instance.task_id is None or not deleted_directly(origin, Comment):
+        return
+    board_id = get_board_id(instance)
+    touch_tasks([instance.task_id])
+    touch_boards([board_id])
+    get_search_backend().comments_changed(instance.task_id)
+    record_comment(board_id, instance, -1)
+    record_changes(board_id, BoardChange.COMMENT_DELETED, [instance.pk], parent_id=instance.task_id)
+
+
+@receiver(pre_delete, sender=User)
+def track_user_delete(sender, instance, **kwargs):
+    """
+    Deleting a user unassigns their tasks (SET_NULL), deletes their comments
+    (CASCADE) and removes their memberships (m2m cascade), all without task,
+    comment or m2m signals: update the statistics and comment counts, bump
+    the versions of the affected tasks and boards and record the changes for
+    delta sync. Boards the user owns are deleted with them and are skipped.
+    """
+    user_id = instance.pk
+    record_assignee_deleted(user_id)
+    record_author_deleted(user_id)
+
+    comments = list(
+        Comment.objects.filter(author_id=user_id, task__isnull=False)
+        .exclude(task__board__owner_id=user_id)
+        .values_list("pk", "task_id", "task__board_id")
+    )
+    per_task = Counter(task_id for _, task_id, _ in comments)
+    by_count = {}
+    for task_id, count in per_task.items():
+        by_count.setdefault(count, []).append(task_id)
+    for count, task_ids in by_count.items():
+        Task.objects.filter(pk__in=task_ids).update(comments_count=F("comments_count") - count)
+    instance._commented_task_ids = list(per_task)
+
+    assigned = (
+        Task.objects.filter(Q(assignee_id=user_id) | Q(reviewer_id=user_id))
+        .exclude(board__owner_id=user_id)
+        .values_list("pk", "board_id")
+    )
+    updated_tasks = {task_id: board_id for _, task_id, board_id in comments}
+    updated_tasks.update(assigned)
+    member_boards = list(Board.objects.filter(members=user_id).exclude(owner_id=user_id).values_list("pk", flat=True))
+
+    touch_tasks(updated_tasks)
+    touch_boards({*updated_tasks.values(), *member_boards})
+    tasks_by_board = {}
+    for task_id, board_id in updated_tasks.items():
+        tasks_by_board.setdefault(board_id, []).append(task_id)
+    for board_id, task_ids in tasks_by_board.items():
+        record_changes(board_id, BoardChange.TASK_UPDATED, sorted(task_ids))
+    comments_by_task = {}
+    for comment_id, task_id, board_id in comments:
+        comments_by_task.setdefault((board_id, task_id), []).append(comment_id)
+    for (board_id, task_id), comment_ids in comments_by_task.items():
+        record_changes(board_id, BoardChange.COMMENT_DELETED, comment_ids, parent_id=task_id)
+    for board_id in member_boards:
+        invalidate_board(board_id)
+        record_changes(board_id, BoardChange.MEMBER_REMOVED, [user_id])
+
+
+@receiver(post_delete, sender=User)
+def track_user_comments_delete(sender, instance, **kwargs):
+    """Re-index the tasks the deleted user had commented on, now without their comments."""
+    get_search_backend().tasks_changed(getattr(instance, "_commented_task_ids", ()))
+
+
+USER_PAYLOAD_FIELDS = ("first_name", "last_name", "email")
+
+
+@receiver(pre_save, sender=User)
+def remember_user_payload(sender, instance, update_fields=None, **kwargs):
+    """Load the stored name and email of an updated user (skipped for e.g. last_login updates)."""
+    instance._payload_changed = False
+    if instance.pk is None or (update_fields is not None and not set(update_fields) & set(USER_PAYLOAD_FIELDS)):
+        return
+    stored = User.objects.filter(pk=instance.pk).values_list(*USER_PAYLOAD_FIELDS).first()
+    instance._payload_changed = stored is not None and stored != tuple(getattr(instance, name) for name in USER_PAYLOAD_FIELDS)
+
+
+@receiver(post_save, sender=User)
+def track_user_save(sender, instance, created, **kwargs):
+    """
+    Board and task payloads embed members, assignees and reviewers by name
+    and email: a renamed user changes the versions of every board they own
+    or belong to and of every task they are assigned to or reviewing.
+    """
+    if created or not getattr(instance, "_payload_changed", False):
+        return
+    tasks = Task.objects.filter(Q(assignee_id=instance.pk) | Q(reviewer_id=instance.pk)).order_by()
+    task_boards = set(tasks.values_list("board_id", flat=True).distinct())
+    touch_tasks(tasks.values_list("pk", flat=True))
+    boards = Board.objects.filter(Q(owner_id=instance.pk) | Q(members=instance.pk)).values_list("pk", flat=True)
+    touch_boards(task_boards | set(boards))
@@ -0,0 +1,220 @@
+"""
+Incrementally maintained board statistics (boards_app.models.BoardStat).
+
+Every task contributes one count to its board's status, priority and
+assignee counters and, while not done, to the counter of its due date;
+every comment contributes to the counter of the day it was written.
+Writes translate into +1/-1 deltas on those rows:
+
+- task saves compare the values loaded from the database (Task.from_db)
+  with the saved ones, so an update touches only the counters that moved;
+- task deletes subtract the task and its comments (before the cascade);
+- comment writes add or subtract one from their day;
+- user deletes move their tasks to the unassigned counter and subtract
+  their comments (both happen by cascade, without task/comment signals).
+
+Overdue tasks are derived at read time from the open due date counters, so
+no counter has to change when a day passes. Board deletes drop the rows
+through the foreign key cascade.
+"""
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from boards_app.models import BoardStat
+from tasks_app.models import Comment, Task
+
+
+def task_keys(values):
+    """Return the (board_id, dimension, key) counters a task with the given STATS_FIELDS values counts in."""
+    board_id, status, priority, assignee_id, due_date = values
+    keys = [
+        (board_id, BoardStat.STATUS, status),
+        (board_id, BoardStat.PRIORITY, priority),
+        (board_id, BoardStat.ASSIGNEE, str(assignee_id or "")),
+    ]
+    if status != "done":
+        keys.append((board_id, BoardStat.OPEN_DUE, str(due_date)))
+    return keys
+
+
+def comment_day(created_at):
+    return str(timezone.localdate(created_at))
+
+
+def apply_deltas(deltas):
+    """
+    Add a Counter of (board_id, dimension, key) -> delta to the stored
+    counters: one insert for missing rows and one UPDATE per distinct delta.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    BoardStat.objects.bulk_create(
+        [BoardStat(board_id=board_id, dimension=dimension, key=key) for board_id, dimension, key in deltas],
+        ignore_conflicts=True,
+    )
+    by_delta = {}
+    for key, delta in deltas.items():
+        by_delta.setdefault(delta, []).append(key)
+    for delta, keys in by_delta.items():
+        condition = reduce(or_, (Q(board_id=board_id, dimension=dimension, key=key) for board_id, dimension, key in keys))
+        BoardStat.objects.filter(condition).update(count=F("count") + delta)
+
+
+def record_tasks_saved(tasks, created):
+    """
+    Update the counters for saved tasks (all created or all updated).
+    Updated tasks without loaded values (not read from the database) cause
+    a rebuild of their board's task counters.
+    """
+    deltas, stale_boards = Counter(), set()
+    for task in tasks:
+        old = None if created else getattr(task, "_stats_values", None)
+        if old is None and not created:
+            stale_boards.add(task.board_id)
+        else:
+            deltas.subtract(task_keys(old) if old else ())
+            deltas.update(task_keys(task.get_stats_values()))
+        task._stats_values = task.get_stats_values()
+    apply_deltas(deltas)
+    for board_id in stale_boards:
+        rebuild_board(board_id, dimensions=(BoardStat.STATUS, BoardStat.PRIORITY, BoardStat.ASSIGNEE, BoardStat.OPEN_DUE))
+
+
+def record_task_deleted(task):
+    """Subtract a task that is about to be deleted, together with its comments."""
+    deltas = Counter()
+    deltas.subtract(task_keys(getattr(task, "_stats_values", None) or task.get_stats_values()))
+    days = (
+        Comment.objects.filter(task_id=task.pk)
+        .annotate(day=TruncDate("created_at"))
+        .order_by()
+        .values("day")
+        .annotate(count=Count("pk"))
+        .values_list("day", "count")
+    )
+    for day, count in days:
+        deltas[(task.board_id, BoardStat.COMMENTS, str(day))] -= count
+    apply_deltas(deltas)
+
+
+def record_comment(board_id, comment, delta):
+    if board_id is not None:
+        apply_deltas(Counter({(board_id, BoardStat.COMMENTS, comment_day(comment.created_at)): delta}))
+
+
+def record_comments_created(board_id, comments):
+    """Add many new comments of one board (bulk inserts) with one delta per day."""
+    apply_deltas(Counter((board_id, BoardStat.COMMENTS, comment_day(comment.created_at)) for comment in comments))
+
+
+def record_assignee_deleted(user_id):
+    """Move the tasks of a user that is about to be deleted to the unassigned counters."""
+    deltas = Counter()
+    rows = Task.objects.filter(assignee_id=user_id).order_by().values("board_id").annotate(count=Count("pk"))
+    for board_id, count in rows.values_list("board_id", "count"):
+        deltas[(board_id, BoardStat.ASSIGNEE, str(user_id))] -= count
+        deltas[(board_id, BoardStat.ASSIGNEE, "")] += count
+    apply_deltas(deltas)
+
+
+def record_author_deleted(user_id):
+    """
+    Subtract the comments of a user that is about to be deleted: the
+    cascade removes them without comment signals. Boards the user owns are
+    deleted with them (counters included) and are skipped.
+    """
+    days = (
+        Comment.objects.filter(author_id=user_id, task__isnull=False)
+        .exclude(task__board__owner_id=user_id)
+        .annotate(day=TruncDate("created_at"))
+        .order_by()
+        .values("task__board_id", "day")
+        .annotate(count=Count("pk"))
+        .values_list("task__board_id", "day", "count")
+    )
+    deltas = Counter()
+    for board_id, day, count in days:
+        deltas[(board_id, BoardStat.COMMENTS, str(day))] -= count
+    apply_deltas(deltas)
+
+
+def rebuild_board(board_id, dimensions=None):
+    """Recompute the counters of one board (all or the given dimensions) from its tasks and comments."""
+    dimensions = set(dimensions or dict(BoardStat.DIMENSION_CHOICES))
+    tasks = Task.objects.filter(board_id=board_id).order_by()
+    counts = Counter()
+    if dimensions - {BoardStat.COMMENTS}:
+        rows = tasks.values(*Task.STATS_FIELDS).annotate(count=Count("pk"))
+        for row in rows:
+            for key in task_keys(tuple(row[name] for name in Task.STATS_FIELDS)):
+                if key[1] in dimensions:
+                    counts[key] += row["count"]
+    if BoardStat.COMMENTS in dimensions:
+        days = (
+            Comment.objects.filter(task__board_id=board_id)
+            .annotate(day=TruncDate("created_at"))
+            .order_by()
+            .values("day")
+            .annotate(count=Count("pk"))
+            .values_list("day", "count")
+        )
+        for day, count in days:
+            counts[(board_id, BoardStat.COMMENTS, str(day))] = count
+
+    with transaction.atomic():
+        BoardStat.objects.filter(board_id=board_id, dimension__in=dimensions).delete()
+        BoardStat.objects.bulk_create(
+            BoardStat(board_id=board_id, dimension=dimension, key=key, count=count)
+            for (_, dimension, key), count in counts.items() if count
+        )
+
+
+def get_board_stats(board_id, days):
+    """
+    Return the dashboard payload of a board from its counters (one query):
+    task counts per status, priority and assignee, the number of overdue
+    open tasks and the comments of each of the last `days` days.
+    """
+    today = timezone.localdate()
+    since = today - timedelta(days=days - 1)
+    rows = BoardStat.objects.filter(board_id=board_id, count__gt=0).exclude(
+        dimension=BoardStat.COMMENTS, key__lt=str(since)
+    ).values_list("dimension", "key", "count")
+
+    by_status = {value: 0 for value, _ in Task.STATUS_CHOICES}
+    by_priority = {value: 0 for value, _ in Task.PRIORITY_CHOICES}
+    by_assignee, comments, overdue = [], {}, 0
+    for dimension, key, count in rows:
+        if dimension == BoardStat.STATUS:
+            by_status[key] = count
+        elif dimension == BoardStat.PRIORITY:
+            by_priority[key] = count
+        elif dimension == BoardStat.ASSIGNEE:
+            by_assignee.append({"assignee": int(key) if key else None, "count": count})
+        elif dimension == BoardStat.OPEN_DUE:
+            if key < str(today):
+                overdue += count
+        else:
+            comments[key] = count
+
+    return {
+        "board": board_id,
+        "tasks": {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_priority": by_priority,
+            "by_assignee": sorted(by_assignee, key=lambda item: (item["assignee"] is None, item["assignee"] or 0)),
+            "overdue": overdue,
+        },
+        "comments_per_day": [
+            {"date": str(day), "count": comments.get(str(day), 0)}
+            for day in (since + timedelta(days=offset) for offset in range(days))
+        ],
+    }
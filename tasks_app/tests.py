@@ -1,3 +1,614 @@
-from django.test import TestCase
+import json
+from datetime import date, timedelta
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from boards_app.models import Board
+from tasks_app.models import Comment, Task
+from user_auth_app.models import AuthToken
+
+
+class TaskAPITestCase(APITestCase):
+    """Shared fixtures: an authenticated board member with one task."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="member@example.com", email="member@example.com", password="secret123")
+        self.token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.user)
+        self.task = Task.objects.create(board=self.board, title="Task", due_date=date(2030, 1, 1))
+
+
+class CommentsCountTests(TaskAPITestCase):
+    """Tests for the denormalized Task.comments_count column."""
+
+    def test_create_and_delete_comment_maintain_counter(self):
+        url = reverse("create-comments", kwargs={"task_id": self.task.pk})
+        first = self.client.post(url, {"content": "First"})
+        self.client.post(url, {"content": "Second"})
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 2)
+
+        delete_url = reverse("delete-comments", kwargs={"task_id": self.task.pk, "pk": first.data["id"]})
+        response = self.client.delete(delete_url)
+        self.assertEqual(response.status_code, 204)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 1)
+
+        response = self.client.get(reverse("detail-task", kwargs={"pk": self.task.pk}))
+        self.assertEqual(response.data["comments_count"], 1)
+
+    def test_deleting_a_user_decrements_counter_of_their_comments(self):
+        author = User.objects.create_user(username="author@example.com", password="secret123")
+        other = Task.objects.create(board=self.board, title="Other", due_date=date(2030, 1, 1))
+        url = reverse("create-comments", kwargs={"task_id": self.task.pk})
+        self.client.post(url, {"content": "Mine"})
+        for task in (self.task, self.task, other):
+            Comment.objects.create(author=author, task=task, content="Theirs")
+        # Comments created outside the API do not maintain the counter.
+        Task.objects.filter(pk=self.task.pk).update(comments_count=3)
+        Task.objects.filter(pk=other.pk).update(comments_count=1)
+        version = Task.objects.get(pk=self.task.pk).version
+
+        author.delete()
+
+        self.task.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((self.task.comments_count, other.comments_count), (1, 0))
+        self.assertGreater(self.task.version, version)
+
+    def test_sync_command_reconciles_drift(self):
+        Comment.objects.create(author=self.user, task=self.task, content="Untracked")
+        other = Task.objects.create(board=self.board, title="Other", due_date=date(2030, 1, 1), comments_count=5)
+
+        out = StringIO()
+        call_command("sync_comments_count", batch_size=1, stdout=out)
+
+        self.task.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 1)
+        self.assertEqual(other.comments_count, 0)
+        self.assertIn("Fixed 2 task(s)", out.getvalue())
+
+
+class KeysetPaginationTests(TaskAPITestCase):
+    """Tests for cursor pagination on the task and comment lists."""
+
+    def collect_pages(self, url, params):
+        ids = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids.extend(item["id"] for item in response.data["results"])
+            if response.data["next"] is None:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_assigned_tasks_are_paged_by_due_date_and_id(self):
+        self.task.delete()
+        tasks = [
+            Task.objects.create(board=self.board, title=f"Task {day}", assignee=self.user, due_date=date(2030, 1, day % 3 + 1))
+            for day in range(7)
+        ]
+        expected = [task.id for task in sorted(tasks, key=lambda task: (task.due_date, task.id))]
+
+        ids = self.collect_pages(reverse("assigned-tasks"), {"page_size": 2})
+
+        self.assertEqual(ids, expected)
+
+    def test_unpaginated_request_returns_plain_list(self):
+        self.task.assignee = self.user
+        self.task.save()
+        response = self.client.get(reverse("assigned-tasks"))
+        self.assertEqual([item["id"] for item in response.data], [self.task.id])
+
+    def test_comments_are_paged(self):
+        comments = [Comment.objects.create(author=self.user, task=self.task, content=str(i)) for i in range(5)]
+        url = reverse("create-comments", kwargs={"task_id": self.task.pk})
+
+        ids = self.collect_pages(url, {"page_size": 2})
+
+        self.assertEqual(ids, [comment.id for comment in comments])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(reverse("assigned-tasks"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+
+class CommentListTests(TaskAPITestCase):
+    """Tests for the ordering and query count of the comment list."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("create-comments", kwargs={"task_id": self.task.pk})
+        self.comments = []
+        for n in range(4):
+            author = User.objects.create_user(username=f"author{n}@example.com", password="x", first_name=f"Author {n}")
+            self.comments.append(Comment.objects.create(author=author, task=self.task, content=str(n)))
+
+    def count_queries(self, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_authors_are_loaded_in_the_comment_query(self):
+        self.count_queries()  # warm the token and membership caches
+        few, response = self.count_queries()
+        self.assertEqual([item["author"] for item in response.data], [f"Author {n}" for n in range(4)])
+        for n in range(4, 20):
+            author = User.objects.create_user(username=f"author{n}@example.com", password="x")
+            Comment.objects.create(author=author, task=self.task, content=str(n))
+
+        many, response = self.count_queries()
+
+        self.assertEqual(len(response.data), 20)
+        self.assertEqual(many, few)
+        self.assertEqual(self.count_queries({"page_size": 20})[0], few)
+
+    def test_newest_first_ordering_and_paging(self):
+        newest = [comment.id for comment in reversed(self.comments)]
+        response = self.client.get(self.url, {"ordering": "newest"})
+        self.assertEqual([item["id"] for item in response.data], newest)
+
+        first = self.client.get(self.url, {"ordering": "newest", "page_size": 3})
+        second = self.client.get(first.data["next"])
+
+        self.assertEqual([item["id"] for item in first.data["results"] + second.data["results"]], newest)
+        self.assertIsNone(second.data["next"])
+
+    def test_unknown_ordering_is_rejected(self):
+        response = self.client.get(self.url, {"ordering": "author"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ordering", response.data)
+
+    async def test_async_list_supports_ordering(self):
+        response = await self.async_client.get(
+            reverse("async-comments", kwargs={"task_id": self.task.pk}), {"ordering": "newest"},
+            headers={"Authorization": f"Token {self.token.key}"},
+        )
+        self.assertEqual([item["id"] for item in json.loads(response.content)],
+                         [comment.id for comment in reversed(self.comments)])
+
+
+class TaskListFilterTests(TaskAPITestCase):
+    """Tests for the filter and ordering parameters of the "my tasks" lists."""
+
+    def setUp(self):
+        super().setUp()
+        self.task.delete()
+        self.other_board = Board.objects.create(title="Other", owner=self.user)
+        self.tasks = {
+            name: Task.objects.create(board=board, title=name, assignee=self.user, reviewer=self.user,
+                                      status=task_status, priority=priority, due_date=due_date)
+            for name, board, task_status, priority, due_date in [
+                ("a", self.board, "to-do", "high", date(2030, 1, 3)),
+                ("b", self.board, "done", "low", date(2030, 1, 1)),
+                ("c", self.other_board, "review", "high", date(2030, 1, 2)),
+                ("d", self.board, "to-do", "medium", date(2030, 1, 4)),
+            ]
+        }
+
+    def titles(self, params, name="assigned-tasks"):
+        response = self.client.get(reverse(name), params)
+        self.assertEqual(response.status_code, 200)
+        return [item["title"] for item in response.data]
+
+    def test_filters_are_combined(self):
+        self.assertEqual(self.titles({"status": "to-do,review"}), ["c", "a", "d"])
+        self.assertEqual(self.titles({"priority": "high", "board": self.board.pk}), ["a"])
+        self.assertEqual(self.titles({"due_after": "2030-01-02", "due_before": "2030-01-03"}, "reviewed-tasks"), ["c", "a"])
+
+    def test_ordering(self):
+        self.assertEqual(self.titles({"ordering": "-due_date"}), ["d", "a", "c", "b"])
+        self.assertEqual(self.titles({"ordering": "status"}), ["b", "c", "a", "d"])
+
+    def test_ordering_is_kept_across_pages(self):
+        response = self.client.get(reverse("assigned-tasks"), {"ordering": "-due_date", "status": "to-do,done", "page_size": 2})
+        titles = [item["title"] for item in response.data["results"]]
+        titles += [item["title"] for item in self.client.get(response.data["next"]).data["results"]]
+        self.assertEqual(titles, ["d", "a", "b"])
+
+    def test_invalid_parameters_are_rejected(self):
+        for params in ({"ordering": "title"}, {"status": "later"}, {"board": "x"},
+                       {"due_before": "tomorrow"}, {"due_after": "2030-02-01", "due_before": "2030-01-01"}):
+            with self.subTest(params):
+                response = self.client.get(reverse("assigned-tasks"), params)
+                self.assertEqual(response.status_code, 400)
+
+    async def test_async_view_applies_filters(self):
+        response = await self.async_client.get(reverse("async-assigned-tasks"), {"status": "to-do", "ordering": "-due_date"},
+                                               headers={"Authorization": f"Token {self.token.key}"})
+        self.assertEqual([task["title"] for task in json.loads(response.content)], ["d", "a"])
+
+        invalid = await self.async_client.get(reverse("async-assigned-tasks"), {"ordering": "title"},
+                                              headers={"Authorization": f"Token {self.token.key}"})
+        self.assertEqual(invalid.status_code, 400)
+        self.assertIn("ordering", json.loads(invalid.content))
+
+
+    def test_sparse_fieldset(self):
+        response = self.client.get(reverse("assigned-tasks"), {"fields": "id,status,assignee,reviewer", "expand": "assignee"})
+
+        item = response.data[0]
+        self.assertEqual(set(item), {"id", "status", "assignee", "reviewer"})
+        self.assertEqual(item["assignee"]["id"], self.user.pk)
+        self.assertEqual(item["reviewer"], self.user.pk)
+
+        detail = self.client.get(reverse("detail-task", kwargs={"pk": self.tasks["a"].pk}), {"fields": "id,title"})
+        self.assertEqual(detail.data, {"id": self.tasks["a"].pk, "title": "a"})
+
+class DueTaskTests(TaskAPITestCase):
+    """Tests for the overdue / due-soon lists and the due_digests command."""
+
+    def setUp(self):
+        super().setUp()
+        self.task.delete()
+        today = timezone.localdate()
+        self.other = User.objects.create_user(username="other@example.com", email="other@example.com", password="secret123")
+        self.tasks = {
+            name: Task.objects.create(board=self.board, title=name, assignee=assignee, status=task_status,
+                                      due_date=today + timedelta(days=offset))
+            for name, assignee, task_status, offset in [
+                ("late", self.user, "to-do", -3),
+                ("later", self.user, "review", -1),
+                ("finished", self.user, "done", -2),
+                ("today", self.user, "to-do", 0),
+                ("next week", self.user, "in-progress", 7),
+                ("next month", self.user, "to-do", 30),
+                ("not mine", self.other, "to-do", -1),
+            ]
+        }
+
+    def titles(self, name, params=None):
+        response = self.client.get(reverse(name), params or {})
+        self.assertEqual(response.status_code, 200)
+        return [item["title"] for item in response.data]
+
+    def test_overdue_lists_open_past_tasks(self):
+        self.assertEqual(self.titles("overdue-tasks"), ["late", "later"])
+
+    def test_due_soon_respects_days(self):
+        self.assertEqual(self.titles("due-soon-tasks"), ["today", "next week"])
+        self.assertEqual(self.titles("due-soon-tasks", {"days": 0}), ["today"])
+        self.assertEqual(self.client.get(reverse("due-soon-tasks"), {"days": 1000}).status_code, 400)
+
+    def test_digest_command_streams_one_line_per_user(self):
+        out, err = StringIO(), StringIO()
+        call_command("due_digests", batch_size=2, max_tasks=2, stdout=out, stderr=err)
+
+        digests = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([digest["user"] for digest in digests], sorted([self.user.pk, self.other.pk]))
+        mine = next(digest for digest in digests if digest["user"] == self.user.pk)
+        self.assertEqual((mine["overdue"], mine["due_soon"]), (2, 2))
+        self.assertEqual([task["title"] for task in mine["tasks"]], ["late", "later"])
+        self.assertIn("Wrote 2 digest(s)", err.getvalue())
+
+
+class TaskBulkTests(TaskAPITestCase):
+    """Tests for POST /api/tasks/bulk/."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("bulk-tasks")
+        self.foreign_board = Board.objects.create(title="Foreign", owner=self.user)
+
+    def run_batch(self, size):
+        doomed = Task.objects.create(board=self.board, title="Doomed", due_date=date(2030, 1, 1))
+        updated = Task.objects.create(board=self.board, title="Updated", due_date=date(2030, 1, 1))
+        operations = [
+            {"action": "create", "data": {"board": self.board.pk, "title": f"New {n}", "due_date": "2030-02-01",
+                                          "assignee_id": self.user.pk}}
+            for n in range(size)
+        ] + [
+            {"action": "update", "id": updated.pk, "data": {"status": "done"}},
+            {"action": "delete", "id": doomed.pk},
+        ]
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(self.url, {"operations": operations}, format="json")
+        return response, len(captured.captured_queries), updated, doomed.pk
+
+    def test_mixed_operations_are_applied_in_one_request(self):
+        response, _, updated, doomed_id = self.run_batch(20)
+
+        self.assertEqual(response.status_code, 200)
+        statuses = [result["status"] for result in response.data["results"]]
+        self.assertEqual(statuses, [201] * 20 + [200, 204])
+        self.assertEqual(response.data["results"][0]["data"]["assignee"]["id"], self.user.pk)
+        self.assertEqual(Task.objects.filter(title__startswith="New").count(), 20)
+        updated.refresh_from_db()
+        self.assertEqual(updated.status, "done")
+        self.assertFalse(Task.objects.filter(pk=doomed_id).exists())
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        self.run_batch(1)  # warm the membership cache
+        _, small = self.run_batch(2)[:2]
+        _, large = self.run_batch(50)[:2]
+        self.assertEqual(small, large)
+
+    def test_invalid_item_rolls_back_everything(self):
+        operations = [
+            {"action": "create", "data": {"board": self.board.pk, "title": "Ok", "due_date": "2030-02-01"}},
+            {"action": "create", "data": {"board": self.foreign_board.pk, "title": "Denied", "due_date": "2030-02-01"}},
+            {"action": "update", "id": 999999, "data": {"title": "Missing"}},
+            {"action": "create", "data": {"board": self.board.pk}},
+        ]
+
+        response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        results = response.data["results"]
+        self.assertNotIn("errors", results[0])
+        self.assertEqual(results[1]["status"], 403)
+        self.assertEqual(results[2]["status"], 404)
+        self.assertEqual(results[3]["status"], 400)
+        self.assertFalse(Task.objects.filter(title="Ok").exists())
+
+    def test_board_cannot_be_changed(self):
+        self.foreign_board.members.add(self.user)
+        operations = [{"action": "update", "id": self.task.pk, "data": {"board": self.foreign_board.pk}}]
+
+        response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["results"][0]["status"], 403)
+
+
+class ConditionalGetTests(TaskAPITestCase):
+    """Tests for ETag / Last-Modified handling of board and task detail."""
+
+    def test_task_detail_answers_304_until_task_changes(self):
+        url = reverse("detail-task", kwargs={"pk": self.task.pk})
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.post(reverse("create-comments", kwargs={"task_id": self.task.pk}), {"content": "Changed"})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_board_detail_skips_serializer_when_not_modified(self):
+        url = reverse("board-detail", kwargs={"pk": self.board.pk})
+        etag = self.client.get(url)["ETag"]
+
+        # board row only, the token is cached
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.patch(reverse("detail-task", kwargs={"pk": self.task.pk}), {"status": "done"})
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_board_version_changes_with_members(self):
+        url = reverse("board-detail", kwargs={"pk": self.board.pk})
+        etag = self.client.get(url)["ETag"]
+
+        other = User.objects.create_user(username="new@example.com", email="new@example.com", password="secret123")
+        self.board.members.add(other)
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+    def test_versions_change_with_user_names_and_emails(self):
+        self.task.assignee = self.user
+        self.task.save()
+        board_url = reverse("board-detail", kwargs={"pk": self.board.pk})
+        task_url = reverse("detail-task", kwargs={"pk": self.task.pk})
+        board_etag, task_etag = self.client.get(board_url)["ETag"], self.client.get(task_url)["ETag"]
+
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=["last_login"])
+        self.user.save()
+        self.assertEqual(self.client.get(board_url, HTTP_IF_NONE_MATCH=board_etag).status_code, 304)
+
+        self.user.first_name = "Renamed"
+        self.user.save()
+
+        self.assertEqual(self.client.get(board_url, HTTP_IF_NONE_MATCH=board_etag).status_code, 200)
+        response = self.client.get(task_url, HTTP_IF_NONE_MATCH=task_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["assignee"]["fullname"], "Renamed")
+
+
+    def test_versions_and_changes_follow_deleted_users(self):
+        leaving = User.objects.create_user(username="leaving@example.com", email="leaving@example.com", password="x")
+        self.board.members.add(leaving)
+        self.task.reviewer = leaving
+        self.task.save()
+        board_url = reverse("board-detail", kwargs={"pk": self.board.pk})
+        task_url = reverse("detail-task", kwargs={"pk": self.task.pk})
+        board_etag, task_etag = self.client.get(board_url)["ETag"], self.client.get(task_url)["ETag"]
+        changes_url = reverse("board-changes", kwargs={"pk": self.board.pk})
+        cursor = self.client.get(changes_url).data["cursor"]
+        leaving_id = leaving.pk
+
+        leaving.delete()
+
+        board = self.client.get(board_url, HTTP_IF_NONE_MATCH=board_etag)
+        self.assertEqual(board.status_code, 200)
+        self.assertEqual([member["id"] for member in board.data["members"]], [self.user.pk])
+        task = self.client.get(task_url, HTTP_IF_NONE_MATCH=task_etag)
+        self.assertEqual(task.status_code, 200)
+        self.assertIsNone(task.data["reviewer"])
+        changes = self.client.get(changes_url, {"since": cursor}).data
+        self.assertEqual(changes["members"]["removed"], [leaving_id])
+        self.assertEqual([item["id"] for item in changes["tasks"]["updated"]], [self.task.pk])
+
+
+class AsyncReadViewTests(TaskAPITestCase):
+    """Tests for the async read endpoints under /api/async/."""
+
+    def setUp(self):
+        super().setUp()
+        self.task.assignee = self.user
+        self.task.save()
+        Task.objects.create(board=self.board, title="Later", due_date=date(2030, 2, 1), assignee=self.user)
+        Comment.objects.create(task=self.task, author=self.user, content="Hello")
+
+    async def get_async(self, name, **kwargs):
+        query = kwargs.pop("query", {})
+        headers = kwargs.pop("headers", {"Authorization": f"Token {self.token.key}"})
+        return await self.async_client.get(reverse(name, kwargs=kwargs), query, headers=headers)
+
+    async def get_sync(self, name, **kwargs):
+        response = await sync_to_async(self.client.get)(reverse(name, kwargs=kwargs))
+        return json.loads(response.content)
+
+    async def test_responses_match_the_sync_views(self):
+        pairs = [
+            ("assigned-tasks", "async-assigned-tasks", {}),
+            ("reviewed-tasks", "async-reviewed-tasks", {}),
+            ("create-comments", "async-comments", {"task_id": self.task.pk}),
+            ("board-detail", "async-board-detail", {"pk": self.board.pk}),
+        ]
+        for sync_name, async_name, kwargs in pairs:
+            with self.subTest(async_name):
+                response = await self.get_async(async_name, **kwargs)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(json.loads(response.content), await self.get_sync(sync_name, **kwargs))
+
+    async def test_keyset_pagination(self):
+        response = await self.get_async("async-assigned-tasks", query={"page_size": 1})
+
+        data = json.loads(response.content)
+        self.assertEqual([task["title"] for task in data["results"]], ["Task"])
+        self.assertIn("cursor=", data["next"])
+
+    async def test_board_detail_answers_not_modified(self):
+        first = await self.get_async("async-board-detail", pk=self.board.pk)
+
+        second = await self.get_async("async-board-detail", pk=self.board.pk, headers={
+            "Authorization": f"Token {self.token.key}", "If-None-Match": first["ETag"],
+        })
+
+        self.assertEqual(second.status_code, 304)
+
+    async def test_errors_match_drf(self):
+        anonymous = await self.get_async("async-assigned-tasks", headers={})
+        self.assertEqual(anonymous.status_code, 401)
+        self.assertEqual(anonymous["WWW-Authenticate"], "Token")
+
+        missing = await self.get_async("async-comments", task_id=self.task.pk + 100)
+        self.assertEqual(missing.status_code, 404)
+
+        stranger = await sync_to_async(User.objects.create_user)(username="stranger@example.com", password="x")
+        token = await sync_to_async(AuthToken.objects.issue)(stranger)
+        forbidden = await self.get_async("async-comments", task_id=self.task.pk,
+                                         headers={"Authorization": f"Token {token.key}"})
+        self.assertEqual(forbidden.status_code, 403)
+
+
+class TaskSearchTests(TaskAPITestCase):
+    """Tests for GET /api/tasks/search/ and the search index hooks."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("search-tasks")
+
+    def search(self, query, **params):
+        response = self.client.get(self.url, {"q": query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [item["id"] for item in response.data["results"]]
+
+    def test_title_matches_rank_above_comment_matches(self):
+        in_comment = Task.objects.create(board=self.board, title="Other", due_date=date(2030, 1, 1))
+        Comment.objects.create(author=self.user, task=in_comment, content="the invoice is late")
+        in_title = Task.objects.create(board=self.board, title="Invoice export", due_date=date(2030, 1, 1))
+
+        self.assertEqual(self.search("invo"), [in_title.pk, in_comment.pk])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.client.patch(reverse("detail-task", kwargs={"pk": self.task.pk}), {"description": "migrate the database"})
+        self.assertEqual(self.search("database"), [self.task.pk])
+
+        comment = Comment.objects.create(author=self.user, task=self.task, content="needs a rollback plan")
+        self.assertEqual(self.search("rollback database"), [self.task.pk])
+        comment.delete()
+        self.assertEqual(self.search("rollback"), [])
+
+        task_id = self.task.pk
+        self.task.delete()
+        self.assertNotIn(task_id, self.search("database"))
+
+    def test_comments_of_deleted_users_are_unindexed(self):
+        author = User.objects.create_user(username="author@example.com", password="secret123")
+        Comment.objects.create(author=author, task=self.task, content="zebracorn sighting")
+        self.assertEqual(self.search("zebracorn"), [self.task.pk])
+
+        author.delete()
+
+        self.assertEqual(self.search("zebracorn"), [])
+        self.assertEqual(self.search("task"), [self.task.pk])
+
+    def test_bulk_writes_are_indexed(self):
+        operations = [
+            {"action": "create", "data": {"board": self.board.pk, "title": "Quarterly report", "due_date": "2030-02-01"}},
+            {"action": "update", "id": self.task.pk, "data": {"title": "Quarterly planning"}},
+        ]
+        response = self.client.post(reverse("bulk-tasks"), {"operations": operations}, format="json")
+        created_id = response.data["results"][0]["id"]
+
+        self.assertCountEqual(self.search("quarterly"), [created_id, self.task.pk])
+
+    def test_only_accessible_boards_are_searched(self):
+        stranger = User.objects.create_user(username="stranger@example.com", password="secret123")
+        foreign = Board.objects.create(title="Foreign", owner=stranger)
+        Task.objects.create(board=foreign, title="Secret roadmap", due_date=date(2030, 1, 1))
+        mine = Task.objects.create(board=self.board, title="Public roadmap", due_date=date(2030, 1, 1))
+
+        self.assertEqual(self.search("roadmap"), [mine.pk])
+
+    def test_results_are_paged_and_syntax_is_ignored(self):
+        tasks = [Task.objects.create(board=self.board, title=f"Deploy {n}", due_date=date(2030, 1, 1)) for n in range(3)]
+
+        response = self.client.get(self.url, {"q": 'deploy" (*', "page_size": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+        second = self.client.get(response.data["next"])
+        self.assertIsNone(second.data["next"])
+        ids = [item["id"] for item in response.data["results"] + second.data["results"]]
+        self.assertCountEqual(ids, [task.pk for task in tasks])
+
+    def test_missing_query_is_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+
+    def test_rebuild_command_restores_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM tasks_app_task_fts")
+        out = StringIO()
+        call_command("rebuild_task_search", batch_size=1, stdout=out)
+
+        self.assertIn("Indexed 1 task(s)", out.getvalue())
+        self.assertEqual(self.search("task"), [self.task.pk])
+
+
+class IndexPlansBenchmarkTests(TaskAPITestCase):
+    """Smoke test of benchmarks.index_plans against the current schema."""
+
+    def test_compare_drops_and_restores_the_composite_indexes(self):
+        from benchmarks.index_plans import INDEXED_MODELS, build_queries, compare
+
+        self.task.assignee = self.user
+        self.task.save()
+        Comment.objects.create(author=self.user, task=self.task, content="Hi")
+        queries = build_queries(self.user.pk, self.board.pk, self.task.pk)
+
+        before, after = compare(queries, repeat=1)
+
+        self.assertEqual(set(before), set(queries))
+        self.assertNotIn("task_assignee_due_idx", before["tasks_assigned"]["plan"])
+        self.assertIn("task_assignee_due_idx", after["tasks_assigned"]["plan"])
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            existing = {row[0] for row in cursor.fetchall()}
+        self.assertLessEqual({index.name for model in INDEXED_MODELS for index in model._meta.indexes}, existing)
 
-# Create your tests here.
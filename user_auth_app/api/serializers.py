@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from user_auth_app.emails import find_user_by_email, normalize_email
 from user_auth_app.models import UserProfile
 
 
@@ -15,13 +19,17 @@ class RegistrationSerializer(serializers.ModelSerializer):
     - repeated_password: confirmation of the password (write-only)
 
     Validates:
-    - Email must be unique.
     - Password and repeated_password must match.
+    - Email must be unique, ignoring case. The email is stored normalized
+      (stripped, lower case) and uniqueness is enforced by the unique
+      indexes on auth_user (username and LOWER(email)) at insert time, not
+      by a prior query, so concurrent signups with the same email cannot
+      both succeed.
 
     On creation:
-    - Creates a new User instance with username set to email.
-    - Sets the password securely.
-    - Creates a related UserProfile instance.
+    - Inserts the User with username set to email and the password already
+      hashed (one write).
+    - Creates a related UserProfile instance in the same transaction.
     """
     fullname = serializers.CharField(write_only=True)
     password = serializers.CharField(write_only=True, min_length=8)
@@ -32,9 +40,10 @@ class RegistrationSerializer(serializers.ModelSerializer):
         fields = ["id", "fullname", "email", "password", "repeated_password"]
         read_only_fields = ["id"]
 
+    def validate_email(self, value):
+        return normalize_email(value)
+
     def validate(self, attrs):
-        if User.objects.filter(email=attrs['email']).exists():
-            raise serializers.ValidationError({"email": "A user with this email already exists"})
         if attrs['password'] != attrs['repeated_password']:
             raise serializers.ValidationError({"repeated_password": "Passwords do not match"})
         return attrs
@@ -44,15 +53,17 @@ class RegistrationSerializer(serializers.ModelSerializer):
         password = validated_data.pop('password')
         validated_data.pop('repeated_password')
 
-        user = User.objects.create(
-            username=validated_data['email'],
-            email=validated_data['email'],
-            first_name=fullname,
-        )
-        user.set_password(password)
-        user.save()
-
-        UserProfile.objects.create(user=user)
+        try:
+            with transaction.atomic():
+                user = User.objects.create(
+                    username=validated_data['email'],
+                    email=validated_data['email'],
+                    first_name=fullname,
+                    password=make_password(password),
+                )
+                UserProfile.objects.create(user=user)
+        except IntegrityError:
+            raise serializers.ValidationError({"email": "A user with this email already exists"})
 
         return user
 
@@ -66,7 +77,9 @@ class LoginSerializer(serializers.Serializer):
     - password: user's password (write-only)
 
     Validates:
-    - Checks if the provided email and password authenticate a user.
+    - Checks if the provided email and password authenticate a user. The
+      email is matched case-insensitively (usernames of accounts registered
+      before emails were normalized may differ in case).
     """
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
@@ -75,7 +88,8 @@ class LoginSerializer(serializers.Serializer):
         email = attrs.get("email")
         password = attrs.get("password")
 
-        user = authenticate(username=email, password=password)
+        account = find_user_by_email(email)
+        user = authenticate(username=account.username if account else email, password=password)
         if not user:
             raise serializers.ValidationError({"error": "Invalid email or password"})
 
@@ -91,7 +105,7 @@ class UserSerializer(serializers.ModelSerializer):
     Fields:
     - id: user ID
     - email: user email
-    - fullname: concatenation of first_name and last_name if user profile exists
+    - fullname: concatenation of first_name and last_name
     """
     fullname = serializers.SerializerMethodField()
 
@@ -100,6 +114,18 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ["id", "email", "fullname"]
 
     def get_fullname(self, obj):
-        if hasattr(obj, 'userprofile') and obj.userprofile:
-            return f"{obj.first_name} {obj.last_name}".strip()
         return f"{obj.first_name} {obj.last_name}".strip()
+
+
+class EmailBatchSerializer(serializers.Serializer):
+    """
+    Serializer for batch email checks.
+
+    Fields:
+    - emails: list of email addresses (at most EMAIL_CHECK_MAX_BATCH)
+    """
+    emails = serializers.ListField(
+        child=serializers.EmailField(),
+        allow_empty=False,
+        max_length=getattr(settings, "EMAIL_CHECK_MAX_BATCH", 100),
+    )
@@ -0,0 +1,24 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class PostRateThrottle(SimpleRateThrottle):
+    """
+    Per client IP rate limit applied to POST requests only. Runs before the
+    view, so throttled requests never reach password hashing.
+    """
+
+    def allow_request(self, request, view):
+        if request.method != "POST":
+            return True
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginRateThrottle(PostRateThrottle):
+    scope = "login"
+
+
+class RegistrationRateThrottle(PostRateThrottle):
+    scope = "registration"
@@ -1,8 +1,12 @@
 from django.urls import path
-from .views import SignupView, UserLoginView, MailCheckView
+from .views import SignupView, UserLoginView, MailCheckView, MailCheckBatchView, TokenRotateView, LogoutView
 
 urlpatterns = [
 path('registration/', SignupView.as_view(), name="signup"),
 path('login/', UserLoginView.as_view(), name='login'),
+path('logout/', LogoutView.as_view(), name='logout'),
+path('logout/all/', LogoutView.as_view(revoke_all=True), name='logout-all'),
+path('token/rotate/', TokenRotateView.as_view(), name='token-rotate'),
 path('email-check/', MailCheckView.as_view(), name='email-check'),
+path('email-check/batch/', MailCheckBatchView.as_view(), name='email-check-batch'),
 ]
\ No newline at end of file
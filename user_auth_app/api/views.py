@@ -1,10 +1,14 @@
 from django.contrib.auth.models import User
+from django.db import transaction
 from rest_framework import generics, permissions, status
-from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
-from .serializers import RegistrationSerializer, LoginSerializer, UserSerializer
+from rest_framework.views import APIView
+from user_auth_app.emails import find_user_by_email, find_users_by_email, normalize_email
+from user_auth_app.models import AuthToken
+from .serializers import RegistrationSerializer, LoginSerializer, UserSerializer, EmailBatchSerializer
+from .throttles import LoginRateThrottle, RegistrationRateThrottle
 
 
 
@@ -16,23 +20,27 @@ class SignupView(generics.ListCreateAPIView):
         Returns a list of all users (mainly for admin/testing purposes).
     POST:
         Registers a new user with the provided data.
-        Returns an authentication token along with basic user info.
+        Returns an expiring authentication token along with basic user info.
+        User, profile and token are created in one transaction. Rate
+        limited per client IP (throttle scope "registration").
 
     Uses:
     - RegistrationSerializer for validation and user creation.
     """
     queryset = User.objects.all()
     serializer_class = RegistrationSerializer
+    throttle_classes = [RegistrationRateThrottle]
 
     def create(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-
-        token, created = Token.objects.get_or_create(user=user)
+        with transaction.atomic():
+            user = serializer.save()
+            token = AuthToken.objects.issue(user)
 
         return Response({
             "token": token.key,
+            "expires_at": token.expires_at,
             "user_id": user.id,
             "email": user.email,
             "fullname": user.first_name,
@@ -45,23 +53,27 @@ class UserLoginView(ObtainAuthToken):
 
     POST:
         Validates user credentials.
-        Returns an authentication token along with basic user info.
+        Returns a new expiring authentication token along with basic user info.
+        Every login starts a new session; earlier tokens stay valid until
+        they expire or are revoked. Rate limited per client IP (throttle
+        scope "login") before any password is hashed.
 
     Uses:
     - LoginSerializer for validation.
-    - DRF's TokenAuthentication to generate or retrieve tokens.
     """
     serializer_class = LoginSerializer
+    throttle_classes = [LoginRateThrottle]
     
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data['user']
 
-        token, created = Token.objects.get_or_create(user=user)
+        token = AuthToken.objects.issue(user)
 
         return Response({
             "token": token.key,
+            "expires_at": token.expires_at,
             "user_id": user.id,
             "email": user.email,
             "fullname": user.first_name,
@@ -73,8 +85,9 @@ class MailCheckView(GenericAPIView):
     API endpoint to check if an email is registered.
 
     GET:
-        Accepts an 'email' query parameter.
+        Accepts an 'email' query parameter (case-insensitive).
         Returns user info if email exists, otherwise 404.
+        Answered with one indexed query; unknown emails are briefly cached.
 
     Permissions:
     - Requires the user to be authenticated.
@@ -82,17 +95,84 @@ class MailCheckView(GenericAPIView):
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_queryset(self):
-        email = self.request.query_params.get("email")
-        if not email:
-            return User.objects.none()
-        return User.objects.filter(email=email)
-
     def get(self, request):
-        queryset = self.get_queryset()
+        email = request.query_params.get("email")
+        user = find_user_by_email(email) if email else None
 
-        if not queryset.exists():
+        if user is None:
             return Response({"detail": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = self.get_serializer(queryset.first())
+        serializer = self.get_serializer(user)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class MailCheckBatchView(GenericAPIView):
+    """
+    API endpoint to check many emails at once.
+
+    POST:
+        Accepts {"emails": [...]} (at most EMAIL_CHECK_MAX_BATCH entries).
+        Returns {"results": [{"email": ..., "user": {...} or null}, ...]}
+        in request order, resolved with at most one query.
+
+    Permissions:
+    - Requires the user to be authenticated.
+    """
+    serializer_class = EmailBatchSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        emails = serializer.validated_data["emails"]
+
+        users = find_users_by_email(emails)
+        results = []
+        for email in emails:
+            user = users.get(normalize_email(email))
+            results.append({"email": email, "user": UserSerializer(user).data if user else None})
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class TokenRotateView(APIView):
+    """
+    API endpoint to rotate the token of the current session.
+
+    POST:
+        Issues a new token for the authenticated user and revokes the one
+        used for this request.
+
+    Permissions:
+    - Requires the user to be authenticated.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        try:
+            token = AuthToken.objects.rotate(request.auth.digest)
+        except AuthToken.DoesNotExist:
+            return Response({"detail": "Token already revoked."}, status=status.HTTP_401_UNAUTHORIZED)
+        return Response({"token": token.key, "expires_at": token.expires_at}, status=status.HTTP_200_OK)
+
+
+class LogoutView(APIView):
+    """
+    API endpoint to revoke tokens.
+
+    POST logout/:
+        Revokes the token used for this request.
+    POST logout/all/:
+        Revokes every token of the authenticated user (all sessions).
+
+    Permissions:
+    - Requires the user to be authenticated.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    revoke_all = False
+
+    def post(self, request):
+        if self.revoke_all:
+            AuthToken.objects.revoke(user=request.user)
+        else:
+            AuthToken.objects.revoke(digest=request.auth.digest)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,139 @@
+"""
+Token authentication backed by a two level cache.
+
+CachedTokenAuthentication authenticates the expiring AuthToken keys of
+user_auth_app.models. A database lookup joins AuthToken and User, so the
+class answers from
+
+- a bounded in-process LRU with a short lifetime (AUTH_TOKEN_CACHE_SIZE,
+  AUTH_TOKEN_CACHE_TIMEOUT), which costs no I/O at all;
+- optionally a shared Django cache (AUTH_TOKEN_SHARED_CACHE alias,
+  AUTH_TOKEN_SHARED_CACHE_TIMEOUT), so other worker processes warm up
+  without querying the database;
+
+and only falls back to the database on a miss. Entries are keyed by the
+token digest, never the token itself, and never outlive the token.
+
+Entries are dropped when tokens are revoked (AuthToken.objects.revoke) and
+when users are saved (e.g. deactivated), see user_auth_app.signals. The
+shared cache is cleared immediately. Other processes may keep their LRU
+entry until it expires, which bounds the staleness to
+AUTH_TOKEN_CACHE_TIMEOUT seconds.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from user_auth_app.models import AuthToken, hash_token_key
+
+
+class TokenCache:
+    """Two level cache mapping token digests to their (active) users."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    @staticmethod
+    def shared_cache():
+        alias = getattr(settings, "AUTH_TOKEN_SHARED_CACHE", None)
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def cache_key(digest):
+        return f"auth-token:{digest}"
+
+    def get(self, digest, shared=True):
+        """
+        Return a copy of the cached user of a token digest, or None.
+        `shared=False` only consults the in-process LRU (no I/O, safe on an
+        event loop).
+        """
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is not None:
+                if entry[0] > now:
+                    self.entries.move_to_end(digest)
+                    return copy.copy(entry[1])
+                del self.entries[digest]
+
+        cache = self.shared_cache() if shared else None
+        if cache is None:
+            return None
+        entry = cache.get(self.cache_key(digest))
+        if entry is not None and entry[0] > now:
+            user, expires_at = entry[1], entry[0]
+            self.set_local(digest, user, expires_at)
+            return copy.copy(user)
+        return None
+
+    def set(self, digest, user, expires_at, shared=True):
+        """Cache the user of a token; `expires_at` is the token's expiry timestamp."""
+        self.set_local(digest, user, expires_at)
+        cache = self.shared_cache() if shared else None
+        if cache is not None:
+            timeout = min(getattr(settings, "AUTH_TOKEN_SHARED_CACHE_TIMEOUT", 300), expires_at - time.time())
+            if timeout > 0:
+                cache.set(self.cache_key(digest), (expires_at, user), timeout)
+
+    def set_local(self, digest, user, expires_at):
+        expires = min(time.time() + getattr(settings, "AUTH_TOKEN_CACHE_TIMEOUT", 30), expires_at)
+        with self.lock:
+            self.entries[digest] = (expires, user)
+            self.entries.move_to_end(digest)
+            while len(self.entries) > getattr(settings, "AUTH_TOKEN_CACHE_SIZE", 10_000):
+                self.entries.popitem(last=False)
+
+    def invalidate(self, digests):
+        digests = list(digests)
+        with self.lock:
+            for digest in digests:
+                self.entries.pop(digest, None)
+        cache = self.shared_cache()
+        if cache is not None and digests:
+            cache.delete_many([self.cache_key(digest) for digest in digests])
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication for AuthToken keys, answering from token_cache.
+
+    `request.auth` is an AuthToken carrying the digest and the user; on a
+    cache hit it is not loaded from the database (no pk or expiry).
+    """
+
+    def authenticate_credentials(self, key):
+        digest = hash_token_key(key)
+        user = token_cache.get(digest)
+        if user is not None:
+            return user, AuthToken(digest=digest, user=user)
+
+        try:
+            token = AuthToken.objects.get_active(key)
+        except AuthToken.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Invalid or expired token.")
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+        token_cache.set(digest, token.user, token.expires_at.timestamp())
+        return token.user, token
+
+
+def get_user_for_token(key):
+    """Return the active user owning an unexpired token key (cached), or None."""
+    try:
+        return CachedTokenAuthentication().authenticate_credentials(key)[0]
+    except exceptions.AuthenticationFailed:
+        return None
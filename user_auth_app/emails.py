@@ -0,0 +1,77 @@
+"""
+Case-insensitive email lookups for the email check endpoints.
+
+Emails are compared in normalized form (stripped, lower case) against
+LOWER(auth_user.email), which is backed by the partial unique index
+user_email_unique_idx (migration 0005), so a lookup is a single index
+probe. The query repeats the index condition (email <> '') literally:
+SQLite only uses a partial index when the query implies its condition.
+
+Emails that do not belong to any user are remembered in the cache for
+EMAIL_CHECK_NEGATIVE_CACHE_TIMEOUT seconds, so invite dialogs typing an
+unknown address do not query the database on every keystroke. Saving a
+user drops the negative entry of their email (see user_auth_app.signals).
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import BooleanField, F, Func, Value
+from django.db.models.functions import Lower
+
+USER_FIELDS = ("id", "username", "email", "first_name", "last_name")
+
+# "email <> ''", the condition of user_email_unique_idx.
+HAS_EMAIL = Func(F("email"), Value(""), arg_joiner=" <> ", template="%(expressions)s", output_field=BooleanField())
+
+
+def normalize_email(email):
+    return email.strip().lower()
+
+
+def _miss_key(normalized):
+    return f"email-check:miss:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+
+def forget_missing(email):
+    """Drop the cached negative result of an email (e.g. after a signup)."""
+    if email:
+        cache.delete(_miss_key(normalize_email(email)))
+
+
+def find_users_by_email(emails):
+    """
+    Return a dict mapping the normalized form of each given email to its
+    user, omitting emails without a user. All uncached emails are resolved
+    with one query.
+    """
+    normalized = {normalize_email(email) for email in emails if email and email.strip()}
+    keys = {_miss_key(email): email for email in normalized}
+    known_missing = {keys[key] for key in cache.get_many(keys)}
+    pending = normalized - known_missing
+    if not pending:
+        return {}
+
+    found = {}
+    users = (
+        User.objects.alias(email_lower=Lower("email"))
+        .filter(HAS_EMAIL, email_lower__in=pending)
+        .only(*USER_FIELDS)
+        .order_by("pk")
+    )
+    for user in users:
+        found.setdefault(normalize_email(user.email), user)
+
+    missing = pending - found.keys()
+    if missing:
+        cache.set_many(
+            {_miss_key(email): True for email in missing},
+            getattr(settings, "EMAIL_CHECK_NEGATIVE_CACHE_TIMEOUT", 30),
+        )
+    return found
+
+
+def find_user_by_email(email):
+    """Return the user with the given email (case-insensitive) or None."""
+    return find_users_by_email([email]).get(normalize_email(email))
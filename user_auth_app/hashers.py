@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, must_update_salt
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 hasher whose work factor follows the active password
+    hasher profile (PASSWORD_HASHER_ITERATIONS, see core.settings).
+
+    It keeps the algorithm name of Django's PBKDF2 hasher, so existing hashes
+    stay valid. Hashes with fewer iterations than the profile are re-encoded
+    on the next successful login; stronger hashes are kept, so switching to
+    a lower profile never weakens stored passwords.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, "PASSWORD_HASHER_ITERATIONS", PBKDF2PasswordHasher.iterations)
+
+    def must_update(self, encoded):
+        decoded = self.decode(encoded)
+        return decoded["iterations"] < self.iterations or must_update_salt(decoded["salt"], self.salt_entropy)
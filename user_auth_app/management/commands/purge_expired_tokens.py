@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from user_auth_app.models import AuthToken
+
+
+class Command(BaseCommand):
+    """
+    Delete expired authentication tokens in small batches.
+
+    Every batch selects ids through the expires_at index and deletes them in
+    its own short transaction, so concurrent logins and token lookups are
+    never blocked for long. An optional pause between batches spreads the
+    load further. Meant to run periodically (e.g. from cron).
+    """
+    help = "Delete expired authentication tokens."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per statement.")
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now()
+        expired = AuthToken.objects.filter(expires_at__lte=cutoff).order_by("expires_at")
+        deleted = 0
+        while True:
+            ids = list(expired.values_list("id", flat=True)[:options["batch_size"]])
+            if not ids:
+                break
+            deleted += AuthToken.objects.filter(id__in=ids).delete()[0]
+            if options["pause"]:
+                time.sleep(options["pause"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired token(s)."))
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:25
+
+import hashlib
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def copy_legacy_tokens(apps, schema_editor):
+    """Keep existing DRF tokens working: store their digests as expiring tokens."""
+    Token = apps.get_model('authtoken', 'Token')
+    AuthToken = apps.get_model('user_auth_app', 'AuthToken')
+    expires_at = timezone.now() + timedelta(seconds=getattr(settings, 'AUTH_TOKEN_LIFETIME', 7 * 24 * 3600))
+    AuthToken.objects.bulk_create(
+        (
+            AuthToken(digest=hashlib.sha256(token.key.encode()).hexdigest(), user_id=token.user_id,
+                      expires_at=expires_at)
+            for token in Token.objects.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_auth_app', '0001_initial'),
+        ('authtoken', '0004_alter_tokenproxy_options'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='auth_tokens', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RunPython(copy_legacy_tokens, migrations.RunPython.noop),
+    ]
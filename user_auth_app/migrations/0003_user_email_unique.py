@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Enforce unique emails on auth_user, so concurrent registrations are
+    resolved by the database instead of a check-then-insert query. Users
+    without an email (e.g. created with createsuperuser) are exempt.
+    """
+
+    dependencies = [
+        ('user_auth_app', '0002_auth_tokens'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX user_email_unique_idx ON auth_user (email) WHERE email <> ''",
+            "DROP INDEX user_email_unique_idx",
+        ),
+    ]
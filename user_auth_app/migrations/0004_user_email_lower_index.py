@@ -0,0 +1,16 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Expression index serving the case-insensitive email lookups of user_auth_app.emails."""
+
+    dependencies = [
+        ('user_auth_app', '0003_user_email_unique'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX user_email_lower_idx ON auth_user (LOWER(email))",
+            "DROP INDEX user_email_lower_idx",
+        ),
+    ]
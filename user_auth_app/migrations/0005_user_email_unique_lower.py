@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Make email uniqueness case-insensitive: the unique index moves from
+    email to LOWER(email), so Dev@x.com and dev@x.com cannot both register.
+    The same index serves the lookups of user_auth_app.emails, which
+    replaces the separate user_email_lower_idx. Fails if existing users
+    already share an email in different case; merge them first.
+    """
+
+    dependencies = [
+        ('user_auth_app', '0004_user_email_lower_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "DROP INDEX user_email_unique_idx",
+            "CREATE UNIQUE INDEX user_email_unique_idx ON auth_user (email) WHERE email <> ''",
+        ),
+        migrations.RunSQL(
+            "DROP INDEX user_email_lower_idx",
+            "CREATE INDEX user_email_lower_idx ON auth_user (LOWER(email))",
+        ),
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX user_email_unique_idx ON auth_user (LOWER(email)) WHERE email <> ''",
+            "DROP INDEX user_email_unique_idx",
+        ),
+    ]
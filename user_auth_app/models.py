@@ -1,5 +1,11 @@
-from django.db import models
+import hashlib
+import secrets
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class UserProfile(models.Model):
@@ -18,4 +24,75 @@ class UserProfile(models.Model):
     location = models.CharField(max_length=100, blank=True, null=True)
 
     def __str__(self):
-        return self.user.username
\ No newline at end of file
+        return self.user.username
+
+
+def hash_token_key(key):
+    """Return the SHA-256 hex digest under which a token key is stored."""
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_token_lifetime():
+    """Return the lifetime of newly issued tokens."""
+    return timedelta(seconds=getattr(settings, "AUTH_TOKEN_LIFETIME", 7 * 24 * 3600))
+
+
+class AuthTokenManager(models.Manager):
+    def issue(self, user):
+        """
+        Create a token for `user` and return it. The plain key is only
+        available on the returned instance (`token.key`), it is never stored.
+        """
+        key = secrets.token_hex(20)
+        token = self.create(user=user, digest=hash_token_key(key), expires_at=timezone.now() + get_token_lifetime())
+        token.key = key
+        return token
+
+    def get_active(self, key):
+        """Return the unexpired token of a key with its user, or raise DoesNotExist."""
+        return self.select_related("user").get(digest=hash_token_key(key), expires_at__gt=timezone.now())
+
+    def revoke(self, **filters):
+        """
+        Delete the tokens matching `filters` (e.g. user=...) and drop them from
+        the authentication cache. Returns the number of revoked tokens.
+        """
+        from user_auth_app.authentication import token_cache
+
+        with transaction.atomic():
+            digests = list(self.filter(**filters).values_list("digest", flat=True))
+            deleted = self.filter(digest__in=digests).delete()[0]
+        token_cache.invalidate(digests)
+        return deleted
+
+    def rotate(self, digest):
+        """Replace the token with the given digest by a new one for the same user."""
+        with transaction.atomic():
+            token = self.select_for_update().select_related("user").get(digest=digest)
+            replacement = self.issue(token.user)
+            self.revoke(pk=token.pk)
+        return replacement
+
+
+class AuthToken(models.Model):
+    """
+    Expiring API token.
+
+    Fields:
+    - digest: SHA-256 digest of the token key (unique index used by lookups).
+    - user: Owner of the token (indexed, so revoking all sessions of a user
+      does not scan the table).
+    - created_at: Time the token was issued.
+    - expires_at: Time after which the token is rejected (indexed for purging).
+
+    Use AuthToken.objects.issue(user) to create tokens.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="auth_tokens")
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    objects = AuthTokenManager()
+
+    def __str__(self):
+        return f"{self.user_id}: {self.digest[:8]}"
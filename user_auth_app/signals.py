@@ -0,0 +1,27 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from user_auth_app.authentication import token_cache
+from user_auth_app.emails import forget_missing
+from user_auth_app.models import AuthToken
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_caches(sender, instance, created, **kwargs):
+    """
+    Cached users would be stale (e.g. still active) after an update, and a
+    cached "unknown email" result would hide a new or renamed user.
+    """
+    forget_missing(instance.email)
+    if not created:
+        token_cache.invalidate(AuthToken.objects.filter(user_id=instance.pk).values_list("digest", flat=True))
+
+
+@receiver(post_delete, sender=AuthToken)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """
+    Tokens deleted other than through AuthToken.objects.revoke() (by the
+    cascade of a user delete, the admin or a queryset delete) must not keep
+    authenticating from the cache.
+    """
+    token_cache.invalidate([instance.digest])
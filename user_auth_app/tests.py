@@ -1,3 +1,251 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from user_auth_app.api.throttles import LoginRateThrottle
+from user_auth_app.authentication import token_cache
+from user_auth_app.emails import HAS_EMAIL
+from user_auth_app.models import AuthToken, hash_token_key
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """Tests for CachedTokenAuthentication and its invalidation."""
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(username="user@example.com", email="user@example.com", password="secret123")
+        self.token = AuthToken.objects.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.url = reverse("board-list-create")
+
+    def test_cached_token_skips_auth_query(self):
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_revoked_token_is_rejected(self):
+        self.client.get(self.url)
+
+        AuthToken.objects.revoke(pk=self.token.pk)
+
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    @override_settings(AUTH_TOKEN_SHARED_CACHE="default")
+    def test_tokens_deleted_with_their_user_are_rejected(self):
+        self.client.get(self.url)
+
+        self.user.delete()
+
+        self.assertIsNone(cache.get(token_cache.cache_key(self.token.digest)))
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+        self.assertEqual(self.client.post(self.url, {"title": "Orphan"}).status_code, 401)
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get(self.url)
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    @override_settings(AUTH_TOKEN_SHARED_CACHE="default")
+    def test_shared_cache_serves_other_processes(self):
+        self.client.get(self.url)
+        token_cache.clear()  # as if the request came to another worker
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        AuthToken.objects.revoke(user=self.user)
+        self.assertIsNone(cache.get(token_cache.cache_key(self.token.digest)))
+
+
+class AuthTokenLifecycleTests(APITestCase):
+    """Tests for expiring, rotatable and revocable tokens."""
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(username="user@example.com", email="user@example.com", password="secret123")
+
+    def login(self):
+        response = self.client.post(reverse("login"), {"email": "user@example.com", "password": "secret123"})
+        self.assertEqual(response.status_code, 200)
+        return response.data["token"]
+
+    def authorize(self, key):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {key}")
+
+    def test_only_the_digest_is_stored(self):
+        key = self.login()
+
+        token = AuthToken.objects.get(user=self.user)
+        self.assertEqual(token.digest, hash_token_key(key))
+        self.assertFalse(AuthToken.objects.filter(digest=key).exists())
+
+    def test_expired_token_is_rejected(self):
+        self.authorize(self.login())
+        AuthToken.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        token_cache.clear()
+
+        response = self.client.get(reverse("board-list-create"))
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_rotation_replaces_the_current_token(self):
+        old = self.login()
+        self.authorize(old)
+        self.client.get(reverse("board-list-create"))
+
+        response = self.client.post(reverse("token-rotate"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(reverse("board-list-create")).status_code, 401)
+        self.authorize(response.data["token"])
+        self.assertEqual(self.client.get(reverse("board-list-create")).status_code, 200)
+
+    def test_logout_all_revokes_every_session(self):
+        first, second = self.login(), self.login()
+        self.authorize(first)
+
+        self.assertEqual(self.client.post(reverse("logout-all")).status_code, 204)
+
+        self.assertFalse(AuthToken.objects.filter(user=self.user).exists())
+        self.authorize(second)
+        self.assertEqual(self.client.get(reverse("board-list-create")).status_code, 401)
+
+    def test_purge_deletes_only_expired_tokens(self):
+        keep = AuthToken.objects.issue(self.user)
+        for _ in range(3):
+            AuthToken.objects.issue(self.user)
+        AuthToken.objects.exclude(pk=keep.pk).update(expires_at=timezone.now() - timedelta(days=1))
+
+        out = StringIO()
+        call_command("purge_expired_tokens", batch_size=2, stdout=out)
+
+        self.assertEqual(list(AuthToken.objects.values_list("pk", flat=True)), [keep.pk])
+        self.assertIn("Deleted 3 expired token(s)", out.getvalue())
+
+
+class RegistrationAndLoginTests(APITestCase):
+    """Tests for registration, the password hasher profile and the login throttle."""
+
+    def setUp(self):
+        cache.clear()
+        self.payload = {"fullname": "New User", "email": "new@example.com",
+                        "password": "secret123", "repeated_password": "secret123"}
+
+    def test_duplicate_email_is_rejected_by_the_database(self):
+        self.assertEqual(self.client.post(reverse("signup"), self.payload).status_code, 201)
+
+        response = self.client.post(reverse("signup"), self.payload)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email", response.data)
+        self.assertEqual(User.objects.filter(email="new@example.com").count(), 1)
+
+    def test_emails_are_unique_ignoring_case(self):
+        self.client.post(reverse("signup"), {**self.payload, "email": "Mixed@Example.com"})
+
+        response = self.client.post(reverse("signup"), {**self.payload, "email": "mixed@example.COM"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(User.objects.values_list("username", "email")),
+                         [("mixed@example.com", "mixed@example.com")])
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user(username="other", email="MIXED@example.com")
+        login = self.client.post(reverse("login"), {"email": "MIXED@example.com", "password": "secret123"})
+        self.assertEqual(login.status_code, 200)
+
+    def test_signup_creates_user_profile_and_token(self):
+        response = self.client.post(reverse("signup"), self.payload)
+
+        user = User.objects.get(pk=response.data["user_id"])
+        self.assertTrue(user.check_password("secret123"))
+        self.assertTrue(hasattr(user, "userprofile"))
+        self.assertEqual(AuthToken.objects.filter(user=user).count(), 1)
+
+    @override_settings(PASSWORD_HASHER_ITERATIONS=1000)
+    def test_hasher_profile_sets_the_work_factor(self):
+        self.client.post(reverse("signup"), self.payload)
+
+        algorithm, iterations = User.objects.get(email="new@example.com").password.split("$")[:2]
+        self.assertEqual((algorithm, iterations), ("pbkdf2_sha256", "1000"))
+
+    def test_lower_profiles_keep_stronger_hashes(self):
+        with override_settings(PASSWORD_HASHER_ITERATIONS=2000):
+            user = User.objects.create_user(username="new@example.com", email="new@example.com", password="secret123")
+        credentials = {"email": "new@example.com", "password": "secret123"}
+
+        with override_settings(PASSWORD_HASHER_ITERATIONS=1000):
+            self.assertEqual(self.client.post(reverse("login"), credentials).status_code, 200)
+        user.refresh_from_db()
+        self.assertEqual(user.password.split("$")[1], "2000")
+
+        with override_settings(PASSWORD_HASHER_ITERATIONS=3000):
+            self.assertEqual(self.client.post(reverse("login"), credentials).status_code, 200)
+        user.refresh_from_db()
+        self.assertEqual(user.password.split("$")[1], "3000")
+
+    def test_login_is_throttled_per_client(self):
+        User.objects.create_user(username="new@example.com", email="new@example.com", password="secret123")
+        credentials = {"email": "new@example.com", "password": "secret123"}
+
+        with mock.patch.object(LoginRateThrottle, "rate", "2/minute", create=True):
+            statuses = [self.client.post(reverse("login"), credentials).status_code for _ in range(3)]
+
+        self.assertEqual(statuses, [200, 200, 429])
+
+
+class EmailCheckTests(APITestCase):
+    """Tests for the case-insensitive, cached email check endpoints."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="Known@Example.com", email="Known@Example.com",
+                                             first_name="Known", password="secret123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {AuthToken.objects.issue(self.user).key}")
+        self.url = reverse("email-check")
+
+    def test_lookup_is_case_insensitive_and_single_query(self):
+        self.client.get(self.url, {"email": "warm-up@example.com"})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"email": " known@EXAMPLE.com"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["id"], self.user.pk)
+
+    def test_lookup_uses_the_expression_index(self):
+        lookup = User.objects.alias(email_lower=Lower("email")).filter(HAS_EMAIL, email_lower="known@example.com")
+
+        self.assertIn("user_email_unique_idx", lookup.explain())
+
+    def test_unknown_email_is_cached_until_a_user_appears(self):
+        self.client.get(self.url, {"email": "new@example.com"})
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url, {"email": "new@example.com"}).status_code, 404)
+
+        User.objects.create_user(username="new@example.com", email="New@example.com", password="secret123")
+
+        self.assertEqual(self.client.get(self.url, {"email": "new@example.com"}).status_code, 200)
+
+    def test_batch_lookup_preserves_request_order(self):
+        emails = ["missing@example.com", "KNOWN@example.com"]
+
+        response = self.client.post(reverse("email-check-batch"), {"emails": emails}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["email"] for result in response.data["results"]], emails)
+        self.assertIsNone(response.data["results"][0]["user"])
+        self.assertEqual(response.data["results"][1]["user"]["id"], self.user.pk)